@@ -5,17 +5,21 @@ from pathlib import Path
 from typing import List
 
 from src.core.orchestrator import WorkflowOrchestrator
+from src.core.publish import PublishStage
 from src.providers.llm import GeminiProvider
 from src.providers.news import GeminiNewsProvider, PerplexityNewsProvider
 from src.providers.tts import VOICEVOXProvider
 from src.providers.twitter import TwitterClient
+from src.services.image_cache import build_image_cache, with_cache
 from src.services.image_generation import ZImageTurboService
+from src.services.image_worker import connect_image_worker
 from src.steps.audio import AudioSynthesizer
 from src.steps.buzzsprout import BuzzsproutUploader
 from src.steps.intro_outro import IntroOutroConcatenator
 from src.steps.metadata import MetadataAnalyzer
 from src.steps.news import NewsCollector
 from src.steps.podcast import PodcastExporter
+from src.steps.podcast_audio import PodcastAudioEncoder
 from src.steps.script import ScriptGenerator
 from src.steps.social.hatena import HatenaConfig, HatenaStep
 from src.steps.social.linkedin import LinkedInConfig, LinkedInStep
@@ -31,7 +35,12 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-def run(*, news_query: str | None = None, force_dry_run: bool = False) -> int:
+def run(
+    *,
+    news_query: str | None = None,
+    force_dry_run: bool = False,
+    render_profile: str | None = None,
+) -> int:
     logger.info("Starting YouTube AI Video Generator v2")
     config = Config.load()
     if news_query:
@@ -44,15 +53,19 @@ def run(*, news_query: str | None = None, force_dry_run: bool = False) -> int:
         config.steps.linkedin.dry_run = True
         config.steps.hatena.dry_run = True
         config.steps.buzzsprout.publish_immediately = False
+    config.steps.video.apply_profile(
+        render_profile or ("draft" if force_dry_run else config.steps.video.profile)
+    )
 
     run_id = _create_run_id()
     run_dir = Path(config.workflow.default_run_dir)
     logger.info(
-        "Initializing workflow run_id=%s youtube_enabled=%s dry_run=%s visibility=%s",
+        "Initializing workflow run_id=%s youtube_enabled=%s dry_run=%s visibility=%s render_profile=%s",
         run_id,
         config.steps.youtube.enabled,
         config.steps.youtube.dry_run,
         config.steps.youtube.default_visibility,
+        config.steps.video.profile,
     )
 
     steps = _build_steps(config, run_id, run_dir)
@@ -91,18 +104,48 @@ def run(*, news_query: str | None = None, force_dry_run: bool = False) -> int:
     return 1
 
 
-def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
+def build_news_collector(config: Config, run_id: str, run_dir: Path) -> NewsCollector:
     news_cfg = config.steps.news
+    return NewsCollector(
+        run_id=run_id,
+        run_dir=run_dir,
+        providers=_build_news_providers(
+            config.providers.news, Config.get_default_gemini_model()
+        ),
+        query_buckets=news_cfg.query_buckets,
+        bucket_schedule=news_cfg.bucket_schedule,
+        fetch_count=news_cfg.fetch_count,
+        final_count=news_cfg.final_count,
+        cooldown_hours=news_cfg.cooldown_hours,
+        recent_topics_runs=news_cfg.recent_topics_runs,
+        recent_topics_max_chars=news_cfg.recent_topics_max_chars,
+        fan_out=news_cfg.fan_out,
+        provider_timeout_seconds=news_cfg.provider_timeout_seconds,
+        provider_timeouts=news_cfg.provider_timeouts,
+        near_duplicate_threshold=news_cfg.near_duplicate_threshold,
+        near_duplicate_shingle_size=news_cfg.near_duplicate_shingle_size,
+        selection_mode=news_cfg.selection_mode,
+        mmr_diversity=news_cfg.mmr_diversity,
+        prefetch_max_age_minutes=news_cfg.prefetch_max_age_minutes,
+    )
+
+
+def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
     script_cfg = config.steps.script
     voicevox_cfg = config.providers.tts.voicevox
     video_cfg = config.steps.video
     audio_cfg = config.steps.audio
     metadata_cfg = config.steps.metadata.model_dump()
+    metadata_cfg["render_profile"] = video_cfg.profile
     voicevox_config = voicevox_cfg.model_dump()
     voicevox_config["speakers"] = dict(voicevox_config.get("speakers", {}))
     voicevox_config.pop("enabled", None)
     video_config = video_cfg.model_dump()
     video_config["effects"] = [effect.model_dump() for effect in video_cfg.effects]
+    # The concatenated intro/outro cut is the deliverable then, so the render cannot stream to YouTube.
+    video_config["streaming_upload"] = video_cfg.streaming_upload and not (
+        video_cfg.intro_outro and video_cfg.intro_outro.enabled
+    )
     encoder_options = {
         str(key): str(value)
         for key, value in video_cfg.encoder_options.items()
@@ -120,25 +163,13 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
     video_height = int(resolution_values[1])
 
     steps: List = [
-        NewsCollector(
-            run_id=run_id,
-            run_dir=run_dir,
-            providers=_build_news_providers(
-                config.providers.news, Config.get_default_gemini_model()
-            ),
-            query_buckets=news_cfg.query_buckets,
-            bucket_schedule=news_cfg.bucket_schedule,
-            fetch_count=news_cfg.fetch_count,
-            final_count=news_cfg.final_count,
-            cooldown_hours=news_cfg.cooldown_hours,
-            recent_topics_runs=news_cfg.recent_topics_runs,
-            recent_topics_max_chars=news_cfg.recent_topics_max_chars,
-        ),
+        build_news_collector(config, run_id, run_dir),
         ScriptGenerator(
             run_id=run_id,
             run_dir=run_dir,
             llm_provider=GeminiProvider(model=Config.get_default_gemini_model()),
             speakers_config=script_cfg.speakers,
+            structured_output=script_cfg.structured_output,
         ),
         AudioSynthesizer(
             run_id=run_id,
@@ -165,7 +196,7 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
             bgm_config=None,
             voice_parameters=config.providers.tts.voicevox.voice_parameters,
         ),
-        SubtitleFormatter(run_id=run_id, run_dir=run_dir),
+        SubtitleFormatter(run_id=run_id, run_dir=run_dir, video_config=video_cfg),
     ]
 
     if metadata_cfg.get("enabled", False):
@@ -186,6 +217,8 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
             )
         )
 
+    image_cache = build_image_cache(config.providers.image_cache)
+
     if config.steps.thumbnail_ai.enabled:
         from src.steps.thumbnail_ai import AIThumbnailGenerator
 
@@ -194,6 +227,8 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
                 run_id=run_id,
                 run_dir=run_dir,
                 ai_thumbnail_config=config.steps.thumbnail_ai.model_dump(),
+                image_service=with_cache(connect_image_worker(config.providers.image_worker), image_cache),
+                image_cache=image_cache,
             )
         )
 
@@ -204,9 +239,13 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
             SceneGenerator(
                 run_id=run_id,
                 run_dir=run_dir,
-                image_service=ZImageTurboService(
-                    model_path=config.steps.scene_generator.model_path,
-                    device=config.steps.scene_generator.device,
+                image_service=with_cache(
+                    connect_image_worker(config.providers.image_worker)
+                    or ZImageTurboService(
+                        model_path=config.steps.scene_generator.model_path,
+                        device=config.steps.scene_generator.device,
+                    ),
+                    image_cache,
                 ),
                 scene_config=config.steps.scene_generator.model_dump(),
             )
@@ -242,18 +281,22 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
             )
         )
 
+    publishers: List = []
     if config.steps.youtube.enabled and metadata_cfg.get("enabled", False):
-        steps.append(
+        publishers.append(
             YouTubeUploader(
                 run_id=run_id,
                 run_dir=run_dir,
-                youtube_config=config.steps.youtube.model_dump(),
+                youtube_config={
+                    **config.steps.youtube.model_dump(),
+                    "render_profile": video_cfg.profile,
+                },
             )
         )
         if config.steps.twitter.enabled:
             twitter_cfg = config.steps.twitter
             client = TwitterClient.from_env(dry_run=twitter_cfg.dry_run)
-            steps.append(
+            publishers.append(
                 TwitterPoster(
                     run_id=run_id,
                     run_dir=run_dir,
@@ -274,7 +317,7 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
             )
 
     if config.steps.linkedin.enabled:
-        steps.append(
+        publishers.append(
             LinkedInStep(
                 run_id=run_id,
                 run_dir=run_dir,
@@ -285,7 +328,7 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
         )
 
     if config.steps.hatena.enabled:
-        steps.append(
+        publishers.append(
             HatenaStep(
                 run_id=run_id,
                 run_dir=run_dir,
@@ -295,8 +338,17 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
             )
         )
 
+    if config.steps.podcast.enabled or config.steps.buzzsprout.enabled:
+        publishers.append(
+            PodcastAudioEncoder(
+                run_id=run_id,
+                run_dir=run_dir,
+                audio_config=config.steps.podcast_audio.model_dump(),
+            )
+        )
+
     if config.steps.podcast.enabled:
-        steps.append(
+        publishers.append(
             PodcastExporter(
                 run_id=run_id,
                 run_dir=run_dir,
@@ -305,7 +357,7 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
         )
 
     if config.steps.buzzsprout.enabled:
-        steps.append(
+        publishers.append(
             BuzzsproutUploader(
                 run_id=run_id,
                 run_dir=run_dir,
@@ -313,6 +365,12 @@ def _build_steps(config: Config, run_id: str, run_dir: Path) -> List:
             )
         )
 
+    publish_cfg = config.steps.publish
+    if publish_cfg.concurrent and len(publishers) > 1:
+        steps.append(PublishStage(publishers, **publish_cfg.model_dump(exclude={"concurrent"})))
+    else:
+        steps.extend(publishers)
+
     return steps
 
 
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import tempfile
+import time
+from pathlib import Path
+
+import ffmpeg
+
+from src.core.media_utils import find_ffmpeg_binary
+from src.services.encoder_profiles import EncoderProfile, EncoderProfileStore, parse_quality
+from src.steps.video import VideoRenderer
+from src.utils.config import Config, VideoStepConfig
+
+CUE_TEXT = ("日銀は政策金利を0.5%に引き上げました", "市場は円高で反応しています", "次の焦点は春闘の賃上げ率です")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark encoder settings on a synthetic timeline")
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--codecs", default="libx264,libx265")
+    parser.add_argument("--presets", default="ultrafast,veryfast,faster,medium")
+    parser.add_argument("--crfs", default="20,23,26,29")
+    parser.add_argument("--threads", default="0", help="Comma-separated thread counts; 0 lets the encoder decide")
+    parser.add_argument("--store", type=Path, help="Profile store (defaults to steps.video.encoder_tuning.store)")
+    return parser.parse_args()
+
+
+def _csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _srt_time(seconds: int) -> str:
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},000"
+
+
+def render_reference(config: Config, work_dir: Path, seconds: float) -> Path:
+    """Render our overlays, subtitles and effects once, losslessly, as the source for every encode."""
+    audio = work_dir / "audio.wav"
+    ffmpeg.run(
+        ffmpeg.input(f"sine=frequency=220:duration={seconds}", f="lavfi").output(str(audio)).overwrite_output(),
+        cmd=find_ffmpeg_binary(),
+        capture_stdout=True,
+        capture_stderr=True,
+    )
+    subtitles = work_dir / "subtitles.srt"
+    cues = []
+    for index, start in enumerate(range(0, int(seconds), 3)):
+        end = min(start + 3, int(seconds))
+        cues.append(f"{index + 1}\n{_srt_time(start)} --> {_srt_time(end)}\n{CUE_TEXT[index % len(CUE_TEXT)]}\n")
+    subtitles.write_text("\n".join(cues), encoding="utf-8")
+    video_config = config.steps.video.model_dump()
+    video_config.update(
+        {
+            "codec": None,
+            "preset": None,
+            "crf": None,
+            "encoder_options": {**VideoRenderer.LAYER_CACHE_OPTIONS, "acodec": "aac"},
+            "encoder_tuning": {"enabled": False},
+            # Target-bitrate caps would turn the qp=0 reference into a lossy one.
+            "rate_control": {"mode": "crf"},
+            "layer_cache": {"enabled": False},
+            "outputs": [],
+            # A streamed render returns the still-growing part file; measure() needs the finished one.
+            "streaming_upload": False,
+            "subtitle_mode": "burn",
+        }
+    )
+    renderer = VideoRenderer(run_id="reference", run_dir=work_dir, video_config=video_config)
+    return renderer.execute({"synthesize_audio": audio, "prepare_subtitles": subtitles})
+
+
+def measure(
+    reference: Path,
+    work_dir: Path,
+    video: VideoStepConfig,
+    seconds: float,
+    codec: str,
+    preset: str,
+    crf: int,
+    threads: int,
+) -> EncoderProfile:
+    """Encode the reference with one grid point and score it against the lossless source."""
+    encoded = work_dir / f"{codec}_{preset}_{crf}_{threads}.mp4"
+    options = {"vcodec": codec, "preset": preset, "crf": str(crf)}
+    if threads:
+        options["threads"] = str(threads)
+    source = ffmpeg.input(str(reference))
+    start = time.perf_counter()
+    ffmpeg.run(
+        ffmpeg.output(source.video, str(encoded), an=None, pix_fmt="yuv420p", **options).overwrite_output(),
+        cmd=find_ffmpeg_binary(),
+        capture_stdout=True,
+        capture_stderr=True,
+    )
+    elapsed = time.perf_counter() - start
+    distorted = ffmpeg.input(str(encoded)).video.filter_multi_output("split")
+    original = ffmpeg.input(str(reference)).video.filter_multi_output("split")
+    ssim = ffmpeg.filter([distorted[0], original[0]], "ssim")
+    psnr = ffmpeg.filter([distorted[1], original[1]], "psnr")
+    _, log = ffmpeg.run(
+        ffmpeg.merge_outputs(ffmpeg.output(ssim, "-", f="null"), ffmpeg.output(psnr, "-", f="null")),
+        cmd=find_ffmpeg_binary(),
+        capture_stdout=True,
+        capture_stderr=True,
+    )
+    ssim_value, psnr_value = parse_quality(log.decode("utf-8", errors="replace"))
+    return EncoderProfile(
+        codec=codec,
+        preset=preset,
+        crf=crf,
+        threads=threads,
+        resolution=video.resolution,
+        encode_fps=seconds * video.fps / elapsed,
+        kbps=encoded.stat().st_size * 8 / seconds / 1000,
+        ssim=ssim_value,
+        psnr=psnr_value if psnr_value != float("inf") else 99.0,
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    config = Config.load()
+    tuning = config.steps.video.encoder_tuning
+    store = EncoderProfileStore(args.store or Path(tuning.store))
+    resolution = config.steps.video.resolution
+    grid = itertools.product(
+        _csv(args.codecs), _csv(args.presets), map(int, _csv(args.crfs)), map(int, _csv(args.threads))
+    )
+    profiles = []
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        reference = render_reference(config, work_dir, args.seconds)
+        print(f"{'codec':>8} {'preset':>10} {'crf':>4} {'thr':>4} {'fps':>8} {'kbps':>8} {'ssim':>7} {'psnr':>6}")
+        for codec, preset, crf, threads in grid:
+            profile = measure(reference, work_dir, config.steps.video, args.seconds, codec, preset, crf, threads)
+            profiles.append(profile)
+            print(
+                f"{codec:>8} {preset:>10} {crf:>4} {threads:>4} {profile.encode_fps:>8.1f} "
+                f"{profile.kbps:>8.0f} {profile.ssim:>7.4f} {profile.psnr:>6.2f}"
+            )
+    store.record(profiles)
+    chosen = store.select(resolution, min_ssim=tuning.min_ssim, max_kbps=tuning.max_kbps, codecs=tuning.codecs)
+    print(f"Stored {len(profiles)} profiles in {store.path}")
+    print(f"Selected: {chosen.encoder_options() if chosen else 'none meets the targets'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import ffmpeg
+
+from src.core.media_utils import find_ffmpeg_binary
+from src.providers.video_effects import KenBurnsEffect, VideoEffectContext
+
+INTERNAL_SCALES = (1.0, 0.75, 0.5)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare Ken Burns internal scales in rendered frames per second")
+    parser.add_argument("--resolution", default="1920x1080")
+    parser.add_argument("--fps", type=int, default=25)
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--pan-mode", default="left_to_right")
+    return parser.parse_args()
+
+
+def run_variant(internal_scale: float, context: VideoEffectContext, pan_mode: str) -> float:
+    width, height = context.resolution
+    source = ffmpeg.input(
+        f"testsrc2=size={width}x{height}:rate={context.fps}:duration={context.duration_seconds}", f="lavfi"
+    )
+    effect = KenBurnsEffect(pan_mode=pan_mode, internal_scale=internal_scale)
+    output = ffmpeg.output(effect.apply(source, context), "-", f="null")
+    start = time.perf_counter()
+    ffmpeg.run(output, cmd=find_ffmpeg_binary(), capture_stdout=True, capture_stderr=True)
+    return context.duration_seconds * context.fps / (time.perf_counter() - start)
+
+
+def main() -> None:
+    args = parse_args()
+    width, height = map(int, args.resolution.split("x"))
+    context = VideoEffectContext(args.seconds, args.fps, (width, height))
+    print(f"{'scale':>6} {'fps':>8}")
+    for internal_scale in INTERNAL_SCALES:
+        fps = run_variant(internal_scale, context, args.pan_mode)
+        print(f"{internal_scale:>6.2f} {fps:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
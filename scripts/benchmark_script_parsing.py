@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from src.steps.script import ScriptGenerator
+from src.utils.config import Config
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare structured vs heuristic script parse time")
+    parser.add_argument("paths", nargs="*", help="Raw script outputs (defaults to runs/*/script_raw.txt)")
+    parser.add_argument("--runs-dir", default="runs")
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def collect_corpus(paths: List[str], runs_dir: Path) -> List[Path]:
+    if paths:
+        return [Path(p) for p in paths]
+    return sorted(runs_dir.glob(f"*/{ScriptGenerator.raw_output_filename}"))
+
+
+def time_parser(parse: Callable[[], object], repeat: int) -> float | None:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            result = parse()
+        except Exception:
+            return None
+        samples.append(time.perf_counter() - start)
+        if result is None:
+            return None
+    return statistics.median(samples) * 1000
+
+
+def benchmark(corpus: List[Path], repeat: int) -> List[Dict[str, object]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = ScriptGenerator(
+            run_id="benchmark",
+            run_dir=Path(tmp),
+            llm_provider=None,
+            speakers_config=Config.load().steps.script.speakers,
+        )
+        rows = []
+        for path in corpus:
+            raw = path.read_text(encoding="utf-8")
+            rows.append(
+                {
+                    "path": str(path),
+                    "chars": len(raw),
+                    "structured_ms": time_parser(lambda: generator._parse_structured(raw), repeat),
+                    "heuristic_ms": time_parser(lambda: generator._parse_heuristic(raw, 6), repeat),
+                }
+            )
+        return rows
+
+
+def _fmt(value: object) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def main() -> None:
+    args = parse_args()
+    corpus = collect_corpus(args.paths, Path(args.runs_dir))
+    if not corpus:
+        print("No raw script outputs found")
+        return
+    rows = benchmark(corpus, max(1, args.repeat))
+    print(f"{'chars':>8} {'structured_ms':>14} {'heuristic_ms':>13}  path")
+    for row in rows:
+        print(f"{row['chars']:>8} {_fmt(row['structured_ms']):>14} {_fmt(row['heuristic_ms']):>13}  {row['path']}")
+    structured = [r["structured_ms"] for r in rows if r["structured_ms"] is not None]
+    heuristic = [r["heuristic_ms"] for r in rows if r["heuristic_ms"] is not None]
+    print(f"structured: {len(structured)}/{len(rows)} parsed, total {_fmt(sum(structured))} ms")
+    print(f"heuristic:  {len(heuristic)}/{len(rows)} parsed, total {_fmt(sum(heuristic))} ms")
+
+
+if __name__ == "__main__":
+    main()
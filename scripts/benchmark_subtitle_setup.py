@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import ffmpeg
+
+from src.core.media_utils import find_ffmpeg_binary, sanitize_path_for_ffmpeg
+from src.steps.subtitle import SubtitleFormatter
+from src.steps.video import VideoRenderer
+from src.utils.config import Config
+
+SAMPLE_TEXT = "日銀が追加利上げを決定し、ドル円は150円台で推移しています。S&P 500 and NASDAQ closed higher."
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare libass setup time for SRT+force_style vs baked ASS")
+    parser.add_argument("--cues", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def sample_cues(count: int) -> List[Dict]:
+    return [{"start": i * 3.0, "end": i * 3.0 + 2.8, "text": SAMPLE_TEXT} for i in range(count)]
+
+
+def time_filter(renderer: VideoRenderer, subtitle_path: Path, repeat: int) -> float:
+    width, height = renderer.resolution.split("x")
+    stream = ffmpeg.input(f"color=c=black:size={width}x{height}:duration=0.04:rate=25", f="lavfi").filter(
+        "subtitles", sanitize_path_for_ffmpeg(subtitle_path), **renderer.subtitle_filter_kwargs(subtitle_path)
+    )
+    output = ffmpeg.output(stream, "-", f="null", vframes=1)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ffmpeg.run(output, cmd=find_ffmpeg_binary(), capture_stdout=True, capture_stderr=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    args = parse_args()
+    config = Config.load()
+    video_config = config.steps.video.model_dump()
+    video_config["effects"] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        formatter = SubtitleFormatter(run_id="benchmark", run_dir=run_dir)
+        cues = sample_cues(args.cues)
+        srt_path = run_dir / "subtitles.srt"
+        srt_path.write_text(formatter._generate_srt(cues), encoding="utf-8")
+        ass_path = run_dir / "subtitles.ass"
+        ass_path.write_text(formatter._generate_ass(cues), encoding="utf-8")
+        renderer = VideoRenderer(run_id="benchmark", run_dir=run_dir, video_config=video_config)
+
+        srt_ms = time_filter(renderer, srt_path, max(1, args.repeat))
+        ass_ms = time_filter(renderer, ass_path, max(1, args.repeat))
+    print(f"fontsdir: {renderer.subtitle_fonts_dir or '(fontconfig only)'}")
+    print(f"srt+force_style: {srt_ms:.1f} ms median over {args.repeat} runs ({args.cues} cues)")
+    print(f"ass:             {ass_ms:.1f} ms median over {args.repeat} runs ({args.cues} cues)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Keep the image-generation pipeline loaded and serve requests from workflow runs and scripts."""
+
+from __future__ import annotations
+
+import argparse
+
+from src.services.image_worker import ImageWorkerServer, build_backend
+from src.utils.config import Config
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--address", help="host:port to listen on (default: providers.image_worker.address)")
+    parser.add_argument("--backend", choices=["zimage", "stub"], help="Override providers.image_worker.backend")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    config = Config.load().providers.image_worker
+    if args.backend:
+        config = config.model_copy(update={"backend": args.backend})
+    backend = build_backend(config)
+    if config.backend == "zimage":
+        logger.info("Loading %s on %s", config.model_path, config.device)
+        backend.warm_up()
+    server = ImageWorkerServer(args.address or config.address, backend, max_batch=config.max_batch)
+    logger.info("Image worker (%s) listening on %s", config.backend, server.address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
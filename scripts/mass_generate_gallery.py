@@ -21,14 +21,15 @@ import json
 import argparse
 from pathlib import Path
 from datetime import datetime
-import torch
-from diffusers import ZImagePipeline
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logger import get_logger
+from src.utils.config import Config
 from src.core.io_utils import load_json
+from src.services.image_generation import ImageGenerationRequest
+from src.services.image_worker import build_backend, connect_image_worker
 from src.steps.scene_generator import (
     SceneContext,
     ContextExtractor,
@@ -231,14 +232,14 @@ def main():
         
     prompt_builder = PromptBuilder(prompts_cfg)
     
-    # 4. Initialize Model
-    print("🚀 Loading Z-Image-Turbo...")
-    model_path = root_dir / "external/hf-cache-hub/models/Z-Image-Turbo"
-    pipe = ZImagePipeline.from_pretrained(
-        str(model_path),
-        torch_dtype=torch.bfloat16,
-        low_cpu_mem_usage=False
-    ).to("cuda")
+    # 4. Connect to the resident image worker (scripts/image_worker.py), or load the pipeline here
+    worker_cfg = Config.load().providers.image_worker.model_copy(update={"enabled": True})
+    image_service = connect_image_worker(worker_cfg)
+    if image_service is None:
+        print("🚀 Image worker not running, loading Z-Image-Turbo in-process...")
+        image_service = build_backend(worker_cfg)
+    else:
+        print(f"🔌 Using image worker at {worker_cfg.address}")
     
     # 5. Prepare Tasks (Combinatorial Explosion!)
     tasks = []
@@ -336,25 +337,28 @@ def main():
     
     generated_data = []
     
-    # Generate
-    for i, task in enumerate(tasks):
-        print(f"[{i+1}/{len(tasks)}] {task['type']} / {task['mood']}...")
+    # Generate (a few tasks per request so the worker can batch them and progress stays visible)
+    chunk_size = max(1, worker_cfg.max_batch)
+    for start in range(0, len(tasks), chunk_size):
+        chunk = tasks[start:start + chunk_size]
+        for i, task in enumerate(chunk, start=start):
+            print(f"[{i+1}/{len(tasks)}] {task['type']} / {task['mood']}...")
         
-        image = pipe(
-            prompt=task["prompt"],
-            negative_prompt=task["negative_prompt"],
-            num_inference_steps=9,
-            guidance_scale=0.0,
-            height=720,
-            width=1280
-        ).images[0]
+        results = image_service.generate_batch([
+            ImageGenerationRequest(
+                prompt=task["prompt"],
+                negative_prompt=task["negative_prompt"],
+                num_inference_steps=9,
+                guidance_scale=0.0,
+                height=720,
+                width=1280
+            )
+            for task in chunk
+        ])
         
-        save_path = output_dir / task["filename"]
-        image.save(save_path)
-        
-        # Update task with full path for gallery (relative)
-        task["filename"] = task["filename"]
-        generated_data.append(task)
+        for task, result in zip(chunk, results):
+            result.image.save(output_dir / task["filename"])
+            generated_data.append(task)
         
     # Create Gallery
     generate_gallery(output_dir, generated_data, run_id, context)
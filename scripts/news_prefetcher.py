@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from apps.youtube.cli import build_news_collector
+from src.services.news_prefetch import NewsPrefetcher
+from src.utils.config import Config
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--once", action="store_true", help="Prefetch immediately and exit")
+    parser.add_argument("--poll-seconds", type=float, default=30)
+    return parser.parse_args()
+
+
+def prefetch(config: Config) -> Path:
+    run_id = f"prefetch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    return build_news_collector(config, run_id, Path(config.workflow.default_run_dir)).prefetch()
+
+
+def main() -> None:
+    args = parse_args()
+    config = Config.load()
+    if args.once:
+        print(prefetch(config))
+        return
+    crons = [schedule.cron for schedule in config.automation.schedules if schedule.enabled and schedule.prefetch_news]
+    prefetcher = NewsPrefetcher(lambda: prefetch(config), crons, config.steps.news.prefetch_lead_minutes)
+    prefetcher.run_forever(args.poll_seconds)
+
+
+if __name__ == "__main__":
+    main()
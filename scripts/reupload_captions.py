@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from src.providers.youtube import YouTubeClient
+from src.utils.config import Config
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-upload a run's subtitles.srt as YouTube captions")
+    parser.add_argument("run_id")
+    parser.add_argument("--runs-dir", default=None)
+    parser.add_argument("--subtitles", default=None, help="Caption file (defaults to the run's subtitles.srt)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    config = Config.load()
+    run_path = Path(args.runs_dir or config.workflow.default_run_dir) / args.run_id
+    result_path = run_path / "youtube.json"
+    result = json.loads(result_path.read_text(encoding="utf-8"))
+    if result.get("status") != "uploaded":
+        raise SystemExit(f"Run {args.run_id} has no uploaded video")
+
+    youtube_cfg = config.steps.youtube
+    client = YouTubeClient(
+        dry_run=False,
+        default_visibility="private",
+        upload_captions=True,
+        caption_language=youtube_cfg.caption_language,
+        caption_name=youtube_cfg.caption_name,
+    )
+    captions_path = Path(args.subtitles) if args.subtitles else run_path / "subtitles.srt"
+    result["caption_id"] = client.upload_caption(result["video_id"], captions_path, result.get("caption_id"))
+    result.pop("caption_error", None)
+    result_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"Captions {result['caption_id']} updated for {result['video_url']}")
+
+
+if __name__ == "__main__":
+    main()
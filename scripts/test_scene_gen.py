@@ -9,7 +9,10 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.services.image_generation import ZImageTurboService
+from src.services.image_worker import connect_image_worker
 from src.steps.scene_generator import SceneGenerator
+from src.utils.config import Config
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -78,9 +81,22 @@ def main():
     print(f"   - Model compilation: {'Enabled' if config['compile_model'] else 'Disabled'}")
     print()
     
+    # Reuse the resident image worker when it is running instead of loading the pipeline again
+    worker_cfg = Config.load().providers.image_worker.model_copy(update={"enabled": True})
+    image_service = connect_image_worker(worker_cfg)
+    print(f"   - Image backend: {'worker at ' + worker_cfg.address if image_service else 'in-process'}")
+    if image_service is None:
+        image_service = ZImageTurboService(
+            model_path=config["model_path"],
+            device=config["device"],
+            batch_size=config["batch_size"],
+            compile_model=config["compile_model"],
+        )
+
     generator = SceneGenerator(
         run_id=run_id,
         run_dir=run_dir,
+        image_service=image_service,
         scene_config=config,
     )
     
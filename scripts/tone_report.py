@@ -9,6 +9,8 @@ from typing import Any, Dict, List
 
 import yaml
 
+from src.utils.keywords import get_keyword_matcher
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
@@ -45,30 +47,15 @@ def load_metadata(runs_dir: Path) -> List[Dict[str, Any]]:
 
 
 def detect_terms(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
-    flagged_terms = [
-        "闇",
-        "陰謀",
-        "暴露",
-        "暴落",
-        "崩壊",
-        "激震",
-        "ショック",
-        "警告",
-        "危機",
-        "炎上",
-        "やばい",
-        "震撼",
-        "衝撃",
-        "暴走",
-        "緊急速報",
-    ]
+    tone_flagged = get_keyword_matcher()["tone_flagged"]
+    flagged_terms = list(tone_flagged.labels)
     title_counter: Counter[str] = Counter()
     description_counter: Counter[str] = Counter()
     title_examples: List[Dict[str, Any]] = []
     description_examples: List[Dict[str, Any]] = []
     for entry in entries:
-        title_hits = sorted({term for term in flagged_terms if term in entry["title"]})
-        desc_hits = sorted({term for term in flagged_terms if term in entry["description"]})
+        title_hits = sorted(tone_flagged.match(entry["title"]))
+        desc_hits = sorted(tone_flagged.match(entry["description"]))
         if title_hits:
             for term in title_hits:
                 title_counter[term] += 1
@@ -153,11 +140,12 @@ def apply_tone(text: str, tone_cfg: Dict[str, Any], field: str) -> str:
     return result.strip()
 
 
-def simulate_tone(entries: List[Dict[str, Any]], tone_cfg: Dict[str, Any], flagged_terms: List[str]) -> Dict[str, Any]:
+def simulate_tone(entries: List[Dict[str, Any]], tone_cfg: Dict[str, Any]) -> Dict[str, Any]:
     if not tone_cfg:
         return {}
-    before_title = sum(1 for entry in entries if any(term in entry["title"] for term in flagged_terms))
-    before_desc = sum(1 for entry in entries if any(term in entry["description"] for term in flagged_terms))
+    tone_flagged = get_keyword_matcher()["tone_flagged"]
+    before_title = sum(1 for entry in entries if tone_flagged.match(entry["title"]))
+    before_desc = sum(1 for entry in entries if tone_flagged.match(entry["description"]))
 
     after_title_counter: Counter[str] = Counter()
     after_desc_counter: Counter[str] = Counter()
@@ -167,8 +155,8 @@ def simulate_tone(entries: List[Dict[str, Any]], tone_cfg: Dict[str, Any], flagg
     for entry in entries:
         sanitized_title = apply_tone(entry["title"], tone_cfg, "title")
         sanitized_desc = apply_tone(entry["description"], tone_cfg, "description")
-        title_hits = sorted({term for term in flagged_terms if term in sanitized_title})
-        desc_hits = sorted({term for term in flagged_terms if term in sanitized_desc})
+        title_hits = sorted(tone_flagged.match(sanitized_title))
+        desc_hits = sorted(tone_flagged.match(sanitized_desc))
         for term in title_hits:
             after_title_counter[term] += 1
         for term in desc_hits:
@@ -179,7 +167,7 @@ def simulate_tone(entries: List[Dict[str, Any]], tone_cfg: Dict[str, Any], flagg
                     "run_id": entry["run_id"],
                     "title_before": entry["title"],
                     "title_after": sanitized_title,
-                    "terms_before": [term for term in flagged_terms if term in entry["title"]],
+                    "terms_before": tone_flagged.ordered(entry["title"]),
                     "terms_after": title_hits,
                 }
             )
@@ -189,7 +177,7 @@ def simulate_tone(entries: List[Dict[str, Any]], tone_cfg: Dict[str, Any], flagg
                     "run_id": entry["run_id"],
                     "excerpt_before": entry["description"][:160],
                     "excerpt_after": sanitized_desc[:160],
-                    "terms_before": [term for term in flagged_terms if term in entry["description"]],
+                    "terms_before": tone_flagged.ordered(entry["description"]),
                     "terms_after": desc_hits,
                 }
             )
@@ -236,7 +224,7 @@ def build_report(args: argparse.Namespace) -> Dict[str, Any]:
         report["tone_report"]["title_length_max"] = max(lengths)
     tone_cfg = load_tone_config(Path("config/default.yaml"))
     if tone_cfg:
-        report["tone_report"]["simulated_tone"] = simulate_tone(entries, tone_cfg, findings["flagged_terms"])
+        report["tone_report"]["simulated_tone"] = simulate_tone(entries, tone_cfg)
     return report
 
 
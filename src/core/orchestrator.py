@@ -1,22 +1,27 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Iterable, List
 
+from src.core.publish import PublishResult, PublishStage
 from src.core.state import WorkflowResult, WorkflowState
 from src.core.step import Step
+from src.providers.http import latency_metrics
 from src.tracking import AimTracker
 from src.utils.prompt_version import prompt_bundle_version
 
 
 class WorkflowOrchestrator:
-    def __init__(self, run_id: str, steps: Iterable[Step], run_dir: Path):
+    def __init__(self, run_id: str, steps: Iterable[Step | PublishStage], run_dir: Path):
         self.run_id = run_id
-        self.steps: List[Step] = list(steps)
+        self.steps: List[Step | PublishStage] = list(steps)
         self.run_dir = Path(run_dir)
         self.state = WorkflowState.load_or_create(run_id, self.run_dir)
+        # Publishers report back from worker threads.
+        self._state_lock = threading.Lock()
 
         current_prompt_version = prompt_bundle_version()
         if self.state.prompt_version and self.state.prompt_version != current_prompt_version:
@@ -31,7 +36,9 @@ class WorkflowOrchestrator:
         tracker = AimTracker.get_instance(self.run_id)
         self.state.aim_run_id = tracker.run_hash
         self.state.save(self.run_dir)
-        current_step: Step | None = None
+        current_step: Step | PublishStage | None = None
+        # Steps whose output is still being written; only stream consumers may run before they settle.
+        pending: List[Step] = []
 
         try:
             for step in self.steps:
@@ -41,10 +48,28 @@ class WorkflowOrchestrator:
                         self.state.step_statuses[step.name] = "success"
                     continue
 
+                if isinstance(step, PublishStage):
+                    self._publish(step, pending)
+                    continue
+
+                if pending and not step.consumes_stream:
+                    for current_step in pending:
+                        self._complete(current_step, current_step.finalize())
+                    pending.clear()
+                    current_step = step
+
                 output_path = step.run(self.state.outputs)
-                self.state.mark_completed(step.name, str(output_path))
-                self.state.save(self.run_dir)
+                if step.in_progress():
+                    self.state.outputs[step.name] = str(output_path)
+                    pending.append(step)
+                    continue
+                self._complete(step, output_path)
 
+            for current_step in pending:
+                self._complete(current_step, current_step.finalize())
+            pending.clear()
+
+            self.state.record_metrics("http", latency_metrics())
             self.state.mark_success()
             self.state.save(self.run_dir)
             duration = (datetime.now() - start_time).total_seconds()
@@ -55,6 +80,14 @@ class WorkflowOrchestrator:
 
             tracker.track_status("success")
             tracker.track_metrics({"workflow_duration": duration, "steps_completed": len(self.state.completed_steps)})
+            tracker.track_metrics(
+                {
+                    f"{step_name}_{name}": value
+                    for step_name, values in self.state.metrics.items()
+                    for name, value in values.items()
+                    if isinstance(value, (int, float))
+                }
+            )
             tracker.finalize()
 
             return WorkflowResult(
@@ -67,6 +100,15 @@ class WorkflowOrchestrator:
         except Exception as exc:  # noqa: BLE001
             error_step = current_step.name if current_step else "unknown"
             error_message = f"{error_step}: {type(exc).__name__}: {exc}"
+            for producer in pending:
+                if producer is current_step:
+                    continue
+                try:
+                    # Keep a finished encode so a rerun only repeats the step that failed.
+                    self._complete(producer, producer.finalize())
+                except Exception:  # noqa: BLE001
+                    self.state.outputs.pop(producer.name, None)
+            self.state.record_metrics("http", latency_metrics())
             self.state.mark_failed(error_step, error_message)
             self.state.save(self.run_dir)
             duration = (datetime.now() - start_time).total_seconds()
@@ -83,6 +125,54 @@ class WorkflowOrchestrator:
                 duration_seconds=duration,
             )
 
+    def _complete(self, step: Step, output_path: Path, extra_metrics: Dict[str, float] | None = None) -> None:
+        with self._state_lock:
+            self.state.mark_completed(step.name, str(output_path))
+            self.state.register_artifacts(step.name, step.artifacts())
+            self.state.record_metrics(step.name, {**step.metrics(), **(extra_metrics or {})})
+            self.state.save(self.run_dir)
+
+    def _publish(self, stage: PublishStage, pending: List[Step]) -> None:
+        """Run the publish stage; stream producers are settled once the first publisher needs their output."""
+
+        def settle() -> None:
+            try:
+                for producer in pending:
+                    self._complete(producer, producer.finalize())
+            except Exception:
+                for producer in pending:
+                    if producer.name not in self.state.completed_steps:
+                        self.state.outputs.pop(producer.name, None)
+                raise
+            finally:
+                pending.clear()
+
+        def complete(step: Step, output_path: Path, result: PublishResult) -> None:
+            self._complete(step, output_path, self._publish_metrics(result))
+
+        def fail(step: Step, result: PublishResult) -> None:
+            with self._state_lock:
+                # The run fails once the whole stage is done; until then only this publisher is marked.
+                self.state.step_statuses[step.name] = "failed"
+                self.state.record_metrics(
+                    step.name,
+                    {
+                        **self._publish_metrics(result),
+                        "publish_error": f"{type(result.error).__name__}: {result.error}",
+                    },
+                )
+                self.state.save(self.run_dir)
+
+        try:
+            stage.run(self.state.outputs, self.state.completed_steps, settle=settle, complete=complete, fail=fail)
+        finally:
+            if pending:
+                settle()
+
+    @staticmethod
+    def _publish_metrics(result: PublishResult) -> Dict[str, float]:
+        return {"publish_seconds": round(result.seconds, 3), "publish_attempts": result.attempts}
+
     def _load_previous_outputs(self) -> Dict[str, Path]:
         if not self.run_dir.exists():
             return {}
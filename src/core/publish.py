@@ -0,0 +1,206 @@
+"""Concurrent publish stage: every enabled publisher runs at once after the render."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping
+
+from src.core.step import Step, StepExecutionError
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PublishResult:
+    name: str
+    output_path: Path | None = None
+    error: Exception | None = None
+    attempts: int = 0
+    seconds: float = 0.0
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.skipped
+
+
+class PublishStage:
+    """Run publishers concurrently, each under its own deadline and retry budget.
+
+    A publisher waits only for the steps named in its ``depends_on``; everything else starts as
+    soon as the render has settled, so the stage takes as long as its slowest chain.
+    ``timeout_seconds`` bounds a publisher's attempts together. An attempt that overruns it is
+    abandoned rather than retried, so a slow post is never sent twice.
+    """
+
+    name = "publish"
+
+    def __init__(
+        self,
+        publishers: Iterable[Step],
+        *,
+        timeout_seconds: float = 1800.0,
+        retries: int = 1,
+        retry_backoff_seconds: float = 10.0,
+        policies: Mapping[str, Mapping[str, float | int | None]] | None = None,
+    ):
+        self.publishers: List[Step] = list(publishers)
+        self.timeout_seconds = float(timeout_seconds)
+        self.retries = int(retries)
+        self.retry_backoff_seconds = float(retry_backoff_seconds)
+        self.policies = {name: dict(policy) for name, policy in (policies or {}).items()}
+        self._check_dependencies()
+
+    def policy(self, step: Step) -> tuple[float, int]:
+        """Deadline in seconds and number of retries for ``step``."""
+        overrides = self.policies.get(step.name, {})
+        timeout = overrides.get("timeout_seconds")
+        retries = overrides.get("retries")
+        return (
+            float(timeout) if timeout is not None else self.timeout_seconds,
+            int(retries) if retries is not None else self.retries,
+        )
+
+    def run(
+        self,
+        outputs: Dict[str, str],
+        completed: Iterable[str],
+        *,
+        settle: Callable[[], None],
+        complete: Callable[[Step, Path, PublishResult], None],
+        fail: Callable[[Step, PublishResult], None],
+    ) -> List[PublishResult]:
+        """Publish everything not yet in ``completed`` and report each result through the callbacks.
+
+        ``settle`` is called once, before the first publisher that cannot read a growing file starts.
+        Raises ``StepExecutionError`` after every publisher has finished if any of them failed.
+        """
+        completed = set(completed)
+        todo = [step for step in self.publishers if step.name not in completed]
+        if not todo:
+            return []
+        scheduled = {step.name for step in todo}
+        finished = {step.name: threading.Event() for step in todo}
+        results: Dict[str, PublishResult] = {}
+        settled = _Once(settle)
+        tasks = ThreadPoolExecutor(max_workers=len(todo), thread_name_prefix="publish")
+        attempts = ThreadPoolExecutor(max_workers=len(todo), thread_name_prefix="publish-attempt")
+
+        def publish(step: Step) -> PublishResult:
+            try:
+                for dependency in step.depends_on:
+                    if dependency not in scheduled:
+                        continue
+                    finished[dependency].wait()
+                    if not results[dependency].ok:
+                        logger.warning("Skipping %s: %s did not publish", step.name, dependency)
+                        return PublishResult(step.name, skipped=True)
+                if not step.consumes_stream:
+                    settled()
+                result = self._attempt(step, dict(outputs), attempts)
+                if result.ok:
+                    complete(step, result.output_path, result)
+                else:
+                    fail(step, result)
+                return result
+            except Exception as exc:  # noqa: BLE001 - reported per publisher
+                result = PublishResult(step.name, error=exc)
+                fail(step, result)
+                return result
+
+        def tracked(step: Step) -> PublishResult:
+            try:
+                results[step.name] = publish(step)
+                return results[step.name]
+            finally:
+                finished[step.name].set()
+
+        try:
+            for future in [tasks.submit(tracked, step) for step in todo]:
+                future.result()
+        finally:
+            tasks.shutdown(wait=False, cancel_futures=True)
+            attempts.shutdown(wait=False, cancel_futures=True)
+
+        ordered = [results[step.name] for step in todo]
+        failures = [result for result in ordered if result.error is not None]
+        if failures:
+            raise StepExecutionError(
+                "; ".join(f"{result.name}: {type(result.error).__name__}: {result.error}" for result in failures)
+            )
+        return ordered
+
+    def _attempt(self, step: Step, inputs: Dict[str, str], executor: ThreadPoolExecutor) -> PublishResult:
+        timeout, retries = self.policy(step)
+        started = time.perf_counter()
+        result = PublishResult(step.name)
+        while True:
+            result.attempts += 1
+            remaining = timeout - (time.perf_counter() - started)
+            future = executor.submit(step.run, inputs)
+            try:
+                result.output_path = future.result(timeout=max(0.0, remaining))
+                result.error = None
+            except FutureTimeoutError:
+                result.error = TimeoutError(f"{step.name} timed out after {timeout}s")
+                logger.error("%s exceeded its %.0fs budget; abandoning the running attempt", step.name, timeout)
+                break
+            except Exception as exc:  # noqa: BLE001 - retried below
+                result.error = exc
+            if result.error is None or result.attempts > retries:
+                break
+            delay = self.retry_backoff_seconds * 2 ** (result.attempts - 1)
+            if time.perf_counter() - started + delay >= timeout:
+                break
+            logger.warning(
+                "%s failed (%s); retry %s/%s in %.0fs", step.name, result.error, result.attempts, retries, delay
+            )
+            time.sleep(delay)
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def _check_dependencies(self) -> None:
+        graph = {step.name: list(step.depends_on) for step in self.publishers}
+        visiting: set[str] = set()
+        done: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in done or name not in graph:
+                return
+            if name in visiting:
+                raise ValueError(f"Publish dependencies form a cycle through {name}")
+            visiting.add(name)
+            for dependency in graph[name]:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in graph:
+            visit(name)
+
+
+class _Once:
+    """Call ``func`` on first use from any thread; later callers wait for it and see the same error."""
+
+    def __init__(self, func: Callable[[], None]):
+        self._func = func
+        self._lock = threading.Lock()
+        self._done = False
+        self._error: Exception | None = None
+
+    def __call__(self) -> None:
+        with self._lock:
+            if not self._done:
+                try:
+                    self._func()
+                except Exception as exc:  # noqa: BLE001 - re-raised to every caller
+                    self._error = exc
+                self._done = True
+        if self._error is not None:
+            raise self._error
@@ -15,6 +15,7 @@ class WorkflowState(BaseModel):
     status: Literal["running", "completed", "failed", "partial"] = "running"
     completed_steps: List[str] = Field(default_factory=list)
     outputs: Dict[str, str] = Field(default_factory=dict)
+    metrics: Dict[str, Dict[str, int | float | str]] = Field(default_factory=dict)
     step_statuses: Dict[str, Literal["pending", "success", "failed"]] = Field(default_factory=dict)
     errors: List[str] = Field(default_factory=list)
     started_at: datetime = Field(default_factory=datetime.now)
@@ -40,6 +41,14 @@ class WorkflowState(BaseModel):
         self.outputs[step_name] = output_path
         self.step_statuses[step_name] = "success"
 
+    def register_artifacts(self, step_name: str, artifacts: Dict[str, Path]):
+        for name, path in artifacts.items():
+            self.outputs[f"{step_name}:{name}"] = str(path)
+
+    def record_metrics(self, step_name: str, metrics: Dict[str, int | float | str]):
+        if metrics:
+            self.metrics[step_name] = dict(metrics)
+
     def mark_failed(self, step_name: str, error: str):
         self.status = "failed"
         if step_name:
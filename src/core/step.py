@@ -12,6 +12,9 @@ class Step(ABC):
     name: str
     output_filename: str
     is_required: bool = True
+    consumes_stream: bool = False
+    # Steps whose output this one needs before it may start when run inside a concurrent stage.
+    depends_on: tuple[str, ...] = ()
 
     def __init__(self, run_id: str, run_dir: Path):
         self.run_id = run_id
@@ -20,6 +23,22 @@ class Step(ABC):
     @abstractmethod
     def execute(self, inputs: Dict[str, Path]) -> Path: ...
 
+    def artifacts(self) -> Dict[str, Path]:
+        """Secondary files produced alongside the main output, keyed by a short name."""
+        return {}
+
+    def metrics(self) -> Dict[str, float | str]:
+        """Measurements from the last ``execute`` worth keeping in the run state."""
+        return {}
+
+    def in_progress(self) -> bool:
+        """True while work started by ``execute`` is still running in the background."""
+        return False
+
+    def finalize(self) -> Path:
+        """Wait for background work started by ``execute`` and return the finished output."""
+        return self.get_output_path()
+
     def get_output_path(self) -> Path:
         return self.run_dir / self.run_id / self.output_filename
 
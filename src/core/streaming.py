@@ -0,0 +1,85 @@
+"""Follow an ffmpeg encode while it is still writing, so later steps can consume finished bytes early."""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict
+
+FRAGMENTED_MP4_FLAGS = "frag_keyframe+empty_moov+default_base_moof"
+COPY_BLOCK_SIZE = 64 * 1024
+
+_active: Dict[Path, "FragmentedEncode"] = {}
+
+
+class EncodeFailedError(RuntimeError):
+    pass
+
+
+class FragmentedEncode:
+    """ffmpeg writing fragmented MP4 to stdout, appended to ``path`` as it arrives.
+
+    A pipe cannot be seeked, so every byte on disk is final the moment it is written and readers may
+    ship it before the encode ends. Readers share one handle opened up front, so the finished file can be
+    moved into place without pulling it out from under an upload.
+    """
+
+    def __init__(self, process: subprocess.Popen, path: Path):
+        self.process = process
+        self.path = Path(path)
+        self.written = 0
+        self.returncode: int | None = None
+        self._condition = threading.Condition()
+        self._sink = self.path.open("wb")
+        self._source = self.path.open("rb")
+        self._read_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._copy, name=f"encode-{self.path.name}", daemon=True)
+        self._thread.start()
+        _active[self.path.resolve()] = self
+
+    def _copy(self) -> None:
+        with self._sink:
+            while block := self.process.stdout.read(COPY_BLOCK_SIZE):
+                self._sink.write(block)
+                self._sink.flush()
+                with self._condition:
+                    self.written += len(block)
+                    self._condition.notify_all()
+        returncode = self.process.wait()
+        with self._condition:
+            self.returncode = returncode
+            self._condition.notify_all()
+
+    @property
+    def done(self) -> bool:
+        return self.returncode is not None
+
+    @property
+    def total(self) -> int | None:
+        """Final size once the encode has finished successfully, otherwise ``None``."""
+        return self.written if self.returncode == 0 else None
+
+    def read(self, offset: int, size: int) -> bytes:
+        """Block until ``size`` bytes from ``offset`` are on disk or the encode ends, then return them."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.done or self.written >= offset + size)
+            if self.returncode:
+                raise EncodeFailedError(f"ffmpeg exited with status {self.returncode} while writing {self.path}")
+        with self._read_lock:
+            self._source.seek(offset)
+            return self._source.read(size)
+
+    def close(self) -> None:
+        with self._read_lock:
+            self._source.close()
+
+    def wait(self) -> None:
+        self._thread.join()
+        _active.pop(self.path.resolve(), None)
+        if self.returncode:
+            raise EncodeFailedError(f"ffmpeg exited with status {self.returncode} while writing {self.path}")
+
+
+def active_encode(path: str | Path) -> FragmentedEncode | None:
+    return _active.get(Path(path).resolve())
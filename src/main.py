@@ -28,6 +28,11 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="顧客別ブランド設定を読み込み、外部公開しないレビュー用runを生成する",
     )
+    parser.add_argument(
+        "--render-profile",
+        choices=["full", "draft"],
+        help="動画の書き出し品質。省略時はレビュー用run(--dry-run/--brand-config)だけdraftになる",
+    )
     return parser.parse_args()
 
 
@@ -56,7 +61,11 @@ def main() -> int:
         activate_brand_profile(args.brand_config)
     review_only = args.dry_run or args.brand_config is not None
     _configure_publication_mode(dry_run=review_only)
-    return run_youtube(news_query=args.news_query, force_dry_run=review_only)
+    return run_youtube(
+        news_query=args.news_query,
+        force_dry_run=review_only,
+        render_profile=args.render_profile,
+    )
 
 
 if __name__ == "__main__":
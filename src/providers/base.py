@@ -1,4 +1,8 @@
-from typing import Any, Iterable, Protocol, Sequence
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Mapping, Protocol, Sequence
 
 
 def has_credentials(provider: object) -> bool:
@@ -21,6 +25,18 @@ class AllProvidersFailedError(RuntimeError):
         self.errors = errors
 
 
+@dataclass
+class ProviderResult:
+    name: str
+    value: Any = None
+    error: Exception | None = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class ProviderChain:
     def __init__(self, providers: Iterable[Provider]):
         self.providers = sorted(
@@ -28,6 +44,7 @@ class ProviderChain:
             key=lambda provider: getattr(provider, "priority", 0),
             reverse=True,
         )
+        self.last_provider: str | None = None
 
     def execute(self, **kwargs: Any) -> Any:
         errors: dict[str, Exception] = {}
@@ -35,11 +52,68 @@ class ProviderChain:
             if not provider.is_available():
                 continue
             try:
-                return provider.execute(**kwargs)
+                result = provider.execute(**kwargs)
+                self.last_provider = provider.name
+                return result
             except Exception as exc:  # noqa: BLE001 - bubble up aggregated failure
                 errors[provider.name] = exc
         raise AllProvidersFailedError([p.name for p in self.providers], errors)
 
+    def fan_out(
+        self,
+        timeout: float | None = None,
+        timeouts: Mapping[str, float] | None = None,
+        **kwargs: Any,
+    ) -> List[ProviderResult]:
+        """Run every available provider concurrently, each under its own deadline.
+
+        Results come back in priority order. A provider that raises or misses its
+        deadline is reported with an error instead of failing the whole call.
+        """
+        available = [provider for provider in self.providers if provider.is_available()]
+        if not available:
+            raise AllProvidersFailedError([p.name for p in self.providers], {})
+        timeouts = timeouts or {}
+        executor = ThreadPoolExecutor(max_workers=len(available), thread_name_prefix="provider-fan-out")
+        started = time.perf_counter()
+        futures = [(provider, executor.submit(_timed, provider, kwargs)) for provider in available]
+        results: List[ProviderResult] = []
+        try:
+            for provider, future in futures:
+                limit = timeouts.get(provider.name, timeout)
+                remaining = None if limit is None else max(0.0, limit - (time.perf_counter() - started))
+                try:
+                    value, latency = future.result(timeout=remaining)
+                    results.append(ProviderResult(provider.name, value=value, latency=latency))
+                except FutureTimeoutError:
+                    error = TimeoutError(f"{provider.name} timed out after {limit}s")
+                    results.append(ProviderResult(provider.name, error=error, latency=float(limit)))
+                except Exception as exc:  # noqa: BLE001 - reported per provider
+                    results.append(ProviderResult(provider.name, error=exc, latency=time.perf_counter() - started))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if not any(result.ok for result in results):
+            raise AllProvidersFailedError(
+                [p.name for p in self.providers], {result.name: result.error for result in results}
+            )
+        return results
+
+
+def _timed(provider: Provider, kwargs: Mapping[str, Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    value = provider.execute(**kwargs)
+    return value, time.perf_counter() - start
+
 
 def execute_with_fallback(providers: Iterable[Provider], **kwargs: Any) -> Any:
     return ProviderChain(providers).execute(**kwargs)
+
+
+def execute_fan_out(
+    providers: Iterable[Provider],
+    timeout: float | None = None,
+    timeouts: Mapping[str, float] | None = None,
+    **kwargs: Any,
+) -> List[ProviderResult]:
+    return ProviderChain(providers).fan_out(timeout=timeout, timeouts=timeouts, **kwargs)
@@ -4,8 +4,8 @@ import base64
 import json
 import os
 
-import requests
-
+from src.providers.http import http_session
+from src.services.image_cache import ImageCache, image_cache_key
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,11 +17,14 @@ class CloudflareAIClient:
         account_id: str | None = None,
         api_token: str | None = None,
         model: str = "@cf/black-forest-labs/flux-1-schnell",
+        cache: ImageCache | None = None,
     ) -> None:
         self.account_id = account_id or os.getenv("CLOUDFLARE_ACCOUNT_ID", "dc1aa018702e10045b00865b63f144d0")
         self.api_token = api_token or os.getenv("CLOUDFLARE_API_TOKEN", "")
         self.model = model
         self.base_url = f"https://api.cloudflare.com/client/v4/accounts/{self.account_id}/ai/run"
+        self.session = http_session(self.base_url)
+        self.cache = cache
 
     def generate_image(
         self,
@@ -35,6 +38,27 @@ class CloudflareAIClient:
         model: str | None = None,
     ) -> bytes:
         target_model = model or self.model
+        key = image_cache_key(target_model, prompt, negative_prompt, width, height, num_steps, guidance, seed)
+        cached = self.cache.get(key) if self.cache else None
+        if cached is not None:
+            logger.info("Reusing cached image for model=%s width=%d height=%d", target_model, width, height)
+            return cached
+        image = self._request_image(target_model, prompt, negative_prompt, width, height, num_steps, seed, guidance)
+        if self.cache:
+            self.cache.put(key, image)
+        return image
+
+    def _request_image(
+        self,
+        target_model: str,
+        prompt: str,
+        negative_prompt: str,
+        width: int,
+        height: int,
+        num_steps: int,
+        seed: int | None,
+        guidance: float,
+    ) -> bytes:
         url = f"{self.base_url}/{target_model}"
         headers = {"Authorization": f"Bearer {self.api_token}", "Content-Type": "application/json"}
         payload = {
@@ -52,7 +76,7 @@ class CloudflareAIClient:
         logger.info(
             "Generating image with model=%s width=%d height=%d steps=%d", target_model, width, height, num_steps
         )
-        response = requests.post(url, headers=headers, json=payload)
+        response = self.session.post(url, headers=headers, json=payload)
         response.raise_for_status()
         content_type = response.headers.get("content-type", "")
         if "application/json" in content_type:
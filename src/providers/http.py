@@ -0,0 +1,211 @@
+"""Shared HTTP client: one keep-alive pool per host, default timeouts and retries for idempotent calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Mapping, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (5.0, 120.0)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+_sessions: Dict[str, "HostSession"] = {}
+_lock = threading.Lock()
+
+
+@dataclass
+class HostLatency:
+    requests: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float, failed: bool) -> None:
+        self.requests += 1
+        self.errors += int(failed)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class HostSession(requests.Session):
+    """Session bound to one host that fills in a timeout, retries safe failures and times every call.
+
+    GET/HEAD/OPTIONS/PUT/DELETE are retried on connection errors and on 429/5xx with exponential
+    backoff, honouring ``Retry-After`` up to ``max_retry_after_seconds``. Other methods are retried only
+    after a connect timeout, when the request never reached the server, unless the caller passes
+    ``idempotent=True``.
+    Pass ``idempotent=False`` when the body is a stream that cannot be sent twice.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        retries: int = 3,
+        backoff_seconds: float = 0.5,
+        pool_size: int = 10,
+        max_retry_after_seconds: float = MAX_RETRY_AFTER_SECONDS,
+    ):
+        super().__init__()
+        self.host = host
+        self.timeout = timeout
+        self.retries = int(retries)
+        self.backoff_seconds = float(backoff_seconds)
+        self.max_retry_after_seconds = float(max_retry_after_seconds)
+        self.latency = HostLatency()
+        self._latency_lock = threading.Lock()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method: str, url: str, *args: Any, idempotent: bool | None = None, **kwargs: Any):
+        kwargs.setdefault("timeout", self.timeout)
+        retry_any = idempotent if idempotent is not None else method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.perf_counter()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except requests.RequestException as exc:
+                self._record(started, failed=True)
+                retryable = retry_any and isinstance(exc, (requests.ConnectionError, requests.Timeout))
+                if attempt > self.retries or not (retryable or isinstance(exc, requests.ConnectTimeout)):
+                    raise
+                delay = self._delay(attempt, None)
+                logger.warning(
+                    "%s %s failed (%s); retry %s/%s in %.1fs", method, url, exc, attempt, self.retries, delay
+                )
+            else:
+                self._record(started, failed=response.status_code >= 500)
+                if not (retry_any and response.status_code in RETRY_STATUSES) or attempt > self.retries:
+                    return response
+                delay = self._delay(attempt, response.headers.get("Retry-After"))
+                logger.warning(
+                    "%s %s returned %s; retry %s/%s in %.1fs",
+                    method,
+                    url,
+                    response.status_code,
+                    attempt,
+                    self.retries,
+                    delay,
+                )
+                response.close()
+            time.sleep(delay)
+
+    def _delay(self, attempt: int, retry_after: str | None) -> float:
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_retry_after_seconds)
+        return self.backoff_seconds * 2 ** (attempt - 1)
+
+    def _record(self, started: float, failed: bool) -> None:
+        with self._latency_lock:
+            self.latency.record(time.perf_counter() - started, failed)
+
+
+class MultipartFileBody:
+    """multipart/form-data body that reads the file from disk as it is sent instead of building it in memory.
+
+    It has a length, so requests sends a Content-Length header rather than chunked encoding.
+    """
+
+    def __init__(self, fields: Mapping[str, str], file_field: str, path: Path, content_type: str):
+        self.path = Path(path)
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        head = "".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            for name, value in fields.items()
+        )
+        head += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{self.path.name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._head = head.encode("utf-8")
+        self._tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        self._length = len(self._head) + self.path.stat().st_size + len(self._tail)
+        self._position = 0
+        self._file: BinaryIO | None = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length
+        chunks = []
+        while size > 0 and self._position < self._length:
+            chunk = self._read_part(size)
+            self._position += len(chunk)
+            size -= len(chunk)
+            chunks.append(chunk)
+        if self._position >= self._length:
+            self.close()
+        return b"".join(chunks)
+
+    def _read_part(self, size: int) -> bytes:
+        head_end = len(self._head)
+        file_end = self._length - len(self._tail)
+        if self._position < head_end:
+            return self._head[self._position : self._position + size]
+        if self._position < file_end:
+            if self._file is None:
+                self._file = self.path.open("rb")
+                self._file.seek(self._position - head_end)
+            return self._file.read(min(size, file_end - self._position))
+        offset = self._position - file_end
+        return self._tail[offset : offset + size]
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def http_session(url: str, **options: Any) -> HostSession:
+    """Pooled session for the host of ``url``; ``options`` apply only when the host is first seen."""
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    key = f"{parts.scheme}://{parts.netloc}"
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = HostSession(parts.netloc, **options)
+        return session
+
+
+def latency_metrics() -> Dict[str, float]:
+    """Per-host call count, error count and mean/max latency for every host used in this process."""
+    with _lock:
+        sessions = list(_sessions.values())
+    metrics: Dict[str, float] = {}
+    for session in sessions:
+        latency = session.latency
+        if not latency.requests:
+            continue
+        metrics[f"{session.host}_requests"] = latency.requests
+        metrics[f"{session.host}_errors"] = latency.errors
+        metrics[f"{session.host}_mean_ms"] = round(latency.total_seconds / latency.requests * 1000, 1)
+        metrics[f"{session.host}_max_ms"] = round(latency.max_seconds * 1000, 1)
+    return metrics
+
+
+def close_sessions() -> None:
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
@@ -1,11 +1,10 @@
 import time
 from collections import deque
-from pathlib import Path
 
 import litellm
-import yaml
 
 from src.providers.base import has_credentials
+from src.utils.prompt_registry import PromptTemplate, get_prompt_registry
 from src.utils.secrets import load_secret_values
 
 
@@ -49,12 +48,20 @@ class GeminiProvider:
 
     is_available = has_credentials
 
-    def execute(self, prompt: str, system_prompt: str | None = None, **kwargs) -> str:
+    def execute(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        response_format: dict | None = None,
+        **kwargs,
+    ) -> str:
         if not self._keys:
             raise RuntimeError("No Gemini API keys configured")
 
         # Try primary model first
-        result = self._try_execute_with_model(self.model, prompt, system_prompt=system_prompt)
+        result = self._try_execute_with_model(
+            self.model, prompt, system_prompt=system_prompt, response_format=response_format
+        )
         if result is not None:
             return result
 
@@ -62,7 +69,11 @@ class GeminiProvider:
         if self.fallback_model:
             print(f"🔄 Switching to fallback model: {self.fallback_model}")
             result = self._try_execute_with_model(
-                self.fallback_model, prompt, is_fallback=True, system_prompt=system_prompt
+                self.fallback_model,
+                prompt,
+                is_fallback=True,
+                system_prompt=system_prompt,
+                response_format=response_format,
             )
             if result is not None:
                 return result
@@ -75,7 +86,12 @@ class GeminiProvider:
         )
 
     def _try_execute_with_model(
-        self, model: str, prompt: str, is_fallback: bool = False, system_prompt: str | None = None
+        self,
+        model: str,
+        prompt: str,
+        is_fallback: bool = False,
+        system_prompt: str | None = None,
+        response_format: dict | None = None,
     ) -> str | None:
         """Try to execute with a specific model using all available API keys.
 
@@ -88,6 +104,7 @@ class GeminiProvider:
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
+        extra = {"response_format": response_format} if response_format else {}
 
         for key_idx in range(max_retries):
             api_key = self._keys[0]
@@ -103,6 +120,7 @@ class GeminiProvider:
                         temperature=self.temperature,
                         max_tokens=self.max_tokens,
                         api_key=api_key,
+                        **extra,
                     )
                     if not is_fallback and (key_idx > 0 or retry > 0):
                         print(f"✅ Success with API key {key_idx + 1}/{max_retries} (retry {retry + 1})")
@@ -142,33 +160,14 @@ class GeminiProvider:
         return f"gemini/{value}"
 
 
-def _voice_prompt_contract() -> str:
-    path = Path(__file__).parent.parent.parent / "config" / "voice_prompt_contract.txt"
-    text = path.read_text(encoding="utf-8").strip()
-    if not text:
-        raise ValueError("VOICE prompt contract must not be empty")
-    return text
-
-
-def load_prompt_template(template_name: str, run_id: str | None = None) -> str:
-    prompts_path = Path(__file__).parent.parent.parent / "config" / "prompts.yaml"
-    with open(prompts_path, "r", encoding="utf-8") as f:
-        prompts = yaml.safe_load(f)
-
-    section = prompts[template_name]
-    template = section["user_template"]
-    voice_contract = ""
-    if template_name == "script_generation":
-        voice_contract = _voice_prompt_contract()
-        template = f"{template.rstrip()}\n\n{voice_contract}\n"
+def load_prompt_template(template_name: str, run_id: str | None = None) -> PromptTemplate:
+    registry = get_prompt_registry()
+    template = registry.template(template_name)
 
     if run_id:
         from src.tracking import AimTracker
 
         tracker = AimTracker.get_instance(run_id)
-        raw_content = yaml.dump(section, allow_unicode=True, default_flow_style=False)
-        if voice_contract:
-            raw_content = f"{raw_content.rstrip()}\n\n# runtime voice contract\n{voice_contract}\n"
-        tracker.track_template_version(template_name, raw_content)
+        tracker.track_template_version(template_name, registry.tracked_source(template_name))
 
     return template
@@ -5,11 +5,12 @@ from datetime import datetime, timezone
 from typing import List
 
 import litellm
-import requests
 
 from src.models import NewsItem
 from src.providers.base import has_credentials
+from src.providers.http import http_session
 from src.utils.config import load_prompts
+from src.utils.prompt_registry import get_prompt_registry
 from src.utils.secrets import load_secret_values
 
 
@@ -31,13 +32,14 @@ class PerplexityNewsProvider:
         self.search_recency_filter = search_recency_filter
         self.api_keys = load_secret_values("PERPLEXITY_API_KEY")
         self.prompts = load_prompts()["news_collection"]
+        self.template = get_prompt_registry().template("news_collection")
 
     is_available = has_credentials
 
     def execute(self, query: str = "", count: int = 3, recent_topics_note: str = "") -> List[NewsItem]:
         topic = query or "最新の日本の金融・経済ニュース"
         recent_note = recent_topics_note or "直近テーマ情報なし"
-        prompt = self.prompts["user_template"].format(topic=topic, count=count, recent_topics_note=recent_note)
+        prompt = self.template.format(topic=topic, count=count, recent_topics_note=recent_note)
         api_key = self.api_keys[0]
 
         payload = {
@@ -52,7 +54,7 @@ class PerplexityNewsProvider:
         if self.search_recency_filter:
             payload["search_recency_filter"] = self.search_recency_filter
 
-        response = requests.post(
+        response = http_session(self.api_url).post(
             self.api_url,
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -97,6 +99,7 @@ class GeminiNewsProvider:
         self.max_tokens = max_tokens
         self.api_keys = load_secret_values("GEMINI_API_KEY")
         self.prompts = load_prompts()["news_collection"]
+        self.template = get_prompt_registry().template("news_collection")
 
     is_available = has_credentials
 
@@ -106,7 +109,7 @@ class GeminiNewsProvider:
         topic = query or "最新の日本の金融・経済ニュース"
         one_week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
         recent_note = recent_topics_note or "直近テーマ情報なし"
-        user_prompt = self.prompts["user_template"].format(
+        user_prompt = self.template.format(
             topic=topic,
             count=count,
             recent_topics_note=recent_note,
@@ -0,0 +1,252 @@
+"""Chunked client for Google's resumable upload protocol with a session that survives retries."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Protocol
+
+import requests
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CHUNK_ALIGNMENT = 256 * 1024
+RESUME_INCOMPLETE = 308
+
+
+class ResumableUploadError(RuntimeError):
+    pass
+
+
+class ChunkSource(Protocol):
+    """A file still being written: ``read`` blocks for data, ``total`` is known once it is complete."""
+
+    total: int | None
+
+    def read(self, offset: int, size: int) -> bytes: ...
+
+
+class ResumableUpload:
+    """Upload a file in fixed-size chunks, persisting the session URI and offset after every chunk.
+
+    A later call with the same ``state_path`` and an unchanged file asks the server how many bytes it
+    holds and continues from there instead of starting a new session.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        *,
+        chunk_size: int = 8 * 1024 * 1024,
+        state_path: Path | None = None,
+        max_retries: int = 5,
+        retry_backoff_seconds: float = 2.0,
+        timeout_seconds: float = 120.0,
+    ):
+        if chunk_size <= 0 or chunk_size % CHUNK_ALIGNMENT:
+            raise ValueError(f"chunk_size must be a positive multiple of {CHUNK_ALIGNMENT} bytes")
+        self.session = session
+        self.chunk_size = int(chunk_size)
+        self.state_path = Path(state_path) if state_path else None
+        self.max_retries = int(max_retries)
+        self.retry_backoff_seconds = float(retry_backoff_seconds)
+        self.timeout_seconds = float(timeout_seconds)
+        self.stats: Dict[str, float] = {}
+
+    def upload(
+        self,
+        path: Path,
+        url: str,
+        body: Dict[str, Any],
+        *,
+        params: Dict[str, str] | None = None,
+        content_type: str = "video/*",
+    ) -> Dict[str, Any]:
+        path = Path(path)
+        total = path.stat().st_size
+        fingerprint = self._fingerprint(path)
+        state = self._load_state(fingerprint)
+        offset = 0
+        if state:
+            session_uri = state["session_uri"]
+            queried = self._query_offset(session_uri, total)
+            if isinstance(queried, dict):
+                self._clear_state()
+                return queried
+            if queried is None:
+                logger.info("Resumable session expired; starting a new upload session")
+                session_uri = self._start(url, body, params, total, content_type)
+            else:
+                offset = queried
+                logger.info("Resuming upload of %s at %.1f MB", path.name, offset / 1_000_000)
+        else:
+            session_uri = self._start(url, body, params, total, content_type)
+        self._save_state(fingerprint, session_uri, offset)
+
+        def read(position: int) -> bytes:
+            with path.open("rb") as handle:
+                handle.seek(position)
+                return handle.read(self.chunk_size)
+
+        response = self._transfer(
+            session_uri,
+            offset,
+            read,
+            lambda: total,
+            lambda committed: self._save_state(fingerprint, session_uri, committed),
+        )
+        self._clear_state()
+        return response
+
+    def upload_stream(
+        self,
+        source: ChunkSource,
+        url: str,
+        body: Dict[str, Any],
+        *,
+        params: Dict[str, str] | None = None,
+        content_type: str = "video/*",
+    ) -> Dict[str, Any]:
+        """Upload a file that is still being written; the length is declared with the last chunk."""
+        session_uri = self._start(url, body, params, None, content_type)
+        return self._transfer(
+            session_uri, 0, lambda position: source.read(position, self.chunk_size), lambda: source.total, None
+        )
+
+    def _transfer(
+        self,
+        session_uri: str,
+        offset: int,
+        read: Callable[[int], bytes],
+        total_of: Callable[[], int | None],
+        on_commit: Callable[[int], None] | None,
+    ) -> Dict[str, Any]:
+        resumed_from = offset
+        started = time.perf_counter()
+        failures = 0
+        while True:
+            chunk = read(offset)
+            total = total_of()
+            size_label = str(total) if total is not None else "*"
+            end = offset + len(chunk) - 1
+            headers = {"Content-Range": f"bytes {offset}-{end}/{size_label}" if chunk else f"bytes */{size_label}"}
+            try:
+                response = self.session.put(session_uri, data=chunk, headers=headers, timeout=self.timeout_seconds)
+            except requests.RequestException as exc:
+                response, error = None, str(exc)
+            else:
+                error = f"HTTP {response.status_code}"
+            if response is not None and response.status_code in (200, 201):
+                self._record_stats(offset + len(chunk) - resumed_from, started, resumed_from)
+                return response.json()
+            if response is not None and response.status_code == RESUME_INCOMPLETE:
+                offset = self._committed(response)
+                failures = 0
+                if on_commit:
+                    on_commit(offset)
+                self._report(offset, total, resumed_from, started)
+                continue
+            if response is not None and response.status_code in (404, 410):
+                raise ResumableUploadError(f"Upload session expired at byte {offset}")
+            if response is not None and response.status_code < 500:
+                raise ResumableUploadError(f"Upload rejected: {error} {response.text[:200]}")
+            failures += 1
+            if failures > self.max_retries:
+                raise ResumableUploadError(f"Upload interrupted at byte {offset}: {error}")
+            logger.warning("Chunk at byte %s failed (%s); retry %s/%s", offset, error, failures, self.max_retries)
+            time.sleep(self.retry_backoff_seconds * 2 ** (failures - 1))
+            queried = self._query_offset(session_uri, total)
+            if isinstance(queried, dict):
+                self._record_stats(offset + len(chunk) - resumed_from, started, resumed_from)
+                return queried
+            if queried is not None:
+                offset = queried
+
+    def _start(
+        self, url: str, body: Dict[str, Any], params: Dict[str, str] | None, total: int | None, content_type: str
+    ) -> str:
+        headers = {"X-Upload-Content-Type": content_type}
+        if total is not None:
+            headers["X-Upload-Content-Length"] = str(total)
+        response = self.session.post(
+            url,
+            params={"uploadType": "resumable", **(params or {})},
+            json=body,
+            headers=headers,
+            timeout=self.timeout_seconds,
+        )
+        location = response.headers.get("Location")
+        if response.status_code != 200 or not location:
+            raise ResumableUploadError(f"Could not open upload session: HTTP {response.status_code}")
+        return location
+
+    def _query_offset(self, session_uri: str, total: int | None) -> int | Dict[str, Any] | None:
+        """Bytes the server already holds; the final response when it is complete; ``None`` when the session is gone."""
+        size_label = str(total) if total is not None else "*"
+        try:
+            response = self.session.put(
+                session_uri, data=b"", headers={"Content-Range": f"bytes */{size_label}"}, timeout=self.timeout_seconds
+            )
+        except requests.RequestException:
+            return None
+        if response.status_code in (200, 201):
+            return response.json()
+        if response.status_code == RESUME_INCOMPLETE:
+            return self._committed(response)
+        return None
+
+    @staticmethod
+    def _committed(response: requests.Response) -> int:
+        range_header = response.headers.get("Range")
+        if not range_header:
+            return 0
+        return int(range_header.rsplit("-", 1)[-1]) + 1
+
+    def _report(self, offset: int, total: int | None, resumed_from: int, started: float) -> None:
+        elapsed = max(time.perf_counter() - started, 1e-6)
+        rate = (offset - resumed_from) / elapsed
+        if total is None:
+            logger.info("Uploaded %.1f MB of a growing file at %.2f MB/s", offset / 1_000_000, rate / 1_000_000)
+            return
+        eta = (total - offset) / rate if rate > 0 else float("inf")
+        logger.info(
+            "Uploaded %.1f/%.1f MB (%.0f%%) at %.2f MB/s, ETA %.0fs",
+            offset / 1_000_000,
+            total / 1_000_000,
+            offset / total * 100 if total else 100,
+            rate / 1_000_000,
+            eta,
+        )
+
+    def _record_stats(self, sent: int, started: float, resumed_from: int) -> None:
+        elapsed = max(time.perf_counter() - started, 1e-6)
+        self.stats = {
+            "upload_seconds": round(elapsed, 3),
+            "upload_mb_per_second": round(sent / elapsed / 1_000_000, 3),
+            "resumed_from_bytes": resumed_from,
+        }
+
+    @staticmethod
+    def _fingerprint(path: Path) -> str:
+        stat = path.stat()
+        return f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _load_state(self, fingerprint: str) -> Dict[str, Any] | None:
+        if not self.state_path or not self.state_path.exists():
+            return None
+        state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        return state if state.get("fingerprint") == fingerprint and state.get("session_uri") else None
+
+    def _save_state(self, fingerprint: str, session_uri: str, offset: int) -> None:
+        if not self.state_path:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"fingerprint": fingerprint, "session_uri": session_uri, "offset": offset}
+        self.state_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def _clear_state(self) -> None:
+        if self.state_path:
+            self.state_path.unlink(missing_ok=True)
@@ -7,9 +7,10 @@ from io import BytesIO
 from pathlib import Path
 from typing import Dict, List
 
-import requests
 from pydub import AudioSegment
 
+from src.providers.http import http_session
+
 
 class VOICEVOXProvider:
     name = "voicevox"
@@ -36,6 +37,7 @@ class VOICEVOXProvider:
         self.auto_start = auto_start
         self.alias_ids = self._build_alias_ids(aliases or {})
         self.voice_parameters = voice_parameters or {}
+        self.session = http_session(self.url)
         if self.auto_start and self.manager_script:
             self._ensure_server()
 
@@ -79,7 +81,7 @@ class VOICEVOXProvider:
         return key
 
     def is_available(self) -> bool:
-        response = requests.get(f"{self.url}/version")
+        response = self.session.get(f"{self.url}/version")
         return response.status_code == 200
 
     def _get_voice_params(self, speaker: str, segment_type: str | None = None) -> Dict:
@@ -147,9 +149,12 @@ class VOICEVOXProvider:
         voice_params = self._get_voice_params(speaker, segment_type)
         voice_params.update(kwargs.get("voice_overrides") or {})
 
-        query = requests.post(
+        # The query only builds synthesis parameters, so it is safe to retry; synthesis is the expensive call
+        # and is left to the default POST policy.
+        query = self.session.post(
             f"{self.url}/audio_query",
             params={"text": text, "speaker": speaker_id},
+            idempotent=True,
         )
         query_data = query.json()
 
@@ -162,7 +167,7 @@ class VOICEVOXProvider:
         if "volumeScale" in voice_params:
             query_data["volumeScale"] = float(voice_params["volumeScale"])
 
-        synthesis = requests.post(
+        synthesis = self.session.post(
             f"{self.url}/synthesis",
             params={"speaker": speaker_id},
             json=query_data,
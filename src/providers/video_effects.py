@@ -18,10 +18,15 @@ class VideoEffectContext:
 
 class VideoEffect:
     name: str = ""
+    # Background effects depend only on the frame clock, so their output can be encoded once and reused.
+    background: bool = False
 
     def apply(self, stream: FilterableStream, context: VideoEffectContext) -> FilterableStream:
         raise NotImplementedError
 
+    def cache_key(self) -> Dict:
+        return {"type": self.name, **vars(self)}
+
 
 EFFECT_REGISTRY: Dict[str, Type[VideoEffect]] = {}
 
@@ -61,6 +66,13 @@ class VideoEffectPipeline:
             stream = effect.apply(stream, context)
         return stream
 
+    def split_background(self) -> Tuple["VideoEffectPipeline", "VideoEffectPipeline"]:
+        """Split into the leading run of background effects and the layers composited over it."""
+        index = 0
+        while index < len(self.effects) and self.effects[index].background:
+            index += 1
+        return VideoEffectPipeline(self.effects[:index]), VideoEffectPipeline(self.effects[index:])
+
     @classmethod
     def from_config(cls, config: Iterable[Dict] | None) -> "VideoEffectPipeline":
         effects = []
@@ -75,7 +87,13 @@ class VideoEffectPipeline:
 
 @register_effect
 class KenBurnsEffect(VideoEffect):
+    """Slow zoom and pan through FFmpeg's ``zoompan``.
+
+    ``internal_scale`` below 1 renders the motion at a reduced resolution and upscales the result.
+    """
+
     name = "ken_burns"
+    background = True
 
     def __init__(
         self,
@@ -83,23 +101,36 @@ class KenBurnsEffect(VideoEffect):
         max_zoom: float = 1.2,
         hold_frame_factor: float = 1.0,
         pan_mode: str = "center",
+        internal_scale: float = 1.0,
     ):
         self.zoom_speed = float(zoom_speed)
         self.max_zoom = float(max_zoom)
         self.hold_frame_factor = max(float(hold_frame_factor), 0.01)
         self.pan_mode = pan_mode
+        self.internal_scale = min(max(float(internal_scale), 0.1), 1.0)
 
     def apply(self, stream: FilterableStream, context: VideoEffectContext) -> FilterableStream:
+        width, height = context.resolution
+        inner_w, inner_h = self._internal_size(width, height)
         frames = max(int(round(self.hold_frame_factor)), 1)
         x_expr, y_expr = self._pan_expressions(context)
-        return stream.filter(
+        stream = stream.filter(
             "zoompan",
             z=f"min(zoom+{self.zoom_speed},{self.max_zoom})",
             d=frames,
-            s=f"{context.resolution[0]}x{context.resolution[1]}",
+            s=f"{inner_w}x{inner_h}",
             x=x_expr,
             y=y_expr,
         )
+        if (inner_w, inner_h) != (width, height):
+            stream = stream.filter("scale", width, height, flags="bicubic")
+        return stream
+
+    def _internal_size(self, width: int, height: int) -> Tuple[int, int]:
+        def even(value: float) -> int:
+            return max(2, int(round(value / 2)) * 2)
+
+        return even(width * self.internal_scale), even(height * self.internal_scale)
 
     def _pan_expressions(self, context: VideoEffectContext) -> Tuple[str, str]:
         center_x = "iw/2 - (iw/zoom/2)"
@@ -9,6 +9,7 @@ from typing import Any, Protocol
 
 import requests
 
+from src.providers.http import http_session
 from src.storyboard import ReferenceAsset, VideoStoryboard
 
 
@@ -119,7 +120,7 @@ class MiniMaxH3Provider:
         timeout_seconds: float = 30.0,
     ) -> None:
         self.api_key = api_key or os.getenv("MINIMAX_API_KEY", "")
-        self.session = session or requests.Session()
+        self.session = session or http_session(self.create_url)
         self.compiler = compiler or StoryboardPromptCompiler()
         self.timeout_seconds = timeout_seconds
 
@@ -7,12 +7,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
-from google.auth.transport.requests import Request
+import requests
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 
+from src.providers.resumable_upload import ChunkSource, ResumableUpload
 from src.utils.logger import get_logger
 from src.utils.secrets import load_secret_values
 
@@ -25,10 +27,12 @@ class PublicationGateError(RuntimeError):
 
 class YouTubeClient:
     SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
+    CAPTIONS_SCOPE = "https://www.googleapis.com/auth/youtube.force-ssl"
     EXTERNAL_APPROVAL_ENV = "YOUTUBE_EXTERNAL_PUBLISH_APPROVED"
     PUBLIC_APPROVAL_ENV = "YOUTUBE_PUBLIC_VISIBILITY_APPROVED"
     APPROVAL_VALUE = "I_UNDERSTAND_THIS_UPLOADS_EXTERNALLY"
     PUBLIC_APPROVAL_VALUE = "I_UNDERSTAND_THIS_WILL_BE_PUBLIC"
+    UPLOAD_URL = "https://www.googleapis.com/upload/youtube/v3/videos"
 
     def __init__(
         self,
@@ -40,6 +44,15 @@ class YouTubeClient:
         max_title_length: int = 100,
         max_description_length: int = 5000,
         token_file: str | Path = "token.json",
+        upload_captions: bool = False,
+        caption_language: str = "ja",
+        caption_name: str = "",
+        service: Any | None = None,
+        session: requests.Session | None = None,
+        upload_url: str | None = None,
+        upload_chunk_size: int = 8 * 1024 * 1024,
+        upload_max_retries: int = 5,
+        upload_retry_backoff_seconds: float = 2.0,
     ):
         self.dry_run = bool(dry_run)
         self.default_visibility = self._validate_visibility(default_visibility)
@@ -48,7 +61,16 @@ class YouTubeClient:
         self.max_title_length = int(max_title_length)
         self.max_description_length = int(max_description_length)
         self.token_file = Path(token_file)
+        self.upload_captions = bool(upload_captions)
+        self.caption_language = str(caption_language)
+        self.caption_name = str(caption_name)
+        self.scopes = list(self.SCOPES) + ([self.CAPTIONS_SCOPE] if self.upload_captions else [])
         self.service = None
+        self.session = None
+        self.upload_url = upload_url or self.UPLOAD_URL
+        self.upload_chunk_size = int(upload_chunk_size)
+        self.upload_max_retries = int(upload_max_retries)
+        self.upload_retry_backoff_seconds = float(upload_retry_backoff_seconds)
 
         if self.max_title_length < 1 or self.max_description_length < 1:
             raise ValueError("metadata length limits must be positive")
@@ -57,12 +79,22 @@ class YouTubeClient:
             self._require_external_approval()
             if self.default_visibility == "public":
                 self._require_public_approval()
+            if service is not None or session is not None:
+                self.service = service
+                self.session = session
+                return
             creds = self._get_credentials()
             if not creds:
                 raise ValueError("Failed to obtain YouTube OAuth credentials")
             self.service = build("youtube", "v3", credentials=creds)
+            self.session = AuthorizedSession(creds)
             logger.info("YouTube API service initialized after explicit publication approval")
 
+    @property
+    def streams_uploads(self) -> bool:
+        """Whether ``upload`` can take a file that is still being encoded."""
+        return not self.dry_run and self.session is not None
+
     @staticmethod
     def _validate_visibility(value: str) -> str:
         visibility = str(value).strip().lower()
@@ -93,7 +125,7 @@ class YouTubeClient:
         if self.token_file.exists():
             try:
                 creds = Credentials.from_authorized_user_file(
-                    str(self.token_file), self.SCOPES
+                    str(self.token_file), self.scopes
                 )
             except (ValueError, json.JSONDecodeError) as exc:
                 raise ValueError(
@@ -117,7 +149,7 @@ class YouTubeClient:
 
     def _has_required_scopes(self, creds: Credentials) -> bool:
         scopes = set(creds.scopes or ())
-        return all(scope in scopes for scope in self.SCOPES)
+        return all(scope in scopes for scope in self.scopes)
 
     def _run_oauth_flow(self) -> Credentials:
         client_id = load_secret_values("YOUTUBE_CLIENT_ID")
@@ -136,7 +168,7 @@ class YouTubeClient:
                 "redirect_uris": ["http://localhost"],
             }
         }
-        flow = InstalledAppFlow.from_client_config(config, self.SCOPES)
+        flow = InstalledAppFlow.from_client_config(config, self.scopes)
         logger.info("Opening browser for YouTube OAuth authentication")
         return flow.run_local_server(port=8080)
 
@@ -167,11 +199,20 @@ class YouTubeClient:
         video_path: Path,
         metadata: Dict[str, Any],
         thumbnail_path: Path | None = None,
+        captions_path: Path | None = None,
+        session_path: Path | None = None,
+        stream: ChunkSource | None = None,
     ) -> Dict[str, Any]:
+        """Upload ``video_path``; ``session_path`` keeps the resumable session so a retried step can continue.
+
+        ``stream`` uploads ``video_path`` while it is still being written (see ``streams_uploads``).
+        """
         video_path = Path(video_path)
         if not video_path.exists() or not video_path.is_file():
             raise FileNotFoundError(f"Video file not found: {video_path}")
-        if video_path.stat().st_size == 0:
+        if stream is not None and not self.streams_uploads:
+            raise ValueError("Streaming upload needs a live resumable upload session")
+        if stream is None and video_path.stat().st_size == 0:
             raise ValueError("Video file is empty")
 
         prepared = self.prepare_metadata(metadata)
@@ -180,6 +221,9 @@ class YouTubeClient:
             raise FileNotFoundError(f"Thumbnail file not found: {thumbnail}")
         if thumbnail and thumbnail.stat().st_size == 0:
             thumbnail = None
+        captions = Path(captions_path) if captions_path and self.upload_captions else None
+        if captions and (not captions.is_file() or captions.stat().st_size == 0):
+            captions = None
 
         if self.dry_run:
             return {
@@ -188,12 +232,13 @@ class YouTubeClient:
                 "external_side_effect": False,
                 "metadata": prepared,
                 "thumbnail_path": str(thumbnail) if thumbnail else None,
+                "captions_path": str(captions) if captions else None,
             }
 
         self._require_external_approval()
         if prepared["visibility"] == "public":
             self._require_public_approval()
-        if self.service is None:
+        if self.service is None and self.session is None:
             raise PublicationGateError("YouTube service is not initialized")
 
         body = {
@@ -210,17 +255,39 @@ class YouTubeClient:
         }
         file_size = video_path.stat().st_size
         logger.info(
-            "Uploading reviewed video: %s (%s bytes, visibility=%s)",
+            "Uploading reviewed video: %s (%s bytes%s, visibility=%s)",
             video_path,
             file_size,
+            " so far, still encoding" if stream is not None else "",
             prepared["visibility"],
         )
-        media = MediaFileUpload(str(video_path), chunksize=-1, resumable=True)
-        response = (
-            self.service.videos()
-            .insert(part="snippet,status", body=body, media_body=media)
-            .execute()
-        )
+        upload_stats: Dict[str, float] = {}
+        if self.session is not None:
+            uploader = ResumableUpload(
+                self.session,
+                chunk_size=self.upload_chunk_size,
+                state_path=session_path,
+                max_retries=self.upload_max_retries,
+                retry_backoff_seconds=self.upload_retry_backoff_seconds,
+            )
+            if stream is not None:
+                response = uploader.upload_stream(
+                    stream, self.upload_url, body, params={"part": "snippet,status"}
+                )
+                # The part file may already have been moved into place; the stream knows its final size.
+                file_size = stream.total
+            else:
+                response = uploader.upload(
+                    video_path, self.upload_url, body, params={"part": "snippet,status"}
+                )
+            upload_stats = uploader.stats
+        else:
+            media = MediaFileUpload(str(video_path), chunksize=-1, resumable=True)
+            response = (
+                self.service.videos()
+                .insert(part="snippet,status", body=body, media_body=media)
+                .execute()
+            )
         video_id = response.get("id")
         if not video_id:
             raise RuntimeError("YouTube API response did not include a video id")
@@ -231,7 +298,7 @@ class YouTubeClient:
                 videoId=video_id, media_body=thumb_media
             ).execute()
 
-        return {
+        result = {
             "video_id": video_id,
             "status": "uploaded",
             "external_side_effect": True,
@@ -240,7 +307,34 @@ class YouTubeClient:
             "file_size": file_size,
             "metadata": prepared,
             "thumbnail_path": str(thumbnail) if thumbnail else None,
+            "captions_path": str(captions) if captions else None,
+            **upload_stats,
         }
+        if captions:
+            # The video is already live on YouTube; a caption failure must not make the step retry the upload.
+            try:
+                result["caption_id"] = self.upload_caption(video_id, captions)
+            except Exception as exc:
+                logger.warning("Caption upload failed for %s: %s", video_id, exc)
+                result["caption_error"] = str(exc)
+        return result
+
+    def upload_caption(self, video_id: str, captions_path: Path, caption_id: str | None = None) -> str:
+        """Insert a caption track, or replace ``caption_id`` in place when fixing subtitles."""
+        self._require_external_approval()
+        if self.service is None:
+            raise PublicationGateError("YouTube service is not initialized")
+        media = MediaFileUpload(str(captions_path), mimetype="application/octet-stream")
+        snippet = {"videoId": video_id, "language": self.caption_language, "name": self.caption_name, "isDraft": False}
+        if caption_id:
+            request = self.service.captions().update(
+                part="snippet", body={"id": caption_id, "snippet": snippet}, media_body=media
+            )
+        else:
+            request = self.service.captions().insert(part="snippet", body={"snippet": snippet}, media_body=media)
+        response = request.execute()
+        logger.info("Uploaded captions %s for video %s", captions_path, video_id)
+        return str(response.get("id") or caption_id or "")
 
     def _merge_tags(self, tags: Iterable[str]) -> List[str]:
         seen = set()
@@ -0,0 +1,87 @@
+"""Measured encoder settings and the rule for picking one per render."""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from pydantic import BaseModel, Field
+
+SSIM_PATTERN = re.compile(r"SSIM .*All:([0-9.]+)")
+PSNR_PATTERN = re.compile(r"PSNR .*average:([0-9.]+|inf)")
+
+
+class EncoderProfile(BaseModel):
+    codec: str
+    preset: str
+    crf: int
+    threads: int = 0
+    resolution: str
+    encode_fps: float
+    kbps: float
+    ssim: float
+    psnr: float
+    measured_at: datetime = Field(default_factory=datetime.now)
+
+    def encoder_options(self) -> Dict[str, str]:
+        options = {"vcodec": self.codec, "preset": self.preset, "crf": str(self.crf)}
+        if self.threads:
+            options["threads"] = str(self.threads)
+        return options
+
+
+def parse_quality(log: str) -> tuple[float, float]:
+    """Read the SSIM ``All`` score and the average PSNR from ffmpeg's stderr."""
+    ssim = SSIM_PATTERN.findall(log)
+    psnr = PSNR_PATTERN.findall(log)
+    if not ssim or not psnr:
+        raise ValueError("ffmpeg output has no SSIM/PSNR summary")
+    return float(ssim[-1]), float(psnr[-1])
+
+
+class EncoderProfileStore:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load(self) -> List[EncoderProfile]:
+        if not self.path.exists():
+            return []
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        return [EncoderProfile.model_validate(item) for item in data.get("profiles", [])]
+
+    def record(self, profiles: Iterable[EncoderProfile]) -> None:
+        """Replace earlier measurements of the same settings and keep the rest."""
+        merged = {self._key(profile): profile for profile in self.load()}
+        merged.update({self._key(profile): profile for profile in profiles})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"profiles": [profile.model_dump(mode="json") for profile in merged.values()]}
+        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def select(
+        self,
+        resolution: str,
+        *,
+        min_ssim: float = 0.0,
+        max_kbps: float | None = None,
+        codecs: Iterable[str] | None = None,
+    ) -> EncoderProfile | None:
+        """Fastest measured profile at ``resolution`` that meets the quality and size targets."""
+        allowed = set(codecs) if codecs else None
+        candidates = [
+            profile
+            for profile in self.load()
+            if profile.resolution == resolution
+            and profile.ssim >= min_ssim
+            and (max_kbps is None or profile.kbps <= max_kbps)
+            and (allowed is None or profile.codec in allowed)
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda profile: (profile.encode_fps, profile.ssim))
+
+    @staticmethod
+    def _key(profile: EncoderProfile) -> tuple:
+        return profile.codec, profile.preset, profile.crf, profile.threads, profile.resolution
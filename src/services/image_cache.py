@@ -0,0 +1,191 @@
+"""Content-addressed disk cache for generated images, bounded by total size with least-recently-used eviction.
+
+Scene prompts and seeds are deterministic, so a rerun asks for exactly the images an earlier run produced.
+Entries are keyed by everything that determines the output: model, prompts, size, steps, guidance and seed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List
+
+from PIL import Image
+
+from src.services.image_generation import ImageGenerationRequest, ImageGenerationResult, ImageGenerationService
+from src.utils.config import ImageCacheConfig
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def image_cache_key(
+    model: str,
+    prompt: str,
+    negative_prompt: str,
+    width: int,
+    height: int,
+    steps: int,
+    guidance: float,
+    seed: int | None,
+) -> str:
+    fields = [model, prompt, negative_prompt, int(width), int(height), int(steps), float(guidance), seed]
+    return hashlib.sha256(json.dumps(fields, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class ImageCache:
+    """One file per entry under ``directory``; a hit refreshes the file's mtime, eviction removes the oldest.
+
+    The running size is counted once and then tracked on every write, so the directory is rescanned only
+    when the limit is exceeded. Several processes may share a directory: writes are atomic renames and
+    eviction tolerates files that another process already removed.
+    """
+
+    suffix = ".img"
+
+    def __init__(self, directory: Path | str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> bytes | None:
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        path = self.path(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_bytes(data)
+        temporary.replace(path)
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> List[os.DirEntry]:
+        if not self.directory.exists():
+            return []
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(self.suffix) and entry.is_file()]
+
+    def _scan_size(self) -> int:
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _evict(self) -> None:
+        stats = []
+        for entry in self._entries():
+            try:
+                stats.append((entry.stat().st_mtime, entry.stat().st_size, entry.path))
+            except FileNotFoundError:
+                continue
+        stats.sort()
+        total = sum(size for _, size, _ in stats)
+        evicted = 0
+        for _, size, path in stats:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+        self._size = total
+        logger.info("Evicted %d cached images; cache now %.1f MB", evicted, total / 1_000_000)
+
+
+def build_image_cache(config: ImageCacheConfig) -> ImageCache | None:
+    if not config.enabled:
+        return None
+    return ImageCache(config.directory, config.max_size_mb * 1024 * 1024)
+
+
+def with_cache(service: ImageGenerationService | None, cache: ImageCache | None) -> ImageGenerationService | None:
+    """``service`` behind ``cache`` when both are present, otherwise ``service`` unchanged."""
+    if service is None or cache is None:
+        return service
+    return CachedImageService(service, cache)
+
+
+class CachedImageService:
+    """``ImageGenerationService`` that answers repeated requests from an ``ImageCache``.
+
+    ``generate_batch`` sends only the misses to the wrapped service, in one call, and returns results
+    in request order.
+    """
+
+    def __init__(self, service: ImageGenerationService, cache: ImageCache, model_id: str | None = None):
+        self.service = service
+        self.cache = cache
+        self.model_id = model_id or getattr(service, "model_id", None) or type(service).__name__
+        self.hits = 0
+        self.misses = 0
+
+    def is_available(self) -> bool:
+        return self.service.is_available()
+
+    def generate(self, request: ImageGenerationRequest) -> ImageGenerationResult:
+        return self.generate_batch([request])[0]
+
+    def generate_batch(self, requests: List[ImageGenerationRequest]) -> List[ImageGenerationResult]:
+        keys = [self.key(request) for request in requests]
+        results: List[ImageGenerationResult | None] = []
+        misses: Dict[str, List[int]] = {}
+        for index, (request, key) in enumerate(zip(requests, keys)):
+            data = self.cache.get(key)
+            if data is None:
+                misses.setdefault(key, []).append(index)
+                results.append(None)
+                continue
+            image = Image.open(BytesIO(data))
+            image.load()
+            results.append(ImageGenerationResult(image=image, seed=_seed(request), prompt=request.prompt))
+
+        missed = sum(len(indices) for indices in misses.values())
+        self.hits += len(requests) - missed
+        self.misses += missed
+        logger.info("Image cache: %d hits, %d misses", len(requests) - missed, missed)
+        if misses:
+            generated = self.service.generate_batch([requests[indices[0]] for indices in misses.values()])
+            for (key, indices), result in zip(misses.items(), generated):
+                buffer = BytesIO()
+                result.image.save(buffer, format="PNG")
+                self.cache.put(key, buffer.getvalue())
+                for index in indices:
+                    results[index] = result
+        return results
+
+    def key(self, request: ImageGenerationRequest) -> str:
+        return image_cache_key(
+            self.model_id,
+            request.prompt,
+            request.negative_prompt,
+            request.width,
+            request.height,
+            request.num_inference_steps,
+            request.guidance_scale,
+            request.seed,
+        )
+
+
+def _seed(request: ImageGenerationRequest) -> int:
+    return request.seed if request.seed is not None else 42
@@ -1,4 +1,8 @@
-"""Service layer for image generation using diffusion models."""
+"""Service layer for image generation using diffusion models.
+
+torch and diffusers are imported only when a pipeline is actually loaded, so clients of the image worker
+(``src.services.image_worker``) never pay for them.
+"""
 
 from __future__ import annotations
 
@@ -6,8 +10,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, List, Protocol
 
-import torch
-
 
 @dataclass
 class ImageGenerationRequest:
@@ -66,6 +68,7 @@ class ZImageTurboService:
             compile_model: Whether to compile model with torch.compile
         """
         self.model_path = Path(model_path)
+        self.model_id = f"z-image-turbo:{self.model_path.name}"
         self.device = device
         self.batch_size = batch_size
         self.compile_model = compile_model
@@ -76,6 +79,10 @@ class ZImageTurboService:
         """Check if Z-Image-Turbo is available."""
         return self.model_path.exists()
 
+    def warm_up(self) -> None:
+        """Load the pipeline now rather than on the first request."""
+        self._ensure_pipeline()
+
     def generate(self, request: ImageGenerationRequest) -> ImageGenerationResult:
         """Generate a single image."""
         results = self.generate_batch([request])
@@ -105,6 +112,8 @@ class ZImageTurboService:
         requests: List[ImageGenerationRequest],
     ) -> List[ImageGenerationResult]:
         """Generate a single batch of images."""
+        import torch
+
         # Prepare batch inputs
         prompts = [req.prompt for req in requests]
         negative_prompts = [req.negative_prompt for req in requests]
@@ -160,6 +169,7 @@ class ZImageTurboService:
     def _ensure_pipeline(self) -> Any:
         """Lazy load and optionally compile the pipeline."""
         if self._pipeline is None:
+            import torch
             from diffusers import ZImagePipeline
 
             self._pipeline = ZImagePipeline.from_pretrained(
@@ -0,0 +1,334 @@
+"""Long-lived local worker that keeps the diffusion pipeline loaded and serves image requests over a socket.
+
+Loading Z-Image-Turbo takes far longer than generating a handful of images, so workflow runs, the gallery
+script and thumbnail generation connect to one resident worker instead of each loading the pipeline.
+
+Every message is a 4-byte big-endian length followed by a JSON object. A client sends
+``{"op": "generate", "requests": [...]}`` and receives ``{"results": [...]}`` with base64 PNG images,
+or ``{"error": "..."}``; ``{"op": "ping"}`` answers ``{"ok": true, "backend": ..., "model_id": ...}``.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from io import BytesIO
+from typing import Any, Dict, List, Tuple
+
+from PIL import Image
+
+from src.services.image_generation import (
+    ImageGenerationRequest,
+    ImageGenerationResult,
+    ImageGenerationService,
+    ZImageTurboService,
+)
+from src.utils.config import ImageWorkerConfig
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+HEADER = struct.Struct(">I")
+MAX_MESSAGE_BYTES = 512 * 1024 * 1024
+
+
+class ImageWorkerError(RuntimeError):
+    """The worker could not be reached or failed to generate the requested images."""
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def send_message(sock: socket.socket, payload: Dict[str, Any]) -> None:
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def receive_message(sock: socket.socket) -> Dict[str, Any] | None:
+    """Next message on ``sock``, or ``None`` when the peer closed the connection."""
+    header = _receive_exactly(sock, HEADER.size)
+    if header is None:
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_MESSAGE_BYTES:
+        raise ImageWorkerError(f"Message of {length} bytes exceeds the {MAX_MESSAGE_BYTES} byte limit")
+    body = _receive_exactly(sock, length) if length else b""
+    if body is None:
+        raise ImageWorkerError("Connection closed in the middle of a message")
+    return json.loads(body.decode("utf-8"))
+
+
+def _receive_exactly(sock: socket.socket, size: int) -> bytes | None:
+    chunks = bytearray()
+    while len(chunks) < size:
+        chunk = sock.recv(min(size - len(chunks), 1 << 20))
+        if not chunk:
+            if chunks:
+                raise ImageWorkerError("Connection closed in the middle of a message")
+            return None
+        chunks.extend(chunk)
+    return bytes(chunks)
+
+
+def encode_image(image: Image.Image) -> str:
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def decode_image(data: str) -> Image.Image:
+    image = Image.open(BytesIO(base64.b64decode(data)))
+    image.load()
+    return image
+
+
+class StubImageBackend:
+    """CPU-only backend that paints each request a solid colour derived from its prompt and seed.
+
+    It records the size of every batch it is handed, so tests can check how the worker coalesces requests.
+    """
+
+    name = "stub"
+    model_id = "stub"
+
+    def __init__(self, delay_seconds: float = 0.0):
+        self.delay_seconds = delay_seconds
+        self.batches: List[int] = []
+
+    def is_available(self) -> bool:
+        return True
+
+    def generate(self, request: ImageGenerationRequest) -> ImageGenerationResult:
+        return self.generate_batch([request])[0]
+
+    def generate_batch(self, requests: List[ImageGenerationRequest]) -> List[ImageGenerationResult]:
+        self.batches.append(len(requests))
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        results = []
+        for request in requests:
+            seed = request.seed if request.seed is not None else 42
+            colour = tuple(hashlib.sha256(f"{request.prompt}|{seed}".encode("utf-8")).digest()[:3])
+            image = Image.new("RGB", (request.width, request.height), colour)
+            results.append(ImageGenerationResult(image=image, seed=seed, prompt=request.prompt))
+        return results
+
+
+@dataclass
+class _Job:
+    requests: List[ImageGenerationRequest]
+    done: threading.Event = field(default_factory=threading.Event)
+    results: List[ImageGenerationResult] = field(default_factory=list)
+    error: str | None = None
+
+
+class ImageWorker:
+    """Single GPU thread that drains a queue of jobs, merging whatever is waiting into one backend call.
+
+    Jobs from different clients are combined while the total stays within ``max_batch`` requests; a job
+    that would overflow the batch starts the next one instead. A job is never split, so a single large
+    job still goes through in one call.
+    """
+
+    def __init__(self, backend: ImageGenerationService, max_batch: int = 4):
+        self.backend = backend
+        self.max_batch = max(1, int(max_batch))
+        self._queue: queue.Queue[_Job | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._serve_queue, name="image-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, requests: List[ImageGenerationRequest]) -> _Job:
+        job = _Job(list(requests))
+        if not job.requests:
+            job.done.set()
+        else:
+            self._queue.put(job)
+        return job
+
+    def generate_batch(self, requests: List[ImageGenerationRequest]) -> List[ImageGenerationResult]:
+        job = self.submit(requests)
+        job.done.wait()
+        if job.error:
+            raise ImageWorkerError(job.error)
+        return job.results
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _serve_queue(self) -> None:
+        carried: _Job | None = None
+        while True:
+            job, carried = carried or self._queue.get(), None
+            if job is None:
+                return
+            jobs = [job]
+            total = len(job.requests)
+            while total < self.max_batch:
+                try:
+                    waiting = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if waiting is None:
+                    self._queue.put(None)
+                    break
+                if total + len(waiting.requests) > self.max_batch:
+                    # Held here rather than requeued, so it keeps its place ahead of later jobs.
+                    carried = waiting
+                    break
+                jobs.append(waiting)
+                total += len(waiting.requests)
+            self._run(jobs)
+
+    def _run(self, jobs: List[_Job]) -> None:
+        requests = [request for job in jobs for request in job.requests]
+        started = time.perf_counter()
+        try:
+            results = self.backend.generate_batch(requests)
+        except Exception as exc:  # noqa: BLE001 - the error is handed back to every waiting client
+            logger.exception("Image batch of %d failed", len(requests))
+            for job in jobs:
+                job.error = f"{type(exc).__name__}: {exc}"
+                job.done.set()
+            return
+        logger.info("Generated %d images for %d jobs in %.1fs", len(requests), len(jobs), time.perf_counter() - started)
+        offset = 0
+        for job in jobs:
+            job.results = results[offset : offset + len(job.requests)]
+            offset += len(job.requests)
+            job.done.set()
+
+
+class _WorkerHandler(socketserver.BaseRequestHandler):
+    server: "ImageWorkerServer"
+
+    def handle(self) -> None:
+        while True:
+            message = receive_message(self.request)
+            if message is None:
+                return
+            try:
+                reply = self.server.respond(message)
+            except Exception as exc:  # noqa: BLE001 - reported to the client instead of dropping the connection
+                logger.warning("Rejected image worker request: %s", exc)
+                reply = {"error": f"{type(exc).__name__}: {exc}"}
+            send_message(self.request, reply)
+
+
+class ImageWorkerServer(socketserver.ThreadingTCPServer):
+    """Socket front end for an ``ImageWorker``; one thread per connection, one GPU thread behind them."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address: str, backend: ImageGenerationService, max_batch: int = 4):
+        super().__init__(parse_address(address), _WorkerHandler)
+        self.backend_name = getattr(backend, "name", type(backend).__name__)
+        self.model_id = getattr(backend, "model_id", self.backend_name)
+        self.worker = ImageWorker(backend, max_batch=max_batch)
+
+    @property
+    def address(self) -> str:
+        host, port = self.server_address[:2]
+        return f"{host}:{port}"
+
+    def respond(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        if op == "ping":
+            return {"ok": True, "backend": self.backend_name, "model_id": self.model_id}
+        if op != "generate":
+            return {"error": f"Unknown op: {op}"}
+        job = self.worker.submit([ImageGenerationRequest(**item) for item in message.get("requests", [])])
+        job.done.wait()
+        if job.error:
+            return {"error": job.error}
+        return {
+            "results": [
+                {"image": encode_image(result.image), "seed": result.seed, "prompt": result.prompt}
+                for result in job.results
+            ]
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.worker.close()
+
+
+class ImageWorkerClient:
+    """``ImageGenerationService`` that forwards every batch to a running ``ImageWorkerServer``."""
+
+    def __init__(self, address: str, timeout_seconds: float = 900.0, connect_timeout_seconds: float = 2.0):
+        self.address = address
+        self.timeout_seconds = timeout_seconds
+        self.connect_timeout_seconds = connect_timeout_seconds
+        self.model_id: str | None = None
+
+    def is_available(self) -> bool:
+        """Ping the worker; a successful ping also records which model it serves."""
+        try:
+            reply = self._call({"op": "ping"}, self.connect_timeout_seconds)
+        except (OSError, ImageWorkerError):
+            return False
+        self.model_id = reply.get("model_id")
+        return bool(reply.get("ok"))
+
+    def generate(self, request: ImageGenerationRequest) -> ImageGenerationResult:
+        return self.generate_batch([request])[0]
+
+    def generate_batch(self, requests: List[ImageGenerationRequest]) -> List[ImageGenerationResult]:
+        if not requests:
+            return []
+        try:
+            reply = self._call(
+                {"op": "generate", "requests": [asdict(request) for request in requests]}, self.timeout_seconds
+            )
+        except OSError as exc:
+            raise ImageWorkerError(f"Image worker at {self.address} is unreachable: {exc}") from exc
+        if "error" in reply:
+            raise ImageWorkerError(reply["error"])
+        return [
+            ImageGenerationResult(image=decode_image(item["image"]), seed=item["seed"], prompt=item["prompt"])
+            for item in reply["results"]
+        ]
+
+    def _call(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        with socket.create_connection(parse_address(self.address), timeout=self.connect_timeout_seconds) as sock:
+            sock.settimeout(timeout)
+            send_message(sock, payload)
+            reply = receive_message(sock)
+        if reply is None:
+            raise ImageWorkerError(f"Image worker at {self.address} closed the connection")
+        return reply
+
+
+def build_backend(config: ImageWorkerConfig) -> ImageGenerationService:
+    """Backend the worker process keeps resident: the real pipeline, or the stub for CPU-only machines."""
+    if config.backend == "stub":
+        return StubImageBackend()
+    return ZImageTurboService(
+        model_path=config.model_path,
+        device=config.device,
+        batch_size=config.batch_size,
+        compile_model=config.compile_model,
+    )
+
+
+def connect_image_worker(config: ImageWorkerConfig) -> ImageWorkerClient | None:
+    """Client for the configured worker, or ``None`` when it is disabled or not running."""
+    if not config.enabled:
+        return None
+    client = ImageWorkerClient(config.address, timeout_seconds=config.timeout_seconds)
+    if not client.is_available():
+        logger.warning("Image worker at %s is not running; using the default image backend instead", config.address)
+        return None
+    return client
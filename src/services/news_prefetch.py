@@ -0,0 +1,112 @@
+"""Prefetch news candidates shortly before each scheduled workflow run."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Set, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CRON_FIELDS: Tuple[Tuple[int, int], ...] = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+MAX_LOOKAHEAD = timedelta(days=8)
+
+
+def _parse_field(field: str, low: int, high: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in field.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start, end = (int(value) for value in base.split("-", 1))
+        else:
+            start = int(base)
+            end = high if step_text else start
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"Invalid cron field: {field}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse_cron(expression: str) -> List[Set[int]]:
+    """Parse a five-field cron expression into sets of allowed values."""
+    fields = expression.split()
+    if len(fields) != 5:
+        raise ValueError(f"Expected 5 cron fields, got {len(fields)}: {expression}")
+    parsed = [_parse_field(field, low, high) for field, (low, high) in zip(fields, CRON_FIELDS)]
+    if 7 in parsed[4]:
+        parsed[4] = (parsed[4] - {7}) | {0}
+    return parsed
+
+
+def cron_matches(expression: str, moment: datetime) -> bool:
+    minutes, hours, days, months, weekdays = parse_cron(expression)
+    dom_any, dow_any = expression.split()[2] == "*", expression.split()[4] == "*"
+    day_ok = moment.day in days
+    weekday_ok = (moment.weekday() + 1) % 7 in weekdays
+    if dom_any or dow_any:
+        day_match = day_ok and weekday_ok
+    else:
+        day_match = day_ok or weekday_ok
+    return moment.minute in minutes and moment.hour in hours and moment.month in months and day_match
+
+
+def next_fire_time(expression: str, after: datetime) -> datetime | None:
+    """First minute strictly after ``after`` matching ``expression`` (within eight days)."""
+    parse_cron(expression)
+    moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    limit = after + MAX_LOOKAHEAD
+    while moment <= limit:
+        if cron_matches(expression, moment):
+            return moment
+        moment += timedelta(minutes=1)
+    return None
+
+
+class NewsPrefetcher:
+    """Warm the news candidate cache ``lead`` minutes before each cron fire time."""
+
+    def __init__(
+        self,
+        prefetch: Callable[[], object],
+        crons: Iterable[str],
+        lead_minutes: float = 5,
+    ):
+        self.prefetch = prefetch
+        self.crons = list(crons)
+        self.lead = timedelta(minutes=lead_minutes)
+        self._handled: Set[datetime] = set()
+
+    def upcoming(self, now: datetime) -> datetime | None:
+        fire_times = [next_fire_time(cron, now) for cron in self.crons]
+        return min((fire for fire in fire_times if fire is not None), default=None)
+
+    def due(self, now: datetime) -> datetime | None:
+        """Return the upcoming fire time if ``now`` is inside its prefetch window and it is not handled yet."""
+        fire = self.upcoming(now)
+        if fire is None or fire in self._handled or fire - now > self.lead:
+            return None
+        return fire
+
+    def run_once(self, now: datetime | None = None) -> bool:
+        now = now or datetime.now()
+        fire = self.due(now)
+        if fire is None:
+            return False
+        self._handled.add(fire)
+        logger.info("Prefetching news for run scheduled at %s", fire.isoformat())
+        try:
+            self.prefetch()
+        except Exception as exc:
+            logger.warning("News prefetch failed; the run will fetch live: %s", exc)
+        return True
+
+    def run_forever(self, poll_seconds: float = 30) -> None:
+        logger.info("News prefetcher watching %s schedule(s), lead %s", len(self.crons), self.lead)
+        while True:
+            self.run_once()
+            time.sleep(poll_seconds)
@@ -0,0 +1,161 @@
+"""Cumulative podcast feed kept as an append-only episode index plus write-once archive pages."""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, List
+
+from feedgen.feed import FeedGenerator
+from lxml import etree
+from pydantic import BaseModel, Field
+
+from src.utils.config import PodcastStepConfig
+
+TAIL_BLOCK_SIZE = 64 * 1024
+ATOM_NS = "http://www.w3.org/2005/Atom"
+HISTORY_NS = "http://purl.org/syndication/history/1.0"
+
+
+class Episode(BaseModel):
+    guid: str
+    title: str
+    description: str
+    enclosure_url: str
+    length: int
+    mime_type: str
+    duration_seconds: float
+    published: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class EpisodeIndex:
+    """``episodes.jsonl`` holds one episode per line; ``episodes.meta.json`` keeps the running count.
+
+    Appending and reading the newest entries touch only the end of the file, so the cost of publishing
+    does not grow with the back catalogue.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.meta_path = self.path.with_suffix(".meta.json")
+
+    def count(self) -> int:
+        if not self.meta_path.exists():
+            return 0
+        return int(json.loads(self.meta_path.read_text(encoding="utf-8"))["episodes"])
+
+    def append(self, episode: Episode, window: int = 1) -> bool:
+        """Add ``episode`` unless it is among the newest ``window`` entries; returns whether it was added."""
+        if any(existing.guid == episode.guid for existing in self.tail(window)):
+            return False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(episode.model_dump_json() + "\n")
+        _write_atomic(self.meta_path, json.dumps({"episodes": self.count() + 1}))
+        return True
+
+    def tail(self, limit: int) -> List[Episode]:
+        """The newest ``limit`` episodes, oldest first."""
+        if limit <= 0 or not self.path.exists():
+            return []
+        with self.path.open("rb") as handle:
+            handle.seek(0, os.SEEK_END)
+            position = handle.tell()
+            data = b""
+            while position > 0 and data.count(b"\n") <= limit:
+                step = min(TAIL_BLOCK_SIZE, position)
+                position -= step
+                handle.seek(position)
+                data = handle.read(step) + data
+        lines = [line for line in data.splitlines() if line.strip()][-limit:]
+        return [Episode.model_validate_json(line) for line in lines]
+
+
+class PodcastFeed:
+    """``feed.xml`` carries the newest ``window_size`` episodes and links to the archive.
+
+    Every time the index reaches a multiple of ``window_size``, that block of episodes is frozen into
+    ``archive/page-NNNN.xml``. Archive pages are never written again, and each links to the page before
+    it (RFC 5005 archived feeds). Publishing holds an exclusive lock on ``feed_dir/.lock`` so that
+    concurrent runs update the index, its count and the rendered pages one at a time.
+    """
+
+    def __init__(self, feed_dir: Path, config: PodcastStepConfig):
+        self.feed_dir = Path(feed_dir)
+        self.config = config
+        self.window_size = max(1, int(config.window_size))
+        self.index = EpisodeIndex(self.feed_dir / "episodes.jsonl")
+        self.feed_path = self.feed_dir / "feed.xml"
+        self.lock_path = self.feed_dir / ".lock"
+
+    def publish(self, episode: Episode) -> Path:
+        """Add ``episode`` and rewrite the feed; an episode already in the current window is not added again."""
+        with self._locked():
+            if self.index.append(episode, window=self.window_size):
+                count = self.index.count()
+                if count % self.window_size == 0:
+                    page = count // self.window_size
+                    page_path = self.archive_path(page)
+                    if not page_path.exists():
+                        episodes = self.index.tail(self.window_size)
+                        _write_atomic(page_path, self.render(episodes, page - 1, archive=True))
+            archived_pages = self.index.count() // self.window_size
+            _write_atomic(self.feed_path, self.render(self.index.tail(self.window_size), archived_pages))
+        return self.feed_path
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.feed_dir.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def archive_path(self, page: int) -> Path:
+        return self.feed_dir / "archive" / f"page-{page:04d}.xml"
+
+    def archive_url(self, page: int) -> str:
+        return f"{self.config.feed_url.rstrip('/')}/archive/page-{page:04d}.xml"
+
+    def render(self, episodes: List[Episode], previous_page: int, archive: bool = False) -> bytes:
+        cfg = self.config
+        fg = FeedGenerator()
+        fg.load_extension("podcast")
+        fg.id(cfg.feed_url)
+        fg.title(cfg.feed_title)
+        fg.description(cfg.feed_description)
+        fg.author({"name": cfg.feed_author})
+        fg.link(href=cfg.feed_url, rel="alternate")
+        fg.language("ja")
+        for episode in episodes:
+            fe = fg.add_entry()
+            fe.id(episode.guid)
+            fe.title(episode.title)
+            fe.description(episode.description)
+            fe.enclosure(episode.enclosure_url, str(episode.length), episode.mime_type)
+            fe.podcast.itunes_duration(round(episode.duration_seconds))
+            fe.published(episode.published)
+        # feedgen only writes rel="self" atom links into RSS, so the RFC 5005 markers are added here.
+        root = etree.fromstring(fg.rss_str())
+        channel = root.find("channel")
+        if previous_page > 0:
+            etree.SubElement(channel, f"{{{ATOM_NS}}}link", rel="prev-archive", href=self.archive_url(previous_page))
+        if archive:
+            etree.SubElement(channel, f"{{{HISTORY_NS}}}archive", nsmap={"fh": HISTORY_NS})
+        return etree.tostring(root, pretty_print=True, xml_declaration=True, encoding="UTF-8")
+
+
+def _write_atomic(path: Path, content: bytes | str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp")
+    if isinstance(content, str):
+        temporary.write_text(content, encoding="utf-8")
+    else:
+        temporary.write_bytes(content)
+    temporary.replace(path)
@@ -4,9 +4,9 @@ import json
 from pathlib import Path
 from typing import Dict, Mapping
 
-import requests
-
 from src.core.step import Step
+from src.providers.http import MultipartFileBody, http_session
+from src.steps.podcast_audio import load_podcast_audio
 from src.utils.config import BuzzsproutStepConfig
 from src.utils.secrets import load_secret_values
 
@@ -16,6 +16,7 @@ class BuzzsproutUploader(Step):
     output_filename = "buzzsprout.json"
     is_required = False
     api_base = "https://www.buzzsprout.com/api"
+    depends_on = ("encode_podcast_audio",)
 
     def __init__(
         self,
@@ -28,7 +29,8 @@ class BuzzsproutUploader(Step):
         self.config = BuzzsproutStepConfig.model_validate(data)
 
     def execute(self, inputs: Dict[str, Path]) -> Path:
-        audio_path = Path(inputs["synthesize_audio"])
+        encoded = load_podcast_audio(inputs)
+        audio_path = Path(encoded["path"]) if encoded else Path(inputs["synthesize_audio"])
 
         cfg = self.config
         token = self._resolve_secret(cfg.token_key)
@@ -43,17 +45,23 @@ class BuzzsproutUploader(Step):
             "Authorization": f"Token token={token}",
             "User-Agent": "youtube-ai-v2/1.0",
         }
-        content_type = "audio/wav" if audio_path.suffix.lower() == ".wav" else "audio/mpeg"
+        if encoded:
+            content_type = str(encoded["mime_type"])
+        else:
+            content_type = "audio/wav" if audio_path.suffix.lower() == ".wav" else "audio/mpeg"
         url = f"{self.api_base}/{podcast_id}/episodes.json"
 
-        with audio_path.open("rb") as handle:
-            response = requests.post(
+        body = MultipartFileBody(payload, "audio_file", audio_path, content_type)
+        try:
+            response = http_session(url).post(
                 url,
-                headers=headers,
-                data=payload,
-                files={"audio_file": (audio_path.name, handle, content_type)},
-                timeout=30,
+                headers={**headers, "Content-Type": body.content_type},
+                data=body,
+                timeout=(10, 300),
+                idempotent=False,
             )
+        finally:
+            body.close()
 
         output_path = self.get_output_path()
         output_path.parent.mkdir(parents=True, exist_ok=True)
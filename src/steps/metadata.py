@@ -27,6 +27,7 @@ class MetadataAnalyzer(Step):
         self.max_description_length = int(cfg.get("max_description_length", 5000))
         self.default_tags = list(cfg.get("default_tags", []))
         self.use_llm = bool(cfg.get("use_llm", True))
+        self.render_profile = str(cfg.get("render_profile", "full"))
         tone_cfg = cfg.get("tone") or {}
         self.tone_guidelines = [str(item).strip() for item in tone_cfg.get("guidelines", []) if str(item).strip()]
         self.title_disallowed_terms = [
@@ -82,6 +83,7 @@ class MetadataAnalyzer(Step):
             "tags": tags[:30],
             "category_id": category_id,
             "analysis": {"segments": len(script.segments), "duration_estimate": script.total_duration_estimate},
+            "render_profile": self.render_profile,
         }
         return Path(write_text(self.get_output_path(), json.dumps(output, ensure_ascii=False, indent=2)))
 
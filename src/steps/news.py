@@ -3,49 +3,25 @@
 from __future__ import annotations
 
 import json
-import re
 import time
+from datetime import timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-import yaml
-
 from src.core.step import Step
 from src.models import NewsItem
-from src.providers.base import Provider, execute_with_fallback
+from src.providers.base import Provider, ProviderChain, execute_fan_out
+from src.utils.diversity import mmr_select
 from src.utils.history import gather_recent_topics
+from src.utils.keywords import get_keyword_matcher
 from src.utils.logger import get_logger
+from src.utils.near_duplicates import MinHashClusterer, jaccard, shingles
+from src.utils.news_store import CandidateCache, SeenNewsStore, title_fingerprint
+from src.utils.prompt_registry import get_prompt_registry
 from src.utils.text import extract_code_block
 
 logger = get_logger(__name__)
 
-ENTITY_PATTERNS = [
-    r"日経平均(?:株価)?",
-    r"TOPIX",
-    r"S&P500|S&P\s*500",
-    r"NYダウ|ダウ平均",
-    r"NASDAQ|ナスダック",
-    r"ドル円|円ドル|USD/JPY",
-    r"ユーロ円|EUR/JPY",
-    r"ビットコイン|BTC",
-    r"イーサリアム|ETH",
-    r"日銀|日本銀行",
-    r"FRB|連邦準備",
-    r"原油|WTI|ブレント",
-    r"金相場|ゴールド",
-    r"半導体",
-    r"アサヒ(?:HD|グループ)?",
-    r"トヨタ",
-    r"ソニー",
-    r"任天堂",
-    r"エヌビディア|NVIDIA",
-    r"テスラ|TSLA",
-    r"決算",
-    r"利上げ|利下げ",
-    r"円安|円高",
-]
-
-
 class NewsCollector(Step):
     """Collect broad candidates first, then select a diverse concrete news set."""
 
@@ -66,6 +42,16 @@ class NewsCollector(Step):
         cooldown_hours: int = 24,
         recent_topics_runs: int = 5,
         recent_topics_max_chars: int = 500,
+        fan_out: bool = False,
+        provider_timeout_seconds: float | None = 60.0,
+        provider_timeouts: Dict[str, float] | None = None,
+        seen_store_path: str | Path | None = None,
+        near_duplicate_threshold: float | None = 0.55,
+        near_duplicate_shingle_size: int = 2,
+        selection_mode: str = "llm",
+        mmr_diversity: float = 0.7,
+        candidate_cache_path: str | Path | None = None,
+        prefetch_max_age_minutes: float = 0,
         **kwargs: Any,
     ):
         super().__init__(run_id, run_dir)
@@ -76,8 +62,23 @@ class NewsCollector(Step):
         self.bucket_schedule = bucket_schedule
         self.fetch_count = fetch_count
         self.final_count = final_count
+        self.cooldown_hours = cooldown_hours
+        self.seen_store_path = Path(seen_store_path) if seen_store_path else Path(run_dir) / "seen_news.json"
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.near_duplicate_shingle_size = near_duplicate_shingle_size
+        if selection_mode not in {"llm", "mmr"}:
+            raise ValueError(f"Unknown news selection_mode: {selection_mode}")
+        self.selection_mode = selection_mode
+        self.mmr_diversity = mmr_diversity
+        self.candidate_cache = CandidateCache(
+            candidate_cache_path or Path(run_dir) / "news_candidates.json"
+        )
+        self.prefetch_max_age_minutes = prefetch_max_age_minutes
         self.recent_topics_runs = recent_topics_runs
         self.recent_topics_max_chars = recent_topics_max_chars
+        self.fan_out = fan_out
+        self.provider_timeout_seconds = provider_timeout_seconds
+        self.provider_timeouts = provider_timeouts or {}
 
     def execute(self, inputs: Dict[str, Path]) -> Path:
         start = time.time()
@@ -87,14 +88,17 @@ class NewsCollector(Step):
         candidate_count = max(self.fetch_count, self.final_count * 3)
         logger.info("Selected retrieval query: %s -> %s", bucket_key, query)
 
-        candidates = execute_with_fallback(
-            self.providers,
-            query=query,
-            count=candidate_count,
-            recent_topics_note="",
+        candidates, provider_metrics, candidate_source = self._load_candidates(query, candidate_count)
+        clusters = self._normalize_and_cluster(candidates)
+        candidates = [cluster[0] for cluster in clusters]
+        seen_store = SeenNewsStore(self.seen_store_path, self.cooldown_hours)
+        candidates, cooling = seen_store.partition(candidates)
+        logger.info(
+            "Fetched %s unique candidates (%s skipped by %sh cooldown)",
+            len(candidates),
+            len(cooling),
+            self.cooldown_hours,
         )
-        candidates = self._deduplicate_urls(candidates)
-        logger.info("Fetched %s unique candidates", len(candidates))
 
         if len(candidates) < self.final_count:
             raise ValueError(
@@ -107,14 +111,33 @@ class NewsCollector(Step):
                 f"News selection returned {len(selected)} items; expected {self.final_count}"
             )
 
+        selection_record["providers"] = provider_metrics
+        selection_record["candidate_source"] = candidate_source
+        selection_record["cooldown_skipped"] = [item.model_dump(mode="json") for item in cooling]
+        selection_record["near_duplicates"] = [
+            {"representative": cluster[0].url, "duplicates": [item.url for item in cluster[1:]]}
+            for cluster in clusters
+            if len(cluster) > 1
+        ]
         self._save_selection_record(selection_record)
+        seen_store.mark_seen(candidates)
+        seen_store.mark_selected(selected)
+        seen_store.save()
         from src.tracking import AimTracker
 
         tracker = AimTracker.get_instance(self.run_id)
+        if provider_metrics:
+            tracker.track_metrics(
+                {
+                    f"news_provider_{entry['provider']}_{key}": float(entry[key])
+                    for entry in provider_metrics
+                    for key in ("latency_seconds", "returned", "unique")
+                }
+            )
         tracker.track_prompt(
             step_name="collect_news",
             template_name="news_selection",
-            prompt=selection_record.get("prompt", query),
+            prompt=selection_record.get("prompt") or query,
             inputs={
                 "candidate_count": len(candidates),
                 "recent_topics": self._recent_topics_note(recent),
@@ -126,10 +149,85 @@ class NewsCollector(Step):
         )
         return self._save(selected)
 
+    def prefetch(self) -> Path:
+        """Fetch candidates for the query the next run would use and store them in the candidate cache."""
+        bucket_key, query = self._select_query()
+        candidates, metrics = self._fetch_candidates(query, max(self.fetch_count, self.final_count * 3))
+        logger.info("Prefetched %s candidates for %s -> %s", len(candidates), bucket_key, query)
+        return self.candidate_cache.put(query, candidates, metrics)
+
+    def _load_candidates(
+        self, query: str, count: int
+    ) -> Tuple[List[NewsItem], List[Dict[str, Any]], Dict[str, Any]]:
+        cached = self._cached_candidates(query)
+        if cached is not None:
+            logger.info("Using prefetched candidates fetched at %s", cached["fetched_at"])
+            source = {"source": "prefetch", "fetched_at": cached["fetched_at"], "age_seconds": cached["age_seconds"]}
+            return cached["items"], cached["providers"], source
+        candidates, metrics = self._fetch_candidates(query, count)
+        return candidates, metrics, {"source": "live"}
+
+    def _cached_candidates(self, query: str) -> Dict[str, Any] | None:
+        if self.prefetch_max_age_minutes <= 0:
+            return None
+        return self.candidate_cache.get(query, timedelta(minutes=self.prefetch_max_age_minutes))
+
+    def _fetch_candidates(self, query: str, count: int) -> Tuple[List[NewsItem], List[Dict[str, Any]]]:
+        request = {"query": query, "count": count, "recent_topics_note": ""}
+        if not self.fan_out:
+            chain = ProviderChain(self.providers)
+            start = time.perf_counter()
+            items = list(chain.execute(**request))
+            candidates = self._deduplicate_urls(items)
+            metric = {
+                "provider": chain.last_provider,
+                "latency_seconds": round(time.perf_counter() - start, 3),
+                "returned": len(items),
+                "unique": len(candidates),
+                "error": None,
+            }
+            return candidates, [metric]
+
+        results = execute_fan_out(
+            self.providers,
+            timeout=self.provider_timeout_seconds,
+            timeouts=self.provider_timeouts,
+            **request,
+        )
+        merged: List[NewsItem] = []
+        metrics: List[Dict[str, Any]] = []
+        seen_urls: set[str] = set()
+        for result in results:
+            items = list(result.value or []) if result.ok else []
+            fresh = [item for item in self._deduplicate_urls(items) if item.url not in seen_urls]
+            seen_urls.update(item.url for item in fresh)
+            merged.extend(fresh)
+            metrics.append(
+                {
+                    "provider": result.name,
+                    "latency_seconds": round(result.latency, 3),
+                    "returned": len(items),
+                    "unique": len(fresh),
+                    "error": None if result.ok else str(result.error),
+                }
+            )
+            logger.info(
+                "News provider %s: %s items (%s unique) in %.2fs%s",
+                result.name,
+                len(items),
+                len(fresh),
+                result.latency,
+                "" if result.ok else f" [{result.error}]",
+            )
+        return merged, metrics
+
     def select_news(
         self, candidates: List[NewsItem], recent_topics: List[str]
     ) -> Tuple[List[NewsItem], Dict[str, Any]]:
         """Select final news from actual candidates and return an audit record."""
+        if self.selection_mode == "mmr":
+            return self._mmr_selection(candidates, recent_topics)
+
         prompt = self._build_selection_prompt(candidates, recent_topics)
         provider = self._selection_provider()
 
@@ -170,6 +268,25 @@ class NewsCollector(Step):
             model="rule",
         )
 
+    def _mmr_selection(
+        self, candidates: List[NewsItem], recent_topics: List[str]
+    ) -> Tuple[List[NewsItem], Dict[str, Any]]:
+        indices = mmr_select(
+            [f"{item.title} {item.summary}" for item in candidates],
+            recent_topics,
+            self.final_count,
+            diversity=self.mmr_diversity,
+        )
+        selections = [{"index": index, "reason": "tf-idf maximal marginal relevance"} for index in indices]
+        return [candidates[index] for index in indices], self._selection_record(
+            candidates,
+            selections,
+            prompt="",
+            raw_response=None,
+            mode="mmr",
+            model="rule",
+        )
+
     def _selection_provider(self) -> Provider | None:
         if self.llm_provider is not None:
             return self.llm_provider
@@ -181,9 +298,7 @@ class NewsCollector(Step):
     def _build_selection_prompt(
         self, candidates: List[NewsItem], recent_topics: List[str]
     ) -> str:
-        prompt_path = Path(__file__).resolve().parents[2] / "config" / "news_selection.yaml"
-        section = yaml.safe_load(prompt_path.read_text(encoding="utf-8"))["news_selection"]
-        template = section["user_template"]
+        template = get_prompt_registry().news_selection_template()
         candidate_payload = [
             {
                 "index": idx,
@@ -270,13 +385,15 @@ class NewsCollector(Step):
         bucket_keys = list(self.query_buckets.keys())
         start_idx = hash(self.run_id) % len(bucket_keys)
 
-        for i in range(len(bucket_keys)):
-            key = bucket_keys[(start_idx + i) % len(bucket_keys)]
-            query = self.query_buckets[key]
-            if not (self._extract_entities(query) & saturated):
-                return key, query
-
-        key = bucket_keys[start_idx]
+        eligible = [
+            key
+            for key in (bucket_keys[(start_idx + i) % len(bucket_keys)] for i in range(len(bucket_keys)))
+            if not (self._extract_entities(self.query_buckets[key]) & saturated)
+        ]
+        for key in eligible:
+            if self._cached_candidates(self.query_buckets[key]) is not None:
+                return key, self.query_buckets[key]
+        key = eligible[0] if eligible else bucket_keys[start_idx]
         return key, self.query_buckets[key]
 
     def _diverse_fallback(
@@ -285,9 +402,10 @@ class NewsCollector(Step):
         saturated = self._get_saturated_entities(recent_topics)
         selected: List[NewsItem] = []
         selected_entities: set[str] = set()
+        entities_by_id = {id(item): self._extract_entities(item.title) for item in candidates}
 
         def score(item: NewsItem) -> Tuple[int, int]:
-            entities = self._extract_entities(item.title)
+            entities = entities_by_id[id(item)]
             recent_overlap = len(entities & saturated)
             selected_overlap = len(entities & selected_entities)
             return (recent_overlap + selected_overlap, selected_overlap)
@@ -297,7 +415,7 @@ class NewsCollector(Step):
             best = min(enumerate(remaining), key=lambda pair: (score(pair[1]), pair[0]))
             item = remaining.pop(best[0])
             selected.append(item)
-            selected_entities.update(self._extract_entities(item.title))
+            selected_entities.update(entities_by_id[id(item)])
         return selected
 
     def _deduplicate_urls(self, items: List[NewsItem]) -> List[NewsItem]:
@@ -310,6 +428,25 @@ class NewsCollector(Step):
             result.append(item)
         return result
 
+    def _normalize_and_cluster(self, items: List[NewsItem]) -> List[List[NewsItem]]:
+        """Group syndicated copies of the same story; the first item of each cluster represents it."""
+        by_title: Dict[str, List[NewsItem]] = {}
+        for item in self._deduplicate_urls(items):
+            by_title.setdefault(title_fingerprint(item.title) or item.url, []).append(item)
+        groups = list(by_title.values())
+        if not self.near_duplicate_threshold or len(groups) < 2:
+            return groups
+
+        clusterer = MinHashClusterer(self.near_duplicate_threshold, self.near_duplicate_shingle_size)
+        indices = clusterer.cluster([f"{group[0].title} {group[0].summary}" for group in groups])
+        return [[item for index in members for item in groups[index]] for members in indices]
+
+    def _calculate_similarity(self, left: str, right: str) -> float:
+        return jaccard(
+            shingles(left, self.near_duplicate_shingle_size),
+            shingles(right, self.near_duplicate_shingle_size),
+        )
+
     def _get_saturated_entities(self, topics: List[str]) -> set[str]:
         entities: set[str] = set()
         for topic in topics:
@@ -317,11 +454,7 @@ class NewsCollector(Step):
         return entities
 
     def _extract_entities(self, text: str) -> set[str]:
-        entities: set[str] = set()
-        for pattern in ENTITY_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                entities.add(pattern.split("|")[0].split("(")[0])
-        return entities
+        return set(get_keyword_matcher().match("news_entities", text))
 
     def _save(self, items: List[NewsItem]) -> Path:
         path = self.get_output_path()
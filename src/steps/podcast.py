@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import shutil
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Mapping
 
-from feedgen.feed import FeedGenerator
-
+from src.core.media_utils import get_audio_duration
 from src.core.step import Step
+from src.services.podcast_feed import Episode, PodcastFeed
+from src.steps.podcast_audio import load_podcast_audio
 from src.utils.config import PodcastStepConfig
 
 
@@ -15,6 +14,7 @@ class PodcastExporter(Step):
     name = "export_podcast"
     output_filename = "podcast.xml"
     is_required = False
+    depends_on = ("encode_podcast_audio",)
 
     def __init__(
         self,
@@ -28,34 +28,36 @@ class PodcastExporter(Step):
         self.config = PodcastStepConfig.model_validate(config_data)
 
     def execute(self, inputs: Dict[str, Path]) -> Path:
-        audio_path = Path(inputs["synthesize_audio"])
-
         output_path = self.get_output_path()
-        output_dir = output_path.parent
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        audio_dest = output_dir / "podcast_audio.wav"
-        shutil.copy(audio_path, audio_dest)
-
-        fg = FeedGenerator()
-        fg.load_extension("podcast")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        encoded = load_podcast_audio(inputs)
+        if encoded:
+            audio_path = Path(encoded["path"])
+            mime_type = str(encoded["mime_type"])
+            duration = float(encoded["duration_seconds"])
+        else:
+            audio_path = Path(inputs["synthesize_audio"])
+            mime_type = "audio/wav"
+            duration = get_audio_duration(audio_path)
 
         cfg = self.config
-        feed_id = f"{cfg.feed_url.rstrip('/')}/{self.run_id}"
-        fg.id(feed_id)
-        fg.title(cfg.feed_title)
-        fg.description(cfg.feed_description)
-        fg.author({"name": cfg.feed_author})
-        fg.link(href=cfg.feed_url, rel="alternate")
-        fg.language("ja")
-
-        fe = fg.add_entry()
-        fe.id(feed_id)
-        fe.title(f"Episode {self.run_id}")
-        fe.description(f"Run ID: {self.run_id}")
-        fe.enclosure(str(audio_dest), 0, "audio/wav")
-        fe.published(datetime.now(timezone.utc))
-
-        fg.rss_file(str(output_path))
+        enclosure_url = (
+            f"{cfg.media_base_url.rstrip('/')}/{self.run_id}/{audio_path.name}"
+            if cfg.media_base_url
+            else str(audio_path)
+        )
+        episode = Episode(
+            guid=f"{cfg.feed_url.rstrip('/')}/{self.run_id}",
+            title=f"Episode {self.run_id}",
+            description=f"Run ID: {self.run_id}",
+            enclosure_url=enclosure_url,
+            length=audio_path.stat().st_size,
+            mime_type=mime_type,
+            duration_seconds=duration,
+        )
+        feed_path = PodcastFeed(Path(cfg.feed_dir), cfg).publish(episode)
+        # The run keeps a copy of the feed as published, bounded by the window size.
+        output_path.write_bytes(feed_path.read_bytes())
 
         return output_path
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Mapping
+
+import ffmpeg
+
+from src.core.media_utils import find_ffmpeg_binary, get_audio_duration
+from src.core.step import Step
+from src.utils.config import PodcastAudioStepConfig
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# codec -> (ffmpeg encoder, file extension, MIME type, extra output options)
+AUDIO_CODECS: Dict[str, tuple[str, str, str, Dict[str, str]]] = {
+    "mp3": ("libmp3lame", ".mp3", "audio/mpeg", {}),
+    "aac": ("aac", ".m4a", "audio/mp4", {"movflags": "+faststart"}),
+    "opus": ("libopus", ".ogg", "audio/ogg", {}),
+}
+# libopus rejects any other rate (44100 included); anything else is resampled to 48 kHz.
+OPUS_SAMPLE_RATES = (48000, 24000, 16000, 12000, 8000)
+
+
+class PodcastAudioEncoder(Step):
+    """Encode the narration once into the compressed, loudness-normalised file every podcast publisher shares.
+
+    The file is named after a hash of the source audio and the encode settings, so an unchanged episode is never
+    encoded twice.
+    """
+
+    name = "encode_podcast_audio"
+    output_filename = "podcast_audio.json"
+    is_required = False
+
+    def __init__(
+        self,
+        run_id: str,
+        run_dir: Path,
+        audio_config: PodcastAudioStepConfig | Mapping[str, object] | None = None,
+    ) -> None:
+        super().__init__(run_id, run_dir)
+        data = audio_config if isinstance(audio_config, PodcastAudioStepConfig) else audio_config or {}
+        self.config = PodcastAudioStepConfig.model_validate(data)
+
+    def execute(self, inputs: Dict[str, Path]) -> Path:
+        source = Path(inputs["synthesize_audio"])
+        encoder, extension, mime_type, extra = AUDIO_CODECS[self.config.codec]
+        output_path = self.get_output_path()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        key = self.content_key(source)
+        audio_path = output_path.with_name(f"podcast_audio_{key[:16]}{extension}")
+
+        if audio_path.exists():
+            logger.info("Reusing encoded podcast audio %s", audio_path.name)
+        else:
+            self._encode(source, audio_path, encoder, extra)
+
+        manifest = {
+            "path": str(audio_path),
+            "content_key": key,
+            "codec": self.config.codec,
+            "mime_type": mime_type,
+            "bytes": audio_path.stat().st_size,
+            "duration_seconds": round(get_audio_duration(source), 3),
+            "source_bytes": source.stat().st_size,
+        }
+        output_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        return output_path
+
+    def content_key(self, source: Path) -> str:
+        digest = hashlib.sha256()
+        with source.open("rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(self.config.model_dump_json().encode("utf-8"))
+        return digest.hexdigest()
+
+    def sample_rate(self) -> int:
+        """Output sample rate: the configured one, unless the codec cannot encode at it."""
+        if self.config.codec == "opus" and self.config.sample_rate not in OPUS_SAMPLE_RATES:
+            return OPUS_SAMPLE_RATES[0]
+        return self.config.sample_rate
+
+    def _encode(self, source: Path, audio_path: Path, encoder: str, extra: Dict[str, str]) -> None:
+        cfg = self.config
+        partial = audio_path.with_name(f"{audio_path.stem}.part{audio_path.suffix}")
+        stream = ffmpeg.input(str(source)).audio.filter(
+            "loudnorm", I=cfg.loudness_lufs, TP=cfg.true_peak_db, LRA=cfg.loudness_range
+        )
+        output = ffmpeg.output(
+            stream,
+            str(partial),
+            acodec=encoder,
+            audio_bitrate=cfg.bitrate,
+            ar=self.sample_rate(),
+            ac=cfg.channels,
+            **extra,
+        ).overwrite_output()
+        ffmpeg.run(output, cmd=find_ffmpeg_binary(), capture_stdout=True, capture_stderr=True)
+        partial.replace(audio_path)
+        logger.info("Encoded podcast audio %s (%.1f MB)", audio_path.name, audio_path.stat().st_size / 1_000_000)
+
+
+def load_podcast_audio(inputs: Mapping[str, object]) -> Dict[str, object] | None:
+    """Manifest written by ``PodcastAudioEncoder`` for this run, if the step ran."""
+    manifest = inputs.get(PodcastAudioEncoder.name)
+    if not manifest or not Path(manifest).exists():
+        return None
+    return json.loads(Path(manifest).read_text(encoding="utf-8"))
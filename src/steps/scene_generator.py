@@ -12,6 +12,7 @@ from src.services.image_generation import (
     ImageGenerationRequest,
     ImageGenerationService,
 )
+from src.utils.keywords import get_keyword_matcher
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -98,13 +99,10 @@ class ContextExtractor:
             return "neutral"
 
         # Simple heuristic: check for positive/negative keywords
-        stats_text = json.dumps(stats_data).lower()
-
-        positive_signals = ["上昇", "増加", "好調", "最高", "記録"]
-        negative_signals = ["下落", "減少", "懸念", "リスク", "警告"]
-
-        pos_count = sum(1 for sig in positive_signals if sig in stats_text)
-        neg_count = sum(1 for sig in negative_signals if sig in stats_text)
+        stats_text = json.dumps(stats_data, ensure_ascii=False)
+        matcher = get_keyword_matcher()
+        pos_count = matcher.count("sentiment_positive", stats_text)
+        neg_count = matcher.count("sentiment_negative", stats_text)
 
         if pos_count > neg_count:
             return "bull"
@@ -516,13 +514,9 @@ class SceneGenerator(Step):
 
     def _detect_mood(self, text: str, segments: List[Dict]) -> str:
         """Detect emotional mood from text."""
-        crisis_keywords = ["下落", "暴落", "危機", "リスク", "警告", "懸念", "減少"]
-        opportunity_keywords = ["上昇", "成長", "最高", "記録", "達成", "増加", "好調"]
-
-        text_lower = text.lower()
-
-        crisis_count = sum(1 for kw in crisis_keywords if kw in text_lower)
-        opportunity_count = sum(1 for kw in opportunity_keywords if kw in text_lower)
+        matcher = get_keyword_matcher()
+        crisis_count = matcher.count("mood_crisis", text)
+        opportunity_count = matcher.count("mood_opportunity", text)
 
         if crisis_count > opportunity_count:
             return "crisis"
@@ -532,29 +526,7 @@ class SceneGenerator(Step):
 
     def _extract_entities(self, text: str) -> List[str]:
         """Extract key entities from text."""
-        entities = []
-
-        common_entities = [
-            "Apple",
-            "Google",
-            "Microsoft",
-            "Amazon",
-            "Tesla",
-            "日経平均",
-            "S&P500",
-            "NASDAQ",
-            "ドル円",
-            "ビットコイン",
-            "FRB",
-            "日銀",
-            "ECB",
-        ]
-
-        for entity in common_entities:
-            if entity in text:
-                entities.append(entity)
-
-        return entities[:5]
+        return get_keyword_matcher()["scene_entities"].ordered(text)[:5]
 
     @staticmethod
     def _variant_to_dict(variant: SceneVariant) -> Dict:
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 import yaml
+from pydantic import ValidationError
 
 from src.core.io_utils import load_json, write_text
 from src.core.step import Step
@@ -16,10 +17,16 @@ from src.tracking import AimTracker
 from src.utils.history import load_previous_context
 from src.utils.text import extract_code_block
 
+SCRIPT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "script", "schema": Script.model_json_schema(), "strict": True},
+}
+
 
 class ScriptGenerator(Step):
     name = "generate_script"
     output_filename = "script.json"
+    raw_output_filename = "script_raw.txt"
 
     def __init__(
         self,
@@ -27,6 +34,7 @@ class ScriptGenerator(Step):
         run_dir: Path,
         llm_provider: Provider,
         speakers_config: Any | None = None,
+        structured_output: bool = True,
     ):
         super().__init__(run_id, run_dir)
         if not speakers_config:
@@ -40,6 +48,7 @@ class ScriptGenerator(Step):
         self.speakers = self._extract_speakers(data)
         self.carryover_notes = self._load_previous_context(run_dir)
         self.provider = llm_provider
+        self.structured_output = structured_output
 
     def execute(self, inputs: Dict[str, Path]) -> Path:
         news_path = Path(inputs.get("collect_news", ""))
@@ -52,9 +61,11 @@ class ScriptGenerator(Step):
         prompt = self._build_prompt(news_items)
         tracker = AimTracker.get_instance(self.run_id)
 
+        request = {"response_format": SCRIPT_RESPONSE_FORMAT} if self.structured_output else {}
         start = time.time()
-        raw_output = self.provider.execute(prompt=prompt)
+        raw_output = self.provider.execute(prompt=prompt, **request)
         duration = time.time() - start
+        write_text(self.get_output_path().with_name(self.raw_output_filename), raw_output)
 
         tracker.track_prompt(
             step_name="generate_script",
@@ -121,6 +132,18 @@ class ScriptGenerator(Step):
         return text.split("。", 1)[0] + "。" if "。" in text else text
 
     def _parse_and_validate(self, raw: str, depth: int = 6) -> Script:
+        script = self._parse_structured(raw) or self._parse_heuristic(raw, depth)
+        for seg in script.segments:
+            seg.text = re.sub(r"。(?![\r\n]|$)", "。\n", seg.text)
+        return script
+
+    def _parse_structured(self, raw: str) -> Script | None:
+        try:
+            return Script.model_validate_json(raw)
+        except ValidationError:
+            return None
+
+    def _parse_heuristic(self, raw: str, depth: int) -> Script:
         data = self._coerce_to_dict(raw.strip(), depth)
         if not isinstance(data, dict):
             raise ValueError("Script output must be a mapping")
@@ -134,10 +157,7 @@ class ScriptGenerator(Step):
             else:
                 raise ValueError("Script output missing 'segments' key")
 
-        script = Script(**data)
-        for seg in script.segments:
-            seg.text = re.sub(r"。(?![\r\n]|$)", "。\n", seg.text)
-        return script
+        return Script(**data)
 
     def _coerce_to_dict(self, raw: str, depth: int) -> Any:
         if depth < 0:
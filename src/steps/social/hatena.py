@@ -8,11 +8,11 @@ import time
 from pathlib import Path
 from typing import Dict, Optional
 
-import requests
 from pydantic import BaseModel
 
 from src.core.io_utils import load_json, write_text
 from src.core.step import Step
+from src.providers.http import http_session
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +80,7 @@ class HatenaPoster:
         """
 
         try:
-            resp = requests.post(endpoint, headers=headers, data=xml_body.encode("utf-8"))
+            resp = http_session(endpoint).post(endpoint, headers=headers, data=xml_body.encode("utf-8"))
             resp.raise_for_status()
 
             # Parse response to get the link (simplified)
@@ -4,11 +4,11 @@ import os
 from pathlib import Path
 from typing import Dict, Optional
 
-import requests
 from pydantic import BaseModel
 
 from src.core.io_utils import load_json, write_text
 from src.core.step import Step
+from src.providers.http import http_session
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +34,7 @@ class LinkedInPoster:
             "X-Restli-Protocol-Version": "2.0.0",
             "Content-Type": "application/json",
         }
+        self.session = http_session(self.API_BASE)
 
     def post(self, text: str, image_path: Optional[str] = None) -> Optional[str]:
         """
@@ -70,7 +71,7 @@ class LinkedInPoster:
             }
         }
 
-        resp = requests.post(register_url, headers=self.headers, json=register_body)
+        resp = self.session.post(register_url, headers=self.headers, json=register_body)
         resp.raise_for_status()
         data = resp.json()
 
@@ -80,11 +81,13 @@ class LinkedInPoster:
         asset_urn = data["value"]["asset"]
 
         # 2. Upload Binary
+        # Read the image up front so a retried PUT resends the whole body.
         with open(image_path, "rb") as f:
-            upload_resp = requests.put(
-                upload_url, headers={"Authorization": f"Bearer {self.config.access_token}"}, data=f
-            )
-            upload_resp.raise_for_status()
+            image = f.read()
+        upload_resp = http_session(upload_url).put(
+            upload_url, headers={"Authorization": f"Bearer {self.config.access_token}"}, data=image
+        )
+        upload_resp.raise_for_status()
 
         logger.info(f"Uploaded image to LinkedIn: {asset_urn}")
         return asset_urn
@@ -117,7 +120,7 @@ class LinkedInPoster:
             "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"},
         }
 
-        resp = requests.post(url, headers=self.headers, json=body)
+        resp = self.session.post(url, headers=self.headers, json=body)
         resp.raise_for_status()
 
         post_urn = resp.json().get("id")
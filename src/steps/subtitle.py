@@ -1,18 +1,24 @@
 import re
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-from PIL import Image, ImageFont
+from PIL import Image
 
 from src.core.io_utils import load_script, validate_input_files, write_text
 from src.core.media_utils import get_audio_duration
 from src.core.step import Step
+from src.utils.ass import render_ass
+from src.utils.text_metrics import CellFont, TextMeasurer, get_text_measurer
+
+if TYPE_CHECKING:
+    from src.utils.config import VideoStepConfig
 
 
 class SubtitleFormatter(Step):
     name = "prepare_subtitles"
     output_filename = "subtitles.srt"
     _PAGE_BREAK_PATTERN = re.compile(r"(?<=[。！？!?])")
+    measurer: TextMeasurer | None = None
 
     def __init__(
         self,
@@ -24,14 +30,24 @@ class SubtitleFormatter(Step):
         wrap_width_pixels: int | None = None,
         font_path: str | None = None,
         font_size: int | None = None,
+        subtitle_format: str | None = None,
+        video_config: "VideoStepConfig | None" = None,
     ):
         super().__init__(run_id, run_dir)
         from src.utils.config import Config
 
         config = Config.load()
-        video_cfg = config.steps.video
+        # The caller's video config carries the active render profile (draft resolution and font size).
+        video_cfg = video_config or config.steps.video
         subtitle_cfg = config.steps.subtitle
         style_cfg = video_cfg.subtitles
+        self.subtitle_format = (subtitle_format or subtitle_cfg.format).lower()
+        if self.subtitle_format not in ("srt", "ass"):
+            raise ValueError(f"Unsupported subtitle format: {self.subtitle_format}")
+        if self.subtitle_format == "ass":
+            self.output_filename = "subtitles.ass"
+        self.style_config = style_cfg.model_dump()
+        self.resolution = video_cfg.resolution
 
         margin_l = int(style_cfg.margin_l or 0)
         margin_r = int(style_cfg.margin_r or 0)
@@ -60,7 +76,10 @@ class SubtitleFormatter(Step):
         self.max_chars_per_line = max_chars_per_line
         self.width_per_char_pixels = char_pixels
         self.wrap_width_pixels = wrap_width_pixels
-        self._font: ImageFont.ImageFont | None = None
+        if self.font_path and self.font_path.exists():
+            self.measurer = get_text_measurer(str(self.font_path), self.font_size)
+        else:
+            self.measurer = TextMeasurer(CellFont(self.font_size))
 
     def execute(self, inputs: Dict[str, Path]) -> Path:
         validate_input_files(inputs, "generate_script", "synthesize_audio")
@@ -68,8 +87,20 @@ class SubtitleFormatter(Step):
         audio_duration = get_audio_duration(Path(inputs["synthesize_audio"]))
         timestamps = self._calculate_timestamps(script, audio_duration)
         srt_content = self._generate_srt(timestamps)
+        if self.subtitle_format == "ass":
+            # The ASS file is burned in; YouTube's captions API only accepts the SRT written next to it.
+            write_text(self.captions_path(), srt_content)
+            return write_text(self.get_output_path(), self._generate_ass(timestamps))
         return write_text(self.get_output_path(), srt_content)
 
+    def captions_path(self) -> Path:
+        return self.get_output_path().with_suffix(".srt")
+
+    def artifacts(self) -> Dict[str, Path]:
+        if self.subtitle_format == "ass":
+            return {"captions": self.captions_path()}
+        return {}
+
     def _calculate_timestamps(self, script, audio_duration: float) -> list[Dict]:
         cleaned_segments = [(seg, self._clean_text(seg.text)) for seg in script.segments]
         total_chars = sum(len(clean_text) for _, clean_text in cleaned_segments)
@@ -119,6 +150,10 @@ class SubtitleFormatter(Step):
             lines.append("")
         return "\n".join(lines)
 
+    def _generate_ass(self, timestamps: list[Dict]) -> str:
+        cues = [{"start": ts["start"], "end": ts["end"], "lines": self._wrap_text(ts["text"])} for ts in timestamps]
+        return render_ass(cues, self.style_config, self.resolution)
+
     def _format_timestamp(self, seconds: float) -> str:
         h = int(seconds // 3600)
         m = int((seconds % 3600) // 60)
@@ -129,7 +164,6 @@ class SubtitleFormatter(Step):
     def _paginate_text(self, text: str) -> List[str]:
         """Split subtitle text into sentence-aware pages with at most two lines."""
 
-        page_capacity = max(self.max_chars_per_line, 1) * 2
         pages: List[str] = []
         for raw_line in text.split("\n"):
             line = raw_line.strip()
@@ -137,30 +171,25 @@ class SubtitleFormatter(Step):
                 continue
             sentences = [part.strip() for part in self._PAGE_BREAK_PATTERN.split(line) if part.strip()]
             for sentence in sentences:
-                start = 0
-                while start < len(sentence):
-                    pages.append(sentence[start : start + page_capacity])
-                    start += page_capacity
+                lines = self._break_lines(sentence)
+                pages.extend("".join(lines[start : start + 2]).strip() for start in range(0, len(lines), 2))
         return pages or [""]
 
     def _wrap_text(self, text: str) -> List[str]:
-        limit = max(self.max_chars_per_line, 1)
-        return [text[start : start + limit] for start in range(0, len(text), limit)] or [""]
+        return [line.rstrip() for line in self._break_lines(text)] or [""]
+
+    def _break_lines(self, text: str) -> List[str]:
+        if not text:
+            return []
+        if self.measurer is None:
+            limit = max(self.max_chars_per_line, 1)
+            return [text[start : start + limit] for start in range(0, len(text), limit)]
+        return self.measurer.wrap(text, self.wrap_width_pixels, max(self.max_chars_per_line, 1))
 
     def _clean_text(self, text: str) -> str:
         cleaned = re.sub(r"\s*\(間\)\s*", " ", text)
         return cleaned.strip()
 
-    def _text_width(self, text: str) -> int:
-        return len(text) * self.width_per_char_pixels
-
-    def _load_font(self) -> ImageFont.ImageFont | None:
-        if not self.font_path or not self.font_path.exists():
-            return None
-        if self._font is None:
-            self._font = ImageFont.truetype(str(self.font_path), self.font_size or 24)
-        return self._font
-
     @staticmethod
     def safe_pixel_width(resolution: str, margin_l: int | None, margin_r: int | None) -> int:
         width = int(resolution.lower().split("x", 1)[0].strip())
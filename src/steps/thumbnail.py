@@ -11,6 +11,7 @@ from PIL.ImageColor import getrgb
 from src.core.io_utils import load_json, load_script
 from src.core.step import Step
 from src.utils.config import Config
+from src.utils.text_metrics import get_text_measurer, measurer_for_font
 
 
 def _load_presets() -> List[Dict]:
@@ -140,11 +141,7 @@ class ThumbnailGenerator(Step):
         return round(self.width * pct), round(self.height * pct)
 
     def _load_font(self, size: int) -> ImageFont.ImageFont:
-        if self.font_path:
-            font_file = Path(self.font_path)
-            if font_file.exists():
-                return ImageFont.truetype(str(font_file), size)
-        return ImageFont.load_default(size=size)
+        return get_text_measurer(str(self.font_path) if self.font_path else None, size).font
 
     def _fit_title_font(
         self, text: str, max_width: int, max_height: int
@@ -256,34 +253,16 @@ class ThumbnailGenerator(Step):
         return y
 
     def _wrap_text(self, text: str, font: ImageFont.ImageFont, max_width: int) -> List[str]:
-        lines = []
+        measurer = measurer_for_font(font)
+        lines: List[str] = []
         for chunk in text.split("\n"):
             if len(lines) >= self.max_lines:
                 break
             chunk = chunk.strip()
-            if not chunk:
-                continue
-            current = ""
-            for char in chunk:
-                tentative = current + char
-                if self._text_width(font, tentative) <= max_width and len(tentative) <= self.max_chars_per_line:
-                    current = tentative
-                else:
-                    if current:
-                        lines.append(current)
-                        if len(lines) >= self.max_lines:
-                            return lines
-                    current = char
-            if current and len(lines) < self.max_lines:
-                lines.append(current)
+            if chunk:
+                lines.extend(line.rstrip() for line in measurer.wrap(chunk, max_width, self.max_chars_per_line))
         return lines[: self.max_lines] if lines else [text[: self.max_chars_per_line] if text else ""]
 
-    def _text_width(self, font: ImageFont.ImageFont, text: str) -> int:
-        if hasattr(font, "getlength"):
-            return int(font.getlength(text))
-        bbox = font.getbbox(text)
-        return int(bbox[2] - bbox[0])
-
     def _save_preview(self, image: Image.Image, output_path: Path) -> Path:
         width = max(1, min(self.width, self.preview_width))
         height = max(1, round(self.height * width / self.width))
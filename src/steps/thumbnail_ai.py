@@ -11,6 +11,8 @@ from src.core.io_utils import load_json
 from src.core.step import Step
 from src.providers.cloudflare_ai import CloudflareAIClient
 from src.providers.llm import GeminiProvider
+from src.services.image_cache import ImageCache
+from src.services.image_generation import ImageGenerationRequest, ImageGenerationService
 from src.steps.thumbnail import ThumbnailGenerator
 from src.utils.config import Config, load_prompts
 
@@ -25,8 +27,12 @@ class AIThumbnailGenerator(Step):
         run_id: str,
         run_dir: Path,
         ai_thumbnail_config: Dict | None = None,
+        image_service: ImageGenerationService | None = None,
+        image_cache: ImageCache | None = None,
     ) -> None:
         super().__init__(run_id, run_dir)
+        self.image_service = image_service
+        self.image_cache = image_cache
         cfg = dict(ai_thumbnail_config or {})
         self.enabled = bool(cfg.get("enabled", False))
         self.width = int(cfg.get("width", 1920))
@@ -48,9 +54,12 @@ class AIThumbnailGenerator(Step):
             else ("", "")
         )
         prompts = load_prompts()
-        prompt_en = self._generate_prompt(prompts, title, description, tags)
+        prompt_path = output_path.parent / "thumbnail_ai_prompt.json"
+        prompt_en = self._previous_prompt(prompt_path, title, description, tags) or self._generate_prompt(
+            prompts, title, description, tags
+        )
         negative_prompt = prompts.get("thumbnail_ai", {}).get("negative_prompt", "")
-        (output_path.parent / "thumbnail_ai_prompt.json").write_text(
+        prompt_path.write_text(
             json.dumps(
                 {
                     "title": title,
@@ -64,18 +73,33 @@ class AIThumbnailGenerator(Step):
                 indent=2,
             )
         )
-        image_data = CloudflareAIClient().generate_image(
-            prompt=prompt_en,
-            negative_prompt=negative_prompt,
-            width=self.width,
-            height=self.height,
-            num_steps=self.num_steps,
-        )
+        image_data = self._generate_background(prompt_en, negative_prompt)
         if self.text_overlay_enabled:
             image_data = self._compose_title(image_data, title)
         output_path.write_bytes(image_data)
         return output_path
 
+    def _generate_background(self, prompt: str, negative_prompt: str) -> bytes:
+        """PNG background from the injected image service (the local worker), else from Cloudflare."""
+        if self.image_service is None:
+            return CloudflareAIClient(cache=self.image_cache).generate_image(
+                prompt=prompt,
+                negative_prompt=negative_prompt,
+                width=self.width,
+                height=self.height,
+                num_steps=self.num_steps,
+            )
+        request = ImageGenerationRequest(
+            prompt=prompt,
+            negative_prompt=negative_prompt,
+            width=self.width,
+            height=self.height,
+            num_inference_steps=self.num_steps,
+        )
+        buffer = BytesIO()
+        self.image_service.generate(request).image.save(buffer, format="PNG")
+        return buffer.getvalue()
+
     def _resolve_title(self, metadata: Dict) -> str:
         return str(metadata["title"]).strip()
 
@@ -124,6 +148,16 @@ class AIThumbnailGenerator(Step):
         image.convert("RGB").save(result, format="PNG")
         return result.getvalue()
 
+    def _previous_prompt(self, path: Path, title: str, description: str, tags: str) -> str | None:
+        """Prompt an earlier attempt of this run wrote for the same metadata.
+
+        Reusing it keeps a rerun's image request identical, so the image cache answers it.
+        """
+        previous = load_json(path)
+        if (previous.get("title"), previous.get("description"), previous.get("tags")) != (title, description, tags):
+            return None
+        return str(previous.get("prompt") or "").strip() or None
+
     def _generate_prompt(self, prompts: Dict, title: str, description: str, tags: str) -> str:
         ai_config = prompts.get("thumbnail_ai", {})
         fixed_core = ai_config.get("fixed_core", "")
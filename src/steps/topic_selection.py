@@ -8,6 +8,7 @@ from src.providers.llm import GeminiProvider
 from src.tracking import AimTracker
 from src.utils.history import gather_recent_topics
 from src.utils.config import load_prompts
+from src.utils.prompt_registry import get_prompt_registry
 
 
 class TopicSelector(Step):
@@ -27,6 +28,7 @@ class TopicSelector(Step):
         self.recent_topics_runs = recent_topics_runs
         self.recent_topics_max_chars = recent_topics_max_chars
         self.prompts = load_prompts()["topic_selection"]
+        self.template = get_prompt_registry().template("topic_selection")
 
     def execute(self, inputs: Dict[str, Path]) -> Path:
         recent_topics = gather_recent_topics(self.run_dir, self.run_id, self.recent_topics_runs)
@@ -36,7 +38,7 @@ class TopicSelector(Step):
 
         tracker = AimTracker.get_instance(self.run_id)
         
-        user_prompt = self.prompts["user_template"].format(recent_topics_note=recent_note)
+        user_prompt = self.template.format(recent_topics_note=recent_note)
         system_prompt = self.prompts["system"]
         prompt_data = {"recent_topics_note": recent_note}
         prompt_log = json.dumps(prompt_data, ensure_ascii=False)
@@ -16,6 +16,7 @@ class TwitterPoster(Step):
     name = "post_twitter"
     output_filename = "tweet.json"
     is_required = False
+    depends_on = ("upload_youtube",)
 
     def __init__(
         self,
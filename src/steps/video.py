@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import re
 from pathlib import Path
 from typing import Dict
 
@@ -13,12 +17,23 @@ from src.core.media_utils import (
     sanitize_path_for_ffmpeg,
 )
 from src.core.step import Step
+from src.core.streaming import FRAGMENTED_MP4_FLAGS, FragmentedEncode
 from src.providers.video_effects import VideoEffectContext, VideoEffectPipeline
+from src.services.encoder_profiles import EncoderProfile, EncoderProfileStore
+from src.utils.ass import build_force_style, prepare_fonts_dir
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class VideoRenderer(Step):
     name = "render_video"
     output_filename = "video.mp4"
+    SUBTITLE_MODES = ("burn", "soft", "none")
+    BACKGROUND_COLOR = "0x193d5a"
+    LAYER_CACHE_OPTIONS = {"vcodec": "libx264", "preset": "ultrafast", "qp": "0", "pix_fmt": "yuv420p"}
+    RATE_CONTROL_MODES = ("crf", "target")
+    ENCODED_SIZE_PATTERN = re.compile(r"video:\s*([0-9.]+)\s*(?:kB|KiB)")
 
     def __init__(
         self,
@@ -52,42 +67,75 @@ class VideoRenderer(Step):
         if crf is not None and "crf" not in base_options:
             base_options["crf"] = str(crf)
         self.encoder_options = dict(base_options)
+        self.encoder_profile = self._tuned_profile(cfg.get("encoder_tuning") or {})
+        if self.encoder_profile:
+            self.encoder_options.update(self.encoder_profile.encoder_options())
         self.encoder_global_args = (
             [str(arg) for arg in encoder_global_args]
             if encoder_global_args is not None
             else [str(arg) for arg in cfg.get("encoder_global_args") or []]
         )
+        rate_cfg = cfg.get("rate_control") or {}
+        self.rate_control_mode = str(rate_cfg.get("mode") or "crf")
+        if self.rate_control_mode not in self.RATE_CONTROL_MODES:
+            raise ValueError(f"Unsupported rate_control mode: {self.rate_control_mode}")
+        self.target_mb_per_minute = float(rate_cfg.get("target_mb_per_minute", 30.0))
+        self.analysis_seconds = float(rate_cfg.get("analysis_seconds", 15.0))
+        self.static_ratio = float(rate_cfg.get("static_ratio", 0.25))
+        self.static_gop_seconds = float(rate_cfg.get("static_gop_seconds", 20.0))
+        self.render_metrics: Dict[str, float | str] = {}
+        self.streaming_upload = bool(cfg.get("streaming_upload", False))
+        self._encode: FragmentedEncode | None = None
+        self._duration = 0.0
         self.effect_pipeline = VideoEffectPipeline.from_config(cfg.get("effects"))
+        self.background_pipeline, self.top_pipeline = self.effect_pipeline.split_background()
+        layer_cfg = cfg.get("layer_cache") or {}
+        self.layer_cache_enabled = bool(layer_cfg.get("enabled", False))
+        self.layer_cache_dir = Path(layer_cfg.get("dir") or self.run_dir / "video_layers")
+        self.layer_cache_max_entries = max(int(layer_cfg.get("max_entries", 8)), 1)
+        self.layer_cache_options = {
+            str(key): str(value)
+            for key, value in (layer_cfg.get("encoder_options") or self.LAYER_CACHE_OPTIONS).items()
+            if value is not None
+        }
         subtitles_cfg = cfg.get("subtitles") or {}
-        self.subtitle_force_style = self._build_subtitle_style(subtitles_cfg)
+        self.subtitle_force_style = build_force_style(subtitles_cfg, self.resolution)
         self.subtitle_fonts_dir = self._resolve_fonts_dir(subtitles_cfg)
+        self.subtitle_mode = str(cfg.get("subtitle_mode") or "burn")
+        if self.subtitle_mode not in self.SUBTITLE_MODES:
+            raise ValueError(f"Unsupported subtitle_mode: {self.subtitle_mode}")
+        self.subtitle_language = str(cfg.get("subtitle_language") or "jpn")
         overlay_cfg = cfg.get("thumbnail_overlay") or {}
         self.thumbnail_overlay_enabled = bool(overlay_cfg.get("enabled", False))
         self.thumbnail_overlay_duration = float(overlay_cfg.get("duration_seconds", 0))
         self.thumbnail_overlay_source = str(overlay_cfg.get("source_key", "generate_thumbnail"))
+        self.renditions = [
+            self._rendition(entry) for entry in cfg.get("outputs") or [] if dict(entry).get("enabled", True)
+        ]
 
     def execute(self, inputs: Dict[str, Path]) -> Path:
-        validate_input_files(inputs, "synthesize_audio", "prepare_subtitles")
+        if self.subtitle_mode == "none":
+            validate_input_files(inputs, "synthesize_audio")
+        else:
+            validate_input_files(inputs, "synthesize_audio", "prepare_subtitles")
         audio_path = Path(inputs["synthesize_audio"])
-        subtitle_path = Path(inputs["prepare_subtitles"])
+        subtitle_path = Path(inputs["prepare_subtitles"]) if self.subtitle_mode != "none" else None
         audio_duration = get_audio_duration(audio_path)
         output_path = self.get_output_path()
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         width, height = map(int, self.resolution.split("x"))
-        video_stream = ffmpeg.input(
-            f"color=c=0x193d5a:size={width}x{height}:duration={audio_duration}:rate={self.fps}", f="lavfi"
-        )
-
         effect_ctx = VideoEffectContext(duration_seconds=audio_duration, fps=self.fps, resolution=(width, height))
-        video_stream = self.effect_pipeline.apply(video_stream, effect_ctx)
+        if self.layer_cache_enabled and self.background_pipeline.effects:
+            video_stream = ffmpeg.input(str(self._cached_background(effect_ctx)))
+            video_stream = self.top_pipeline.apply(video_stream, effect_ctx)
+        else:
+            video_stream = self.effect_pipeline.apply(self._background_source(effect_ctx), effect_ctx)
 
-        subtitle_kwargs: Dict[str, str] = {}
-        if self.subtitle_force_style:
-            subtitle_kwargs["force_style"] = self.subtitle_force_style
-        if self.subtitle_fonts_dir:
-            subtitle_kwargs["fontsdir"] = self.subtitle_fonts_dir
-        video_stream = video_stream.filter("subtitles", sanitize_path_for_ffmpeg(subtitle_path), **subtitle_kwargs)
+        if self.subtitle_mode == "burn":
+            video_stream = video_stream.filter(
+                "subtitles", sanitize_path_for_ffmpeg(subtitle_path), **self.subtitle_filter_kwargs(subtitle_path)
+            )
 
         if self.thumbnail_overlay_enabled and self.thumbnail_overlay_duration > 0:
             thumbnail_input = inputs.get(self.thumbnail_overlay_source)
@@ -102,42 +150,244 @@ class VideoRenderer(Step):
                     fps=self.fps,
                 )
 
-        audio_stream = ffmpeg.input(str(audio_path))
-        output = ffmpeg.output(video_stream, audio_stream, str(output_path), **self.encoder_options).overwrite_output()
+        output_options = dict(self.encoder_options)
+        if self.rate_control_mode == "target":
+            output_options = self._rate_controlled(output_options, video_stream, audio_duration)
+        audio_stream = ffmpeg.input(str(audio_path)).audio
+        if self.renditions:
+            branches = len(self.renditions) + 1
+            video_split = video_stream.filter_multi_output("split", branches)
+            audio_split = audio_stream.filter_multi_output("asplit", branches)
+            video_stream, audio_stream = video_split[0], audio_split[0]
+        streams = [video_stream, audio_stream]
+        if self.subtitle_mode == "soft":
+            streams.append(ffmpeg.input(str(subtitle_path))["s"])
+            output_options.update({"scodec": "mov_text", "metadata:s:s:0": f"language={self.subtitle_language}"})
+        streaming = self.streaming_upload and self._streaming_blocker(output_options) is None
+        if streaming:
+            output_options.update({"f": "mp4", "movflags": FRAGMENTED_MP4_FLAGS})
+        output = ffmpeg.output(*streams, "pipe:" if streaming else str(output_path), **output_options)
+        if self.renditions:
+            output = ffmpeg.merge_outputs(
+                output,
+                *(
+                    self._rendition_output(rendition, video_split[index], audio_split[index], (width, height))
+                    for index, rendition in enumerate(self.renditions, start=1)
+                ),
+            )
+        output = output.overwrite_output()
         if self.encoder_global_args:
             output = output.global_args(*self.encoder_global_args)
+        self._duration = audio_duration
+        if streaming:
+            process = ffmpeg.run_async(
+                output.global_args("-nostats", "-loglevel", "error"), cmd=find_ffmpeg_binary(), pipe_stdout=True
+            )
+            self._encode = FragmentedEncode(process, output_path.with_name(f"{output_path.stem}.part.mp4"))
+            return self._encode.path
         ffmpeg.run(output, cmd=find_ffmpeg_binary(), capture_stdout=True, capture_stderr=True)
+        self._record_output(output_path)
         return output_path
 
-    def _build_subtitle_style(self, config: Dict) -> str:
-        if hasattr(config, "model_dump"):
-            config = config.model_dump()
-        font_name = str(config.get("font_name") or "").strip()
-        if not font_name and (font_path := config.get("font_path")):
-            font_name = Path(str(font_path)).stem.replace("_", " ")
-        if not font_name:
-            font_name = "Noto Sans CJK JP"
+    def in_progress(self) -> bool:
+        return self._encode is not None
 
-        width, height = map(int, self.resolution.split("x"))
-        parts = [
-            f"PlayResX={width}",
-            f"PlayResY={height}",
-            f"FontName={font_name}",
-            f"FontSize={int(config.get('font_size', 24))}",
-            f"PrimaryColour={config.get('primary_colour', '&HFFFFFF&')}",
-            f"OutlineColour={config.get('outline_colour', '&H000000&')}",
-            f"Outline={int(config.get('outline', 2))}",
-        ]
-        for key in ("Shadow", "Bold", "Italic", "Alignment"):
-            if (val := config.get(key.lower())) is not None:
-                parts.append(f"{key}={val}")
-        for key, ass_key in (("margin_l", "MarginL"), ("margin_r", "MarginR"), ("margin_v", "MarginV")):
-            if (val := config.get(key)) is not None:
-                parts.append(f"{ass_key}={int(val)}")
-        return ",".join(parts)
+    def finalize(self) -> Path:
+        """Wait for a streamed encode and move the finished fragmented MP4 into place."""
+        output_path = self.get_output_path()
+        if self._encode is None:
+            return output_path
+        encode, self._encode = self._encode, None
+        encode.wait()
+        encode.path.replace(output_path)
+        encode.close()
+        self._record_output(output_path)
+        return output_path
+
+    def _streaming_blocker(self, options: Dict[str, str]) -> str | None:
+        """Why this encode cannot be written as fragmented MP4 to a pipe, if anything prevents it."""
+        reason = None
+        if "faststart" in options.get("movflags", ""):
+            reason = "movflags=faststart rewrites the file after encoding"
+        elif "pass" in options or "pass:v" in options:
+            reason = "multi-pass encoding needs the complete file"
+        elif options.get("f", "mp4") != "mp4" or self.get_output_path().suffix != ".mp4":
+            reason = "only MP4 can be fragmented"
+        if reason:
+            logger.info("Streaming upload disabled for this render: %s", reason)
+        return reason
+
+    def _record_output(self, output_path: Path) -> None:
+        if output_path.exists() and self._duration > 0:
+            self.render_metrics["achieved_kbps"] = round(output_path.stat().st_size * 8 / self._duration / 1000, 1)
+            self.render_metrics["output_bytes"] = output_path.stat().st_size
+
+    def metrics(self) -> Dict[str, float | str]:
+        return dict(self.render_metrics)
+
+    def _rate_controlled(self, options: Dict[str, str], video_stream, duration: float) -> Dict[str, str]:
+        """Sample-encode the opening seconds at the configured CRF, then keep CRF or switch to a capped VBV.
+
+        The cap always applies so spikes stay under the target; content that already compresses far below the
+        target is treated as static and gets a longer GOP.
+        """
+        sample_seconds = min(self.analysis_seconds, duration)
+        target_kbps = self.target_mb_per_minute * 8000 / 60
+        video_options = {key: value for key, value in options.items() if not key.startswith(("a", "b:a"))}
+        analysis = ffmpeg.output(video_stream.filter("trim", duration=sample_seconds), "-", f="null", **video_options)
+        _, log = ffmpeg.run(analysis, cmd=find_ffmpeg_binary(), capture_stdout=True, capture_stderr=True)
+        sizes = self.ENCODED_SIZE_PATTERN.findall((log or b"").decode("utf-8", errors="replace"))
+        if not sizes or sample_seconds <= 0:
+            logger.warning("Rate control analysis produced no size estimate; keeping CRF settings")
+            return options
+        estimated_kbps = float(sizes[-1]) * 1024 * 8 / sample_seconds / 1000
+        cap = int(target_kbps)
+        controlled = {**options, "maxrate": f"{cap}k", "bufsize": f"{cap * 2}k"}
+        mode = "crf"
+        if estimated_kbps > target_kbps:
+            mode = "vbv"
+            controlled.pop("crf", None)
+            controlled["b:v"] = f"{cap}k"
+        if estimated_kbps <= target_kbps * self.static_ratio:
+            controlled["g"] = str(int(self.fps * self.static_gop_seconds))
+        self.render_metrics.update(
+            {
+                "rate_control": mode,
+                "estimated_kbps": round(estimated_kbps, 1),
+                "target_kbps": round(target_kbps, 1),
+                "gop": int(controlled.get("g", 0)),
+            }
+        )
+        logger.info(
+            "Rate control %s: estimated %.0f kbps against a %.0f kbps target", mode, estimated_kbps, target_kbps
+        )
+        return controlled
+
+    def _tuned_profile(self, config: Dict) -> EncoderProfile | None:
+        """Fastest benchmarked settings meeting the targets; the configured encoder stays when none qualifies."""
+        if not config.get("enabled", False):
+            return None
+        profile = EncoderProfileStore(Path(config.get("store") or "runs/encoder_profiles.json")).select(
+            self.resolution,
+            min_ssim=float(config.get("min_ssim", 0.0)),
+            max_kbps=config.get("max_kbps"),
+            codecs=config.get("codecs"),
+        )
+        if profile:
+            logger.info(
+                "Using tuned encoder %s preset=%s crf=%s threads=%s (%.1f fps, ssim=%.4f, %.0f kbps)",
+                profile.codec,
+                profile.preset,
+                profile.crf,
+                profile.threads,
+                profile.encode_fps,
+                profile.ssim,
+                profile.kbps,
+            )
+        return profile
+
+    def artifacts(self) -> Dict[str, Path]:
+        paths = {
+            rendition["name"]: self.get_output_path().with_name(rendition["filename"]) for rendition in self.renditions
+        }
+        return {name: path for name, path in paths.items() if path.exists()}
+
+    def _rendition(self, entry: Dict) -> Dict:
+        entry = dict(entry)
+        name = str(entry["name"])
+        width, height = map(int, str(entry.get("resolution") or self.resolution).split("x"))
+        fit = str(entry.get("fit") or "scale")
+        if fit not in ("scale", "crop"):
+            raise ValueError(f"Unsupported output fit: {fit}")
+        options = dict(self.encoder_options)
+        options.update(
+            {str(key): str(value) for key, value in (entry.get("encoder_options") or {}).items() if value is not None}
+        )
+        return {
+            "name": name,
+            "filename": str(entry.get("filename") or f"video_{name}.mp4"),
+            "size": (width, height),
+            "fit": fit,
+            "start": float(entry.get("start_seconds") or 0.0),
+            "duration": entry.get("duration_seconds"),
+            "encoder_options": options,
+        }
+
+    def _rendition_output(self, rendition: Dict, video, audio, source_size: tuple[int, int]):
+        """One branch of the split graph: aspect crop, scale and clip range, encoded with its own options."""
+        width, height = rendition["size"]
+        if rendition["fit"] == "crop":
+            source_width, source_height = source_size
+            crop_width = min(source_width, source_height * width // height) // 2 * 2
+            crop_height = min(source_height, source_width * height // width) // 2 * 2
+            video = video.filter(
+                "crop", crop_width, crop_height, (source_width - crop_width) // 2, (source_height - crop_height) // 2
+            )
+        video = video.filter("scale", width, height)
+        if rendition["start"] or rendition["duration"] is not None:
+            trim = {"start": rendition["start"]}
+            if rendition["duration"] is not None:
+                trim["duration"] = float(rendition["duration"])
+            video = video.filter("trim", **trim).filter("setpts", "PTS-STARTPTS")
+            audio = audio.filter("atrim", **trim).filter("asetpts", "PTS-STARTPTS")
+        path = self.get_output_path().with_name(rendition["filename"])
+        return ffmpeg.output(video, audio, str(path), **rendition["encoder_options"])
+
+    def _background_source(self, ctx: VideoEffectContext):
+        width, height = ctx.resolution
+        return ffmpeg.input(
+            f"color=c={self.BACKGROUND_COLOR}:size={width}x{height}:duration={ctx.duration_seconds}:rate={ctx.fps}",
+            f="lavfi",
+        )
+
+    def layer_cache_key(self, ctx: VideoEffectContext) -> str:
+        payload = {
+            "color": self.BACKGROUND_COLOR,
+            "effects": [effect.cache_key() for effect in self.background_pipeline.effects],
+            "resolution": list(ctx.resolution),
+            "fps": ctx.fps,
+            "duration": round(ctx.duration_seconds, 3),
+            "encoder": self.layer_cache_options,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:24]
+
+    def _cached_background(self, ctx: VideoEffectContext) -> Path:
+        """Encode the background and its effects once as a mezzanine file and reuse it across renders."""
+        path = self.layer_cache_dir / f"{self.layer_cache_key(ctx)}.mkv"
+        if path.exists():
+            os.utime(path)
+            return path
+        self.layer_cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.tmp.mkv")
+        stream = self.background_pipeline.apply(self._background_source(ctx), ctx)
+        output = ffmpeg.output(stream, str(tmp_path), **self.layer_cache_options).overwrite_output()
+        ffmpeg.run(output, cmd=find_ffmpeg_binary(), capture_stdout=True, capture_stderr=True)
+        tmp_path.replace(path)
+        self._prune_layer_cache()
+        return path
+
+    def _prune_layer_cache(self) -> None:
+        layers = sorted(
+            (entry for entry in self.layer_cache_dir.glob("*.mkv") if not entry.name.endswith(".tmp.mkv")),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in layers[self.layer_cache_max_entries :]:
+            stale.unlink(missing_ok=True)
+
+    def subtitle_filter_kwargs(self, subtitle_path: Path) -> Dict[str, str]:
+        """libass options; ASS files already carry their style, so only SRT gets ``force_style``."""
+        kwargs: Dict[str, str] = {}
+        if self.subtitle_force_style and subtitle_path.suffix.lower() != ".ass":
+            kwargs["force_style"] = self.subtitle_force_style
+        if self.subtitle_fonts_dir:
+            kwargs["fontsdir"] = self.subtitle_fonts_dir
+        return kwargs
 
     def _resolve_fonts_dir(self, config: Dict) -> str | None:
+        if hasattr(config, "model_dump"):
+            config = config.model_dump()
         if not (font_path := config.get("font_path")):
             return None
-        path = Path(str(font_path))
-        return sanitize_path_for_ffmpeg(path.resolve().parent) if path.exists() else None
+        fonts_dir = prepare_fonts_dir(font_path, Path(self.run_dir) / "subtitle_fonts")
+        return sanitize_path_for_ffmpeg(fonts_dir.resolve()) if fonts_dir else None
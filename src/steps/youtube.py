@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 from typing import Dict
 
 from src.brand import active_brand, apply_active_brand_to_metadata
 from src.core.media_utils import resolve_video_input
 from src.core.step import Step
+from src.core.streaming import active_encode
 from src.providers.youtube import YouTubeClient
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class YouTubeUploader(Step):
     name = "upload_youtube"
     output_filename = "youtube.json"
     is_required = False
+    consumes_stream = True
 
     def __init__(
         self,
@@ -23,7 +29,8 @@ class YouTubeUploader(Step):
     ) -> None:
         super().__init__(run_id, run_dir)
         youtube_config = dict(youtube_config or {})
-        if active_brand() is not None:
+        self.render_profile = str(youtube_config.get("render_profile", "full"))
+        if active_brand() is not None or self.render_profile == "draft":
             youtube_config["dry_run"] = True
             youtube_config["default_visibility"] = "private"
 
@@ -34,7 +41,13 @@ class YouTubeUploader(Step):
             default_tags=youtube_config.get("default_tags", []),
             max_title_length=int(youtube_config.get("max_title_length", 100)),
             max_description_length=int(youtube_config.get("max_description_length", 5000)),
+            upload_captions=bool(youtube_config.get("upload_captions", False)),
+            caption_language=str(youtube_config.get("caption_language", "ja")),
+            caption_name=str(youtube_config.get("caption_name", "")),
+            upload_chunk_size=int(youtube_config.get("upload_chunk_mb", 8)) * 1024 * 1024,
+            upload_max_retries=int(youtube_config.get("upload_max_retries", 5)),
         )
+        self.upload_metrics: Dict[str, float] = {}
 
     def execute(self, inputs: Dict[str, Path]) -> Path:
         video_path = resolve_video_input(inputs)
@@ -56,9 +69,27 @@ class YouTubeUploader(Step):
         ):
             thumbnail_path = None
 
+        encode = active_encode(video_path)
+        if encode is not None and not self.client.streams_uploads:
+            encode.wait()
+            encode = None
+        started = time.perf_counter()
         upload_result = self.client.upload(
-            Path(video_path), metadata, thumbnail_path=thumbnail_path
+            Path(video_path),
+            metadata,
+            thumbnail_path=thumbnail_path,
+            captions_path=self._captions_path(inputs.get("prepare_subtitles")) if self.client.upload_captions else None,
+            session_path=self.get_output_path().with_name("youtube_upload_session.json"),
+            stream=encode,
         )
+        elapsed = time.perf_counter() - started
+        size = int(upload_result.get("file_size") or Path(video_path).stat().st_size)
+        self.upload_metrics = {
+            "upload_seconds": round(elapsed, 3),
+            "upload_bytes": size,
+            "upload_mbps": round(size * 8 / elapsed / 1_000_000, 3) if elapsed > 0 else 0.0,
+        }
+        upload_result["render_profile"] = self.render_profile
         if brand := active_brand():
             upload_result["review"] = {
                 "approved": False,
@@ -78,6 +109,23 @@ class YouTubeUploader(Step):
 
         return output_path
 
+    def metrics(self) -> Dict[str, float]:
+        return dict(self.upload_metrics)
+
+    @staticmethod
+    def _captions_path(subtitles_value: Path | None) -> Path | None:
+        if not subtitles_value:
+            return None
+        path = Path(subtitles_value)
+        if path.suffix.lower() == ".srt":
+            return path
+        # The captions API takes SRT; ASS runs write an SRT copy next to the burned-in file.
+        companion = path.with_suffix(".srt")
+        if companion.exists():
+            return companion
+        logger.warning("No SRT captions next to %s; skipping the YouTube caption upload", path.name)
+        return None
+
     @staticmethod
     def _source_evidence(news_value: Path | None) -> list[dict[str, str]]:
         if not news_value:
@@ -0,0 +1,173 @@
+"""ASS (Advanced SubStation Alpha) helpers shared by subtitle formatting and video rendering."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping
+
+DEFAULT_FONT_NAME = "Noto Sans CJK JP"
+
+STYLE_FORMAT = (
+    "Name",
+    "Fontname",
+    "Fontsize",
+    "PrimaryColour",
+    "SecondaryColour",
+    "OutlineColour",
+    "BackColour",
+    "Bold",
+    "Italic",
+    "Underline",
+    "StrikeOut",
+    "ScaleX",
+    "ScaleY",
+    "Spacing",
+    "Angle",
+    "BorderStyle",
+    "Outline",
+    "Shadow",
+    "Alignment",
+    "MarginL",
+    "MarginR",
+    "MarginV",
+    "Encoding",
+)
+
+
+def _as_dict(config: Any) -> Dict[str, Any]:
+    if hasattr(config, "model_dump"):
+        return config.model_dump()
+    return dict(config or {})
+
+
+def resolve_font_name(config: Mapping[str, Any]) -> str:
+    font_name = str(config.get("font_name") or "").strip()
+    if not font_name and (font_path := config.get("font_path")):
+        font_name = Path(str(font_path)).stem.replace("_", " ")
+    return font_name or DEFAULT_FONT_NAME
+
+
+def build_force_style(config: Any, resolution: str) -> str:
+    """``force_style`` override string for the libass ``subtitles`` filter."""
+    config = _as_dict(config)
+    width, height = map(int, resolution.split("x"))
+    parts = [
+        f"PlayResX={width}",
+        f"PlayResY={height}",
+        f"FontName={resolve_font_name(config)}",
+        f"FontSize={int(config.get('font_size', 24))}",
+        f"PrimaryColour={config.get('primary_colour', '&HFFFFFF&')}",
+        f"OutlineColour={config.get('outline_colour', '&H000000&')}",
+        f"Outline={int(config.get('outline', 2))}",
+    ]
+    for key in ("Shadow", "Bold", "Italic", "Alignment"):
+        if (val := config.get(key.lower())) is not None:
+            parts.append(f"{key}={val}")
+    for key, ass_key in (("margin_l", "MarginL"), ("margin_r", "MarginR"), ("margin_v", "MarginV")):
+        if (val := config.get(key)) is not None:
+            parts.append(f"{ass_key}={int(val)}")
+    return ",".join(parts)
+
+
+def _colour(value: Any, default: str) -> str:
+    digits = str(value or default).upper().removeprefix("&H").strip("&")
+    return f"&H{digits.zfill(8)}"
+
+
+def style_line(config: Any, name: str = "Default") -> str:
+    config = _as_dict(config)
+
+    def value(key: str, default: Any) -> Any:
+        return default if config.get(key) is None else config[key]
+
+    fields = {
+        "Name": name,
+        "Fontname": resolve_font_name(config),
+        "Fontsize": int(value("font_size", 24)),
+        "PrimaryColour": _colour(config.get("primary_colour"), "&HFFFFFF&"),
+        "SecondaryColour": "&H000000FF",
+        "OutlineColour": _colour(config.get("outline_colour"), "&H000000&"),
+        "BackColour": "&H00000000",
+        "Bold": int(value("bold", 0)),
+        "Italic": int(value("italic", 0)),
+        "Underline": 0,
+        "StrikeOut": 0,
+        "ScaleX": 100,
+        "ScaleY": 100,
+        "Spacing": 0,
+        "Angle": 0,
+        "BorderStyle": 1,
+        "Outline": int(value("outline", 2)),
+        "Shadow": int(value("shadow", 0)),
+        "Alignment": int(value("alignment", 2)),
+        "MarginL": int(value("margin_l", 0)),
+        "MarginR": int(value("margin_r", 0)),
+        "MarginV": int(value("margin_v", 10)),
+        "Encoding": 1,
+    }
+    return "Style: " + ",".join(str(fields[key]) for key in STYLE_FORMAT)
+
+
+def format_timestamp(seconds: float) -> str:
+    centiseconds = max(0, round(seconds * 100))
+    hours, rest = divmod(centiseconds, 360000)
+    minutes, rest = divmod(rest, 6000)
+    secs, cs = divmod(rest, 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{cs:02d}"
+
+
+def escape_text(text: str) -> str:
+    """Neutralise characters libass treats as override syntax."""
+    return text.replace("\\", "＼").replace("{", "｛").replace("}", "｝")
+
+
+def render_ass(cues: Iterable[Dict[str, Any]], style: Any, resolution: str) -> str:
+    """Full ASS script; each cue has ``start``/``end`` seconds and pre-wrapped ``lines``."""
+    width, height = map(int, resolution.split("x"))
+    lines: List[str] = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {width}",
+        f"PlayResY: {height}",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        "Format: " + ", ".join(STYLE_FORMAT),
+        style_line(style),
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+    ]
+    for cue in cues:
+        text = r"\N".join(escape_text(line) for line in cue["lines"])
+        lines.append(
+            f"Dialogue: 0,{format_timestamp(cue['start'])},{format_timestamp(cue['end'])},Default,,0,0,0,,{text}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def prepare_fonts_dir(font_path: str | Path, cache_root: str | Path) -> Path | None:
+    """Directory holding only ``font_path``, reused across renders.
+
+    libass scans every file in ``fontsdir``; pointing it at the font's own
+    folder (often a system or asset directory with many fonts) makes setup
+    cost grow with that folder.
+    """
+    source = Path(font_path)
+    if not source.is_file():
+        return None
+    stat = source.stat()
+    digest = hashlib.sha1(f"{source.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+    target_dir = Path(cache_root) / digest
+    target = target_dir / source.name
+    if target.exists():
+        return target_dir
+    target_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+    return target_dir
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import Annotated, Dict, Literal, Union
 
@@ -7,6 +8,7 @@ import yaml
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.utils.constants import DEFAULT_COOLDOWN_HOURS, DEFAULT_FETCH_COUNT, QUERY_BUCKETS
+from src.utils.prompt_registry import get_prompt_registry
 from src.utils.secrets import load_secret_values
 
 
@@ -21,6 +23,15 @@ class NewsStepConfig(BaseModel):
     fetch_count: int = DEFAULT_FETCH_COUNT
     final_count: int = 3
     cooldown_hours: int = DEFAULT_COOLDOWN_HOURS
+    fan_out: bool = False
+    provider_timeout_seconds: float | None = 60.0
+    provider_timeouts: Dict[str, float] = Field(default_factory=dict)
+    near_duplicate_threshold: float | None = 0.55
+    near_duplicate_shingle_size: int = 2
+    selection_mode: Literal["llm", "mmr"] = "llm"
+    mmr_diversity: float = 0.7
+    prefetch_max_age_minutes: float = 0
+    prefetch_lead_minutes: float = 5
     # Legacy/Deprecated
     count: int = 3
     query: str | None = None
@@ -45,6 +56,7 @@ class ScriptStepConfig(BaseModel):
     min_duration: int
     max_duration: int
     target_wow_score: float
+    structured_output: bool = True
     speakers: ScriptSpeakersConfig
 
 
@@ -112,6 +124,7 @@ class KenBurnsEffectConfig(BaseModel):
     max_zoom: float = 1.2
     hold_frame_factor: float = 1.0
     pan_mode: str = "center"
+    internal_scale: float = 1.0
 
 
 VideoEffectConfig = Annotated[
@@ -162,6 +175,48 @@ class VideoThumbnailFlashConfig(BaseModel):
     source_key: str = "generate_thumbnail"
 
 
+class VideoLayerCacheConfig(BaseModel):
+    enabled: bool = False
+    dir: str | None = None
+    max_entries: int = 8
+    encoder_options: Dict[str, str | int | float] | None = None
+
+
+class VideoOutputConfig(BaseModel):
+    name: str
+    enabled: bool = True
+    resolution: str | None = None
+    fit: Literal["scale", "crop"] = "scale"
+    start_seconds: float = 0.0
+    duration_seconds: float | None = None
+    filename: str | None = None
+    encoder_options: Dict[str, str | int | float] = Field(default_factory=dict)
+
+
+class VideoEncoderTuningConfig(BaseModel):
+    enabled: bool = False
+    store: str = "runs/encoder_profiles.json"
+    min_ssim: float = 0.97
+    max_kbps: float | None = None
+    codecs: list[str] | None = None
+
+
+class VideoRateControlConfig(BaseModel):
+    mode: Literal["crf", "target"] = "crf"
+    target_mb_per_minute: float = 30.0
+    analysis_seconds: float = 15.0
+    static_ratio: float = 0.25
+    static_gop_seconds: float = 20.0
+
+
+class VideoDraftProfileConfig(BaseModel):
+    resolution: str = "640x360"
+    fps: int = 12
+    preset: str = "ultrafast"
+    crf: int = 38
+    skip_effects: list[str] = Field(default_factory=lambda: ["ken_burns"])
+
+
 class VideoStepConfig(BaseModel):
     resolution: str
     fps: int
@@ -170,16 +225,53 @@ class VideoStepConfig(BaseModel):
     crf: int | None = None
     encoder_options: Dict[str, str | int | float] = Field(default_factory=dict)
     encoder_global_args: list[str] = Field(default_factory=list)
+    encoder_tuning: VideoEncoderTuningConfig = Field(default_factory=VideoEncoderTuningConfig)
+    rate_control: VideoRateControlConfig = Field(default_factory=VideoRateControlConfig)
     effects: list[VideoEffectConfig] = Field(default_factory=list)
+    layer_cache: VideoLayerCacheConfig = Field(default_factory=VideoLayerCacheConfig)
+    outputs: list[VideoOutputConfig] = Field(default_factory=list)
+    streaming_upload: bool = False
     subtitles: VideoSubtitleStyleConfig | None = None
+    subtitle_mode: Literal["burn", "soft", "none"] = "burn"
+    subtitle_language: str = "jpn"
     intro_outro: VideoIntroOutroConfig | None = None
     thumbnail_overlay: VideoThumbnailFlashConfig | None = None
+    profile: Literal["full", "draft"] = "full"
+    draft: VideoDraftProfileConfig = Field(default_factory=VideoDraftProfileConfig)
+
+    def apply_profile(self, profile: str) -> None:
+        """Swap in the draft encode for review-only runs; ``full`` leaves the publish settings untouched."""
+        self.profile = profile
+        if profile != "draft":
+            return
+        scale = _resolution_height(self.draft.resolution) / _resolution_height(self.resolution)
+        if self.subtitles is not None:
+            # Font size and margins are in frame pixels, so they shrink with the frame.
+            for field_name in ("font_size", "margin_l", "margin_r", "margin_v"):
+                value = getattr(self.subtitles, field_name)
+                if value:
+                    setattr(self.subtitles, field_name, max(1, round(value * scale)))
+        self.resolution, self.fps = self.draft.resolution, self.draft.fps
+        self.preset, self.crf = self.draft.preset, self.draft.crf
+        self.encoder_tuning.enabled = False
+        self.rate_control.mode = "crf"
+        self.streaming_upload = False
+        self.encoder_options = {
+            key: value for key, value in self.encoder_options.items() if key not in {"preset", "crf", "b:v", "maxrate"}
+        }
+        self.effects = [effect for effect in self.effects if effect.type not in self.draft.skip_effects]
+        self.outputs = []
+
+
+def _resolution_height(resolution: str) -> int:
+    return int(resolution.lower().split("x", 1)[1])
 
 
 class SubtitleStepConfig(BaseModel):
     width_per_char_pixels: int
     min_visual_width: int
     max_visual_width: int
+    format: Literal["srt", "ass"] = "srt"
 
 
 class ThumbnailOverlayOffsetConfig(BaseModel):
@@ -256,6 +348,11 @@ class YouTubeStepConfig(BaseModel):
     default_visibility: str
     category_id: int
     default_tags: list[str] = Field(default_factory=list)
+    upload_captions: bool = False
+    caption_language: str = "ja"
+    caption_name: str = ""
+    upload_chunk_mb: int = 8
+    upload_max_retries: int = 5
 
 
 class TwitterStepConfig(BaseModel):
@@ -276,6 +373,19 @@ class PodcastStepConfig(BaseModel):
     feed_description: str = "AI生成の日本経済・金融ニュース解説"
     feed_author: str = "2510 YouTuber AI"
     feed_url: str = "https://example.com/podcast"
+    feed_dir: str = "runs/podcast"
+    window_size: int = 50
+    media_base_url: str | None = None
+
+
+class PodcastAudioStepConfig(BaseModel):
+    codec: Literal["mp3", "aac", "opus"] = "mp3"
+    bitrate: str = "96k"
+    sample_rate: int = 44100
+    channels: int = 1
+    loudness_lufs: float = -16.0
+    true_peak_db: float = -1.5
+    loudness_range: float = 11.0
 
 
 class BuzzsproutStepConfig(BaseModel):
@@ -302,6 +412,19 @@ class HatenaStepConfig(BaseModel):
     api_key: str | None = None
 
 
+class PublishPolicyConfig(BaseModel):
+    timeout_seconds: float | None = None
+    retries: int | None = None
+
+
+class PublishStageConfig(BaseModel):
+    concurrent: bool = False
+    timeout_seconds: float = 1800.0
+    retries: int = 1
+    retry_backoff_seconds: float = 10.0
+    policies: Dict[str, PublishPolicyConfig] = Field(default_factory=dict)
+
+
 class StepsConfig(BaseModel):
     news: NewsStepConfig
     script: ScriptStepConfig
@@ -317,7 +440,9 @@ class StepsConfig(BaseModel):
     linkedin: LinkedInStepConfig = Field(default_factory=LinkedInStepConfig)
     hatena: HatenaStepConfig = Field(default_factory=HatenaStepConfig)
     podcast: PodcastStepConfig
+    podcast_audio: PodcastAudioStepConfig = Field(default_factory=PodcastAudioStepConfig)
     buzzsprout: BuzzsproutStepConfig
+    publish: PublishStageConfig = Field(default_factory=PublishStageConfig)
 
 
 class GeminiProviderConfig(BaseModel):
@@ -361,11 +486,31 @@ class CloudflareAIConfig(BaseModel):
     model: str = "@cf/black-forest-labs/flux-1-schnell"
 
 
+class ImageWorkerConfig(BaseModel):
+    enabled: bool = False
+    address: str = "127.0.0.1:7861"
+    backend: Literal["zimage", "stub"] = "zimage"
+    max_batch: int = 4
+    timeout_seconds: float = 900.0
+    model_path: str = "external/hf-cache-hub/models/Z-Image-Turbo"
+    device: str = "cuda"
+    batch_size: int = 1
+    compile_model: bool = False
+
+
+class ImageCacheConfig(BaseModel):
+    enabled: bool = True
+    directory: str = "runs/image_cache"
+    max_size_mb: int = 2048
+
+
 class ProvidersConfig(BaseModel):
     llm: LLMProvidersConfig
     tts: TTSProvidersConfig
     news: NewsProvidersConfig
     cloudflare_ai: CloudflareAIConfig = Field(default_factory=CloudflareAIConfig)
+    image_worker: ImageWorkerConfig = Field(default_factory=ImageWorkerConfig)
+    image_cache: ImageCacheConfig = Field(default_factory=ImageCacheConfig)
 
 
 class LoggingConfig(BaseModel):
@@ -391,6 +536,7 @@ class AutomationScheduleConfig(BaseModel):
     cron: str
     env: Dict[str, str] = Field(default_factory=dict)
     log_file: str | None = None
+    prefetch_news: bool = True
 
 
 class AutomationConfig(BaseModel):
@@ -431,9 +577,8 @@ class Config(BaseModel):
 
 def load_prompts(prompts_path: str | Path | None = None) -> Dict:
     if prompts_path is None:
-        prompts_path = Path(__file__).parent.parent.parent / "config" / "prompts.yaml"
-    else:
-        prompts_path = Path(prompts_path)
+        # The registry's dict is shared by every caller; hand out a copy so edits stay local.
+        return copy.deepcopy(get_prompt_registry().prompts())
 
-    with open(prompts_path) as f:
+    with open(Path(prompts_path)) as f:
         return yaml.safe_load(f)
@@ -3,9 +3,8 @@ import os
 from pathlib import Path
 from typing import Iterable
 
-import requests
-
 from src.core.media_utils import resolve_video_input
+from src.providers.http import http_session
 from src.utils.secrets import load_secret_values
 
 
@@ -75,4 +74,4 @@ def post_run_summary(
         return
 
     content = f"Run {run_id}\n" + "\n".join(lines)
-    requests.post(webhook, json={"content": content}, timeout=5)
+    http_session(webhook).post(webhook, json={"content": content}, timeout=5)
@@ -0,0 +1,147 @@
+"""Maximal-marginal-relevance selection over character n-gram TF-IDF vectors."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.near_duplicates import normalize_text
+
+
+@dataclass(frozen=True)
+class TfidfRows:
+    """Sparse L2-normalised rows: entry ``e`` holds weight ``data[e]`` for n-gram ``indices[e]`` of ``rows[e]``.
+
+    Entries are sorted by row, so row ``i`` spans ``indptr[i]:indptr[i + 1]`` (CSR layout). ``by_column``
+    orders the entries by n-gram and ``column_ptr`` delimits each n-gram's run, so a similarity query
+    only touches the rows that share an n-gram with it.
+    """
+
+    indptr: np.ndarray
+    rows: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    width: int
+    by_column: np.ndarray
+    column_ptr: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def similarity(self, queries: Sequence[int]) -> np.ndarray:
+        """Cosine similarity of every row to each row in ``queries``, shaped ``(len(queries), len(self))``."""
+        result = np.zeros((len(queries), len(self)), dtype=np.float32)
+        for position, query in enumerate(queries):
+            span = slice(self.indptr[query], self.indptr[query + 1])
+            starts = self.column_ptr[self.indices[span]]
+            lengths = self.column_ptr[self.indices[span] + 1] - starts
+            if not lengths.sum():
+                continue
+            # Expand each shared n-gram's run of entries and weight it by the query's own weight.
+            offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            entries = self.by_column[offsets]
+            weights = np.repeat(self.data[span], lengths) * self.data[entries]
+            result[position] = np.bincount(self.rows[entries], weights=weights, minlength=len(self))
+        return result
+
+    def toarray(self) -> np.ndarray:
+        matrix = np.zeros((len(self), self.width), dtype=np.float32)
+        matrix[self.rows, self.indices] = self.data
+        return matrix
+
+
+def char_ngram_tfidf(texts: Sequence[str], ngram_range: Tuple[int, int] = (2, 3)) -> TfidfRows:
+    """Return L2-normalised TF-IDF rows over NFKC character n-grams.
+
+    N-grams are numbered without building strings: the n-gram at each position is its (n-1)-gram id
+    extended by the next character, renumbered densely, so ids stay small for any ``ngram_range``.
+    """
+    low, high = ngram_range
+    count = len(texts)
+    encoded = [np.frombuffer(normalize_text(text).encode("utf-32-le"), dtype=np.uint32) for text in texts]
+    characters = np.concatenate(encoded).astype(np.int64) if encoded else np.zeros(0, dtype=np.int64)
+    owner = np.repeat(np.arange(count, dtype=np.int64), [len(text) for text in encoded])
+    alphabet = 0x110000  # every code point, so bigram keys need no renumbered characters
+
+    gram_rows: List[np.ndarray] = []
+    gram_ids: List[np.ndarray] = []
+    width = 0
+    ids = characters
+    for size in range(1, high + 1):
+        if size == 1 and low <= 1:
+            ids = np.unique(characters, return_inverse=True)[1].reshape(-1).astype(np.int64)
+        elif size > 1:
+            # The n-gram at position p is valid when its last character belongs to the same text.
+            length = max(len(ids) - 1, 0)
+            valid = owner[:length] == owner[size - 1 : size - 1 + length]
+            keys = ids[:length] * alphabet + characters[size - 1 : size - 1 + length]
+            ids = np.full(len(keys), -1, dtype=np.int64)
+            ids[valid] = np.unique(keys[valid], return_inverse=True)[1].reshape(-1)
+        if size >= low:
+            present = ids >= 0
+            gram_rows.append(owner[: len(ids)][present])
+            gram_ids.append(ids[present] + width)
+            width += int(ids.max()) + 1 if present.any() else 0
+    return _tfidf_rows(gram_rows, gram_ids, count, width)
+
+
+def _tfidf_rows(gram_rows: List[np.ndarray], gram_ids: List[np.ndarray], count: int, width: int) -> TfidfRows:
+    rows = np.concatenate(gram_rows) if gram_rows else np.zeros(0, dtype=np.int64)
+    grams = np.concatenate(gram_ids) if gram_ids else np.zeros(0, dtype=np.int64)
+    pairs, counts = np.unique(rows * max(width, 1) + grams, return_counts=True)
+    rows, indices = np.divmod(pairs, max(width, 1))
+    document_frequency = np.bincount(indices, minlength=width)
+    idf = np.log((1 + count) / (1 + document_frequency)) + 1
+    data = (counts * idf[indices]).astype(np.float32)
+    norms = np.sqrt(np.bincount(rows, weights=data.astype(np.float64) ** 2, minlength=count)).astype(np.float32)
+    data /= norms[rows]
+    indptr = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=count), out=indptr[1:])
+    column_ptr = np.zeros(width + 1, dtype=np.int64)
+    np.cumsum(document_frequency, out=column_ptr[1:])
+    return TfidfRows(
+        indptr=indptr,
+        rows=rows,
+        indices=indices,
+        data=data,
+        width=width,
+        by_column=np.argsort(indices),
+        column_ptr=column_ptr,
+    )
+
+
+def mmr_select(
+    candidates: Sequence[str],
+    recent: Sequence[str],
+    k: int,
+    diversity: float = 0.7,
+    ngram_range: Tuple[int, int] = (2, 3),
+) -> List[int]:
+    """Pick ``k`` candidate indices, trading rank order against redundancy.
+
+    Relevance decays linearly with the candidate's position (providers return
+    their best items first); the redundancy penalty is the highest cosine
+    similarity to any recent topic or already selected candidate. Ties resolve
+    to the lower index, so the result is deterministic.
+    """
+    count = len(candidates)
+    if count == 0 or k <= 0:
+        return []
+    vectors = char_ngram_tfidf([*candidates, *recent], ngram_range)
+    if len(recent):
+        penalty = vectors.similarity(range(count, count + len(recent)))[:, :count].max(axis=0)
+    else:
+        penalty = np.zeros(count, dtype=np.float32)
+    relevance = 1.0 - np.arange(count, dtype=np.float32) / count
+    available = np.ones(count, dtype=bool)
+
+    selected: List[int] = []
+    for _ in range(min(k, count)):
+        scores = np.where(available, (1 - diversity) * relevance - diversity * penalty, -np.inf)
+        index = int(np.argmax(scores))
+        selected.append(index)
+        available[index] = False
+        np.maximum(penalty, vectors.similarity([index])[0, :count], out=penalty)
+    return selected
@@ -0,0 +1,109 @@
+"""Shared entity and keyword matching compiled once from ``config/keywords.yaml``."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Mapping, Sequence, Tuple
+
+import yaml
+
+KEYWORDS_PATH = Path(__file__).parent.parent.parent / "config" / "keywords.yaml"
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]|()")
+_TERMINAL = ""
+
+
+class KeywordVocabulary:
+    """Literal patterns in a character trie, walked once from every position; other patterns as regexes.
+
+    The walk reports every term that starts at a position, so overlapping terms and terms that share a
+    prefix are all found. The few patterns that need regex syntax are each searched on their own.
+    """
+
+    def __init__(self, entries: Mapping[str, Sequence[str]]):
+        self.labels: Tuple[str, ...] = tuple(entries)
+        self._trie: Dict[str, dict] = {}
+        self._regexes: List[Tuple[re.Pattern[str], str]] = []
+        for label, patterns in entries.items():
+            for pattern in patterns:
+                literal = _literal(pattern)
+                if literal is None:
+                    self._regexes.append((re.compile(pattern, re.IGNORECASE), label))
+                elif literal:
+                    node = self._trie
+                    for char in literal.lower():
+                        node = node.setdefault(char, {})
+                    node.setdefault(_TERMINAL, set()).add(label)
+        self._order = {label: index for index, label in enumerate(self.labels)}
+        self.match = lru_cache(maxsize=4096)(self._match)
+
+    def ordered(self, text: str) -> List[str]:
+        """Matched labels in vocabulary order."""
+        return sorted(self.match(text), key=self._order.__getitem__)
+
+    def _match(self, text: str) -> FrozenSet[str]:
+        if not text:
+            return frozenset()
+        found: set[str] = set()
+        if self._trie:
+            lowered = text.lower()
+            for start in range(len(lowered)):
+                node = self._trie.get(lowered[start])
+                position = start + 1
+                while node is not None:
+                    found.update(node.get(_TERMINAL, ()))
+                    if position == len(lowered):
+                        break
+                    node = node.get(lowered[position])
+                    position += 1
+        found.update(label for regex, label in self._regexes if label not in found and regex.search(text))
+        return frozenset(found)
+
+
+class KeywordMatcher:
+    def __init__(self, vocabularies: Mapping[str, Mapping[str, Sequence[str]] | Sequence[str]]):
+        self._vocabularies = {name: KeywordVocabulary(_entries(raw)) for name, raw in vocabularies.items()}
+
+    def __getitem__(self, name: str) -> KeywordVocabulary:
+        return self._vocabularies[name]
+
+    def match(self, vocabulary: str, text: str) -> FrozenSet[str]:
+        return self._vocabularies[vocabulary].match(text)
+
+    def count(self, vocabulary: str, text: str) -> int:
+        return len(self._vocabularies[vocabulary].match(text))
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "KeywordMatcher":
+        return cls(yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {})
+
+
+def _entries(raw: Mapping[str, Sequence[str]] | Sequence[str]) -> Dict[str, List[str]]:
+    if isinstance(raw, Mapping):
+        return {str(label): [str(pattern) for pattern in patterns] for label, patterns in raw.items()}
+    return {str(term): [re.escape(str(term))] for term in raw}
+
+
+def _literal(pattern: str) -> str | None:
+    """The text ``pattern`` matches when it contains no regex syntax beyond escaped punctuation, else ``None``."""
+    chars: List[str] = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            if char.isalnum():
+                return None
+            chars.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in REGEX_METACHARACTERS:
+            return None
+        else:
+            chars.append(char)
+    return None if escaped else "".join(chars)
+
+
+@lru_cache(maxsize=1)
+def get_keyword_matcher() -> KeywordMatcher:
+    return KeywordMatcher.from_file(KEYWORDS_PATH)
@@ -0,0 +1,100 @@
+"""Near-duplicate clustering with character n-gram MinHash and LSH banding."""
+
+from __future__ import annotations
+
+import random
+import re
+import unicodedata
+import zlib
+from typing import Dict, List, Sequence, Set, Tuple
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    return _NON_WORD.sub("", unicodedata.normalize("NFKC", text or "").casefold())
+
+
+def shingles(text: str, size: int = 3) -> Set[str]:
+    normalized = normalize_text(text)
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+
+def jaccard(left: Set[str], right: Set[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Choose (bands, rows) whose S-curve midpoint ``(1/b)^(1/r)`` is closest to ``threshold``."""
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashClusterer:
+    """Group texts whose shingle sets have Jaccard similarity above ``threshold``.
+
+    Each text is hashed once into ``num_perm`` MinHash values and bucketed by
+    LSH bands, so the work grows linearly with the number of texts. Candidate
+    pairs from shared buckets are confirmed with the exact shingle Jaccard.
+    """
+
+    def __init__(self, threshold: float = 0.5, shingle_size: int = 3, num_perm: int = 64, seed: int = 2511):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)]
+        self.bands, self.rows = lsh_bands(num_perm, threshold)
+
+    def signature(self, shingle_set: Set[str]) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingle_set]
+        if not hashes:
+            return tuple([_MAX_HASH] * self.num_perm)
+        return tuple(min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in self._perms)
+
+    def cluster(self, texts: Sequence[str]) -> List[List[int]]:
+        """Return clusters of input indices, each ordered and led by its first member."""
+        shingle_sets = [shingles(text, self.shingle_size) for text in texts]
+        signatures = [self.signature(shingle_set) for shingle_set in shingle_sets]
+        parent = list(range(len(texts)))
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        for index, signature in enumerate(signatures):
+            if not shingle_sets[index]:
+                continue
+            for band in range(self.bands):
+                key = (band, signature[band * self.rows : (band + 1) * self.rows])
+                for other in buckets.setdefault(key, []):
+                    if (
+                        find(other) != find(index)
+                        and jaccard(shingle_sets[other], shingle_sets[index]) >= self.threshold
+                    ):
+                        parent[max(find(other), find(index))] = min(find(other), find(index))
+                buckets[key].append(index)
+
+        clusters: Dict[int, List[int]] = {}
+        for index in range(len(texts)):
+            clusters.setdefault(find(index), []).append(index)
+        return sorted(clusters.values(), key=lambda members: members[0])
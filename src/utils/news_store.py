@@ -0,0 +1,187 @@
+"""Persistent news state shared across runs: seen items and prefetched candidates."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import unicodedata
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.models import NewsItem
+
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "cmpid"})
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_url(url: str) -> str:
+    raw = (url or "").strip()
+    if not raw:
+        return ""
+    parts = urlsplit(raw)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower() or "https", host, path, urlencode(query), ""))
+
+
+def title_fingerprint(title: str) -> str:
+    text = _NON_WORD.sub("", unicodedata.normalize("NFKC", title or "").casefold())
+    if not text:
+        return ""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class SeenNewsEntry:
+    url: str
+    fingerprint: str
+    title: str
+    first_seen_at: str
+    selected_at: str | None = None
+
+    def last_activity(self) -> datetime:
+        return datetime.fromisoformat(self.selected_at or self.first_seen_at)
+
+
+class SeenNewsStore:
+    """JSON-backed store of news identities with TTL expiry.
+
+    Entries are indexed by normalized URL and by title fingerprint so cooldown
+    checks are dictionary lookups. Only items that were actually selected block
+    later runs; candidates that were merely fetched are kept for provenance.
+    """
+
+    def __init__(self, path: str | Path, ttl_hours: float, now: datetime | None = None):
+        self.path = Path(path)
+        self.ttl = timedelta(hours=max(0.0, float(ttl_hours)))
+        self._entries: List[SeenNewsEntry] = []
+        self._by_url: Dict[str, SeenNewsEntry] = {}
+        self._by_fingerprint: Dict[str, SeenNewsEntry] = {}
+        self._load(now or datetime.now())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_cooling_down(self, item: NewsItem, now: datetime | None = None) -> bool:
+        if not self.ttl:
+            return False
+        entry = self._lookup(item)
+        if entry is None or entry.selected_at is None:
+            return False
+        return (now or datetime.now()) - datetime.fromisoformat(entry.selected_at) < self.ttl
+
+    def partition(
+        self, items: Iterable[NewsItem], now: datetime | None = None
+    ) -> Tuple[List[NewsItem], List[NewsItem]]:
+        now = now or datetime.now()
+        allowed: List[NewsItem] = []
+        cooling: List[NewsItem] = []
+        for item in items:
+            (cooling if self.is_cooling_down(item, now) else allowed).append(item)
+        return allowed, cooling
+
+    def mark_seen(self, items: Iterable[NewsItem], now: datetime | None = None) -> None:
+        stamp = (now or datetime.now()).isoformat()
+        for item in items:
+            if self._lookup(item) is None:
+                self._add(
+                    SeenNewsEntry(
+                        url=normalize_url(item.url),
+                        fingerprint=title_fingerprint(item.title),
+                        title=item.title,
+                        first_seen_at=stamp,
+                    )
+                )
+
+    def mark_selected(self, items: Iterable[NewsItem], now: datetime | None = None) -> None:
+        items = list(items)
+        self.mark_seen(items, now)
+        stamp = (now or datetime.now()).isoformat()
+        for item in items:
+            entry = self._lookup(item)
+            if entry is not None:
+                entry.selected_at = stamp
+
+    def save(self) -> Path:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"schema": "seen-news.v1", "entries": [asdict(entry) for entry in self._entries]}
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp_path.replace(self.path)
+        return self.path
+
+    def _lookup(self, item: NewsItem) -> SeenNewsEntry | None:
+        url = normalize_url(item.url)
+        if url and url in self._by_url:
+            return self._by_url[url]
+        fingerprint = title_fingerprint(item.title)
+        if fingerprint:
+            return self._by_fingerprint.get(fingerprint)
+        return None
+
+    def _add(self, entry: SeenNewsEntry) -> None:
+        self._entries.append(entry)
+        if entry.url:
+            self._by_url.setdefault(entry.url, entry)
+        if entry.fingerprint:
+            self._by_fingerprint.setdefault(entry.fingerprint, entry)
+
+    def _load(self, now: datetime) -> None:
+        if not self.path.exists():
+            return
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        for raw in data.get("entries", []):
+            entry = SeenNewsEntry(**raw)
+            if now - entry.last_activity() < self.ttl:
+                self._add(entry)
+
+
+class CandidateCache:
+    """Prefetched candidate pools keyed by retrieval query."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def get(self, query: str, max_age: timedelta, now: datetime | None = None) -> Dict[str, Any] | None:
+        entry = self._read().get(query)
+        if not entry:
+            return None
+        age = (now or datetime.now()) - datetime.fromisoformat(entry["fetched_at"])
+        if age < timedelta(0) or age > max_age:
+            return None
+        return {**entry, "items": [NewsItem(**item) for item in entry["items"]], "age_seconds": age.total_seconds()}
+
+    def put(
+        self,
+        query: str,
+        items: Iterable[NewsItem],
+        providers: List[Dict[str, Any]],
+        now: datetime | None = None,
+    ) -> Path:
+        data = self._read()
+        data[query] = {
+            "fetched_at": (now or datetime.now()).isoformat(),
+            "providers": providers,
+            "items": [item.model_dump(mode="json") for item in items],
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp_path.replace(self.path)
+        return self.path
+
+    def _read(self) -> Dict[str, Any]:
+        if not self.path.exists():
+            return {}
+        return json.loads(self.path.read_text(encoding="utf-8"))
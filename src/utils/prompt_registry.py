@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import hashlib
+import string
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import yaml
+
+CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+DEFAULT_PROMPTS_PATH = CONFIG_DIR / "prompts.yaml"
+NEWS_SELECTION_PROMPTS_PATH = CONFIG_DIR / "news_selection.yaml"
+VOICE_CONTRACT_PATH = CONFIG_DIR / "voice_prompt_contract.txt"
+VOICE_CONTRACT_TEMPLATES = frozenset({"script_generation"})
+
+_FORMATTER = string.Formatter()
+
+
+class PromptTemplate(str):
+    """A ``str.format`` template split once into literal and field chunks.
+
+    Simple ``{name}`` fields render by joining the pre-split chunks; templates
+    using positional fields, conversions, or format specs fall back to
+    ``str.format`` so behaviour is always identical to the plain string.
+    """
+
+    def __new__(cls, source: str) -> "PromptTemplate":
+        self = super().__new__(cls, source)
+        parts: list[Tuple[str, str | None]] = []
+        simple = True
+        for literal, field, spec, conversion in _FORMATTER.parse(source):
+            if field is not None and (spec or conversion or not field.isidentifier()):
+                simple = False
+            parts.append((literal, field))
+        self._parts = tuple(parts) if simple else None
+        self.fields = frozenset(field for _, field in parts if field)
+        return self
+
+    def format(self, *args: Any, **kwargs: Any) -> str:
+        if args or self._parts is None:
+            return str.format(self, *args, **kwargs)
+        chunks: list[str] = []
+        for literal, field in self._parts:
+            chunks.append(literal)
+            if field is not None:
+                chunks.append(format(kwargs[field]))
+        return "".join(chunks)
+
+
+@dataclass(frozen=True)
+class _FileEntry:
+    mtime_ns: int
+    size: int
+    digest: str
+    raw: bytes
+    data: Any
+
+
+class PromptRegistry:
+    """Prompt sources parsed once per file version.
+
+    Every accessor stats its source file and reparses only when the
+    modification time or size changed, so long-lived workers pick up edits
+    without paying for YAML parsing or hashing on each call.
+    """
+
+    def __init__(
+        self,
+        prompts_path: str | Path = DEFAULT_PROMPTS_PATH,
+        news_selection_path: str | Path = NEWS_SELECTION_PROMPTS_PATH,
+        voice_contract_path: str | Path = VOICE_CONTRACT_PATH,
+    ):
+        self.prompts_path = Path(prompts_path)
+        self.news_selection_path = Path(news_selection_path)
+        self.voice_contract_path = Path(voice_contract_path)
+        self._lock = threading.Lock()
+        self._files: Dict[Path, _FileEntry] = {}
+        self._derived: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Any]] = {}
+
+    def prompts(self) -> Dict:
+        return self._file(self.prompts_path, _parse_yaml).data
+
+    def section(self, name: str) -> Dict:
+        return self.prompts()[name]
+
+    def news_selection(self) -> Dict:
+        return self._file(self.news_selection_path, _parse_yaml).data["news_selection"]
+
+    def voice_contract(self) -> str:
+        text = self._file(self.voice_contract_path, _parse_text).data
+        if not text:
+            raise ValueError("VOICE prompt contract must not be empty")
+        return text
+
+    def template(self, name: str) -> PromptTemplate:
+        """Return the compiled ``user_template`` of a ``prompts.yaml`` section."""
+        return self._memo(("template", name), self._versions(name), lambda: PromptTemplate(self._user_template(name)))
+
+    def news_selection_template(self) -> PromptTemplate:
+        version = (self._file(self.news_selection_path, _parse_yaml).digest,)
+        return self._memo(("news_selection",), version, lambda: PromptTemplate(self.news_selection()["user_template"]))
+
+    def tracked_source(self, name: str) -> str:
+        """Return the raw section text recorded for template provenance."""
+        return self._memo(("tracked", name), self._versions(name), lambda: self._tracked_source(name))
+
+    def bundle_version(self) -> str:
+        entries = [self._file(path, _parse_yaml) for path in (self.prompts_path, self.news_selection_path)]
+
+        def build() -> str:
+            digest = hashlib.sha256()
+            for path, entry in zip((self.prompts_path, self.news_selection_path), entries):
+                digest.update(path.name.encode("utf-8"))
+                digest.update(b"\0")
+                digest.update(entry.raw)
+                digest.update(b"\0")
+            return f"sha256:{digest.hexdigest()}"
+
+        return self._memo(("bundle",), tuple(entry.digest for entry in entries), build)
+
+    def _user_template(self, name: str) -> str:
+        template = self.section(name)["user_template"]
+        if name in VOICE_CONTRACT_TEMPLATES:
+            template = f"{template.rstrip()}\n\n{self.voice_contract()}\n"
+        return template
+
+    def _tracked_source(self, name: str) -> str:
+        raw_content = yaml.dump(self.section(name), allow_unicode=True, default_flow_style=False)
+        if name in VOICE_CONTRACT_TEMPLATES:
+            raw_content = f"{raw_content.rstrip()}\n\n# runtime voice contract\n{self.voice_contract()}\n"
+        return raw_content
+
+    def _versions(self, name: str) -> Tuple[str, ...]:
+        versions = [self._file(self.prompts_path, _parse_yaml).digest]
+        if name in VOICE_CONTRACT_TEMPLATES:
+            versions.append(self._file(self.voice_contract_path, _parse_text).digest)
+        return tuple(versions)
+
+    def _memo(self, scope: Tuple[str, ...], version: Tuple[str, ...], build: Callable[[], Any]) -> Any:
+        cached = self._derived.get(scope)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = build()
+        with self._lock:
+            self._derived[scope] = (version, value)
+        return value
+
+    def _file(self, path: Path, parser: Callable[[bytes], Any]) -> _FileEntry:
+        stat = path.stat()
+        entry = self._files.get(path)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry
+        raw = path.read_bytes()
+        entry = _FileEntry(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            digest=hashlib.sha256(raw).hexdigest(),
+            raw=raw,
+            data=parser(raw),
+        )
+        with self._lock:
+            self._files[path] = entry
+        return entry
+
+
+def _parse_yaml(raw: bytes) -> Any:
+    return yaml.safe_load(raw.decode("utf-8"))
+
+
+def _parse_text(raw: bytes) -> str:
+    return raw.decode("utf-8").strip()
+
+
+_REGISTRY = PromptRegistry()
+
+
+def get_prompt_registry() -> PromptRegistry:
+    return _REGISTRY
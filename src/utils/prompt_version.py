@@ -3,10 +3,11 @@ from __future__ import annotations
 import hashlib
 from pathlib import Path
 
-
-CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
-DEFAULT_PROMPTS_PATH = CONFIG_DIR / "prompts.yaml"
-NEWS_SELECTION_PROMPTS_PATH = CONFIG_DIR / "news_selection.yaml"
+from src.utils.prompt_registry import (
+    DEFAULT_PROMPTS_PATH as DEFAULT_PROMPTS_PATH,
+    NEWS_SELECTION_PROMPTS_PATH as NEWS_SELECTION_PROMPTS_PATH,
+    get_prompt_registry,
+)
 
 
 def prompt_bundle_version(prompts_path: str | Path | None = None) -> str:
@@ -15,15 +16,11 @@ def prompt_bundle_version(prompts_path: str | Path | None = None) -> str:
     Explicit paths preserve the historical contract: SHA-256 of that file's raw
     bytes. The default application bundle also covers the dedicated news selector
     prompt so production provenance changes whenever either prompt source changes.
+    The default bundle digest is served from the shared prompt registry and is
+    only recomputed when one of the files changes on disk.
     """
     if prompts_path is not None:
         digest = hashlib.sha256(Path(prompts_path).read_bytes()).hexdigest()
         return f"sha256:{digest}"
 
-    digest = hashlib.sha256()
-    for path in (DEFAULT_PROMPTS_PATH, NEWS_SELECTION_PROMPTS_PATH):
-        digest.update(path.name.encode("utf-8"))
-        digest.update(b"\0")
-        digest.update(path.read_bytes())
-        digest.update(b"\0")
-    return f"sha256:{digest.hexdigest()}"
+    return get_prompt_registry().bundle_version()
@@ -0,0 +1,130 @@
+"""Pixel text measurement and kinsoku-aware line breaking shared by subtitles and thumbnails."""
+
+from __future__ import annotations
+
+import unicodedata
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+from weakref import WeakKeyDictionary
+
+from PIL import ImageFont
+
+# 行頭禁則: characters that must not start a line.
+NO_LINE_START = frozenset(
+    ")]}）］｝〕〉》」』】〙〗〟’”｠»、。，．,.:;!?！？：；・ーｰ～〜‐゠–…‥ヽヾゝゞ々〻"
+    "ぁぃぅぇぉっゃゅょゎゕゖァィゥェォッャュョヮヵヶ%％"
+)
+# 行末禁則: characters that must not end a line.
+NO_LINE_END = frozenset("([{（［｛〔〈《「『【〘〖〝‘“｟«$＄￥¥#＃")
+
+_BMP_SIZE = 0x10000
+_MEASURERS: "WeakKeyDictionary[Any, TextMeasurer]" = WeakKeyDictionary()
+
+
+def can_break(before: str, after: str) -> bool:
+    """Whether a line may break between ``before`` and ``after``."""
+    if before.isspace():
+        return True
+    if after.isspace() or after in NO_LINE_START or before in NO_LINE_END:
+        return False
+    return not (before.isascii() and before.isalnum() and after.isascii() and after.isalnum())
+
+
+class CellFont:
+    """Font stand-in that measures wide East Asian characters as one em and the rest as half."""
+
+    def __init__(self, size: float):
+        self.size = float(size)
+
+    def getlength(self, text: str) -> float:
+        return sum(self.size if unicodedata.east_asian_width(ch) in "WFA" else self.size / 2 for ch in text)
+
+
+class TextMeasurer:
+    """Per-codepoint advance widths for one font, cached in a flat array.
+
+    Kerning is ignored: lines are measured as the sum of glyph advances, which
+    matches ``getlength`` for CJK text and stays within a pixel or two for Latin.
+    """
+
+    def __init__(self, font: Any):
+        self.font = font
+        self._bmp = array("f", [-1.0]) * _BMP_SIZE
+        self._astral: Dict[int, float] = {}
+
+    def advance(self, char: str) -> float:
+        code = ord(char)
+        if code < _BMP_SIZE:
+            value = self._bmp[code]
+            if value < 0:
+                value = self._bmp[code] = float(self.font.getlength(char))
+            return value
+        if code not in self._astral:
+            self._astral[code] = float(self.font.getlength(char))
+        return self._astral[code]
+
+    def width(self, text: str) -> float:
+        return sum(map(self.advance, text))
+
+    def wrap(self, text: str, max_width: float, max_chars: int | None = None) -> List[str]:
+        """Greedy line breaking in a single pass per paragraph.
+
+        Lines keep their trailing whitespace so ``"".join`` restores each
+        paragraph; whitespace hangs past ``max_width`` instead of forcing a
+        break, and so does a closing character that may not start a line.
+        """
+        lines: List[str] = []
+        for paragraph in text.split("\n"):
+            lines.extend(self._break_paragraph(paragraph, max_width, max_chars))
+        return lines
+
+    def _break_paragraph(self, text: str, max_width: float, max_chars: int | None) -> List[str]:
+        lines: List[str] = []
+        start = 0
+        line_width = 0.0
+        break_at = -1
+        width_at_break = 0.0
+        for index, char in enumerate(text):
+            advance = self.advance(char)
+            if index > start and can_break(text[index - 1], char):
+                break_at, width_at_break = index, line_width
+            if not char.isspace():
+                if break_at > start and self._overflows(line_width + advance, index - start + 1, max_width, max_chars):
+                    lines.append(text[start:break_at])
+                    start, line_width = break_at, line_width - width_at_break
+                    break_at = -1
+                if (
+                    index > start
+                    and char not in NO_LINE_START
+                    and self._overflows(line_width + advance, index - start + 1, max_width, max_chars)
+                ):
+                    lines.append(text[start:index])
+                    start, line_width = index, 0.0
+                    break_at = -1
+            line_width += advance
+        lines.append(text[start:])
+        return lines
+
+    @staticmethod
+    def _overflows(width: float, chars: int, max_width: float, max_chars: int | None) -> bool:
+        return width > max_width or (max_chars is not None and chars > max_chars)
+
+
+@lru_cache(maxsize=64)
+def get_text_measurer(font_path: str | None, size: int) -> TextMeasurer:
+    """Load ``font_path`` at ``size`` once; fall back to Pillow's default font when missing."""
+    if font_path and Path(font_path).exists():
+        font = ImageFont.truetype(str(font_path), size)
+    else:
+        font = ImageFont.load_default(size=size)
+    return measurer_for_font(font)
+
+
+def measurer_for_font(font: Any) -> TextMeasurer:
+    """Return the shared measurer for an already loaded font object."""
+    measurer = _MEASURERS.get(font)
+    if measurer is None:
+        measurer = _MEASURERS[font] = TextMeasurer(font)
+    return measurer
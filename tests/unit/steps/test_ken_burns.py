@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import ffmpeg
+import pytest
+
+from src.providers.video_effects import KenBurnsEffect, VideoEffectContext, VideoEffectPipeline
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def _command(effect: KenBurnsEffect, context: VideoEffectContext) -> str:
+    source = ffmpeg.input("color=c=black:size=1920x1080", f="lavfi")
+    return " ".join(ffmpeg.output(effect.apply(source, context), "out.mp4").compile())
+
+
+def test_internal_scale_renders_motion_small_then_upscales() -> None:
+    context = VideoEffectContext(2.0, 25, (1920, 1080))
+
+    command = _command(KenBurnsEffect(internal_scale=0.5), context)
+
+    assert "zoompan" in command and "s=960x540" in command
+    assert "scale=1920:1080" in command
+
+
+def test_full_scale_motion_is_not_rescaled() -> None:
+    command = _command(KenBurnsEffect(), VideoEffectContext(2.0, 25, (1920, 1080)))
+
+    assert "s=1920x1080" in command
+    assert "scale=" not in command
+
+
+def test_internal_scale_is_read_per_effect_from_config() -> None:
+    pipeline = VideoEffectPipeline.from_config([{"type": "ken_burns", "internal_scale": 0.5}, {"type": "ken_burns"}])
+
+    assert [effect.internal_scale for effect in pipeline.effects] == [0.5, 1.0]
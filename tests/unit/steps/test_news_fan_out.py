@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from src.models import NewsItem
+from src.providers.base import AllProvidersFailedError, execute_fan_out
+from src.steps.news import NewsCollector
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+class FakeNewsProvider:
+    def __init__(self, name: str, urls: list[str], delay: float = 0.0, priority: int = 0, error: bool = False):
+        self.name = name
+        self.urls = urls
+        self.delay = delay
+        self.priority = priority
+        self.error = error
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def execute(self, **kwargs) -> list[NewsItem]:
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise RuntimeError(f"{self.name} down")
+        return [NewsItem(title=url, summary="", url=url) for url in self.urls]
+
+
+def _collector(tmp_path: Path, providers, **kwargs) -> NewsCollector:
+    return NewsCollector(run_id="run-1", run_dir=tmp_path, providers=providers, fan_out=True, **kwargs)
+
+
+def test_fan_out_merges_and_dedupes_in_priority_order(tmp_path: Path) -> None:
+    primary = FakeNewsProvider("perplexity", ["https://a", "https://b", "https://a"], priority=1)
+    secondary = FakeNewsProvider("gemini_news", ["https://b", "https://c"])
+
+    candidates, metrics = _collector(tmp_path, [secondary, primary])._fetch_candidates("q", 6)
+
+    assert [item.url for item in candidates] == ["https://a", "https://b", "https://c"]
+    assert [(m["provider"], m["returned"], m["unique"], m["error"]) for m in metrics] == [
+        ("perplexity", 3, 2, None),
+        ("gemini_news", 2, 1, None),
+    ]
+
+
+def test_fan_out_runs_providers_concurrently_with_per_provider_timeouts(tmp_path: Path) -> None:
+    fast = FakeNewsProvider("fast", ["https://fast"], delay=0.2)
+    also_fast = FakeNewsProvider("also_fast", ["https://also"], delay=0.2)
+    slow = FakeNewsProvider("slow", ["https://slow"], delay=2.0)
+    step = _collector(tmp_path, [fast, also_fast, slow], provider_timeout_seconds=1.0, provider_timeouts={"slow": 0.3})
+
+    start = time.perf_counter()
+    candidates, metrics = step._fetch_candidates("q", 6)
+
+    assert time.perf_counter() - start < 1.0
+    assert [item.url for item in candidates] == ["https://fast", "https://also"]
+    assert "timed out" in metrics[2]["error"]
+    assert metrics[2]["unique"] == 0
+
+
+def test_fan_out_tolerates_failures_until_every_provider_fails(tmp_path: Path) -> None:
+    broken = FakeNewsProvider("broken", [], error=True)
+    working = FakeNewsProvider("working", ["https://ok"])
+
+    candidates, metrics = _collector(tmp_path, [broken, working])._fetch_candidates("q", 3)
+    assert [item.url for item in candidates] == ["https://ok"]
+    assert metrics[0]["error"] == "broken down"
+
+    with pytest.raises(AllProvidersFailedError) as excinfo:
+        execute_fan_out([broken], timeout=1.0, query="q")
+    assert set(excinfo.value.errors) == {"broken"}
+
+
+def test_sequential_mode_keeps_first_success_semantics(tmp_path: Path) -> None:
+    primary = FakeNewsProvider("primary", ["https://a"], priority=1)
+    secondary = FakeNewsProvider("secondary", ["https://b"])
+    step = NewsCollector(run_id="run-1", run_dir=tmp_path, providers=[primary, secondary])
+
+    candidates, metrics = step._fetch_candidates("q", 3)
+
+    assert [item.url for item in candidates] == ["https://a"]
+    assert [(m["provider"], m["returned"]) for m in metrics] == [("primary", 1)]
+    assert secondary.calls == 0
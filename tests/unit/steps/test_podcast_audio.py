@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import threading
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from pydub import AudioSegment
+
+import src.steps.podcast_audio as podcast_audio_module
+from src.providers.http import close_sessions
+from src.steps.buzzsprout import BuzzsproutUploader
+from src.steps.podcast import PodcastExporter
+from src.steps.podcast_audio import PodcastAudioEncoder
+
+ENCODED = b"ID3" + b"\xff" * 4000
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+@pytest.fixture
+def encodes(monkeypatch) -> list[list[str]]:
+    commands: list[list[str]] = []
+
+    def fake_run(output, **kwargs):
+        command = output.compile()
+        commands.append(command)
+        Path([arg for arg in command if arg != "-y"][-1]).write_bytes(ENCODED)
+        return b"", b""
+
+    monkeypatch.setattr(podcast_audio_module, "find_ffmpeg_binary", lambda: "ffmpeg")
+    monkeypatch.setattr(podcast_audio_module.ffmpeg, "run", fake_run)
+    return commands
+
+
+@pytest.fixture
+def narration(tmp_path: Path) -> Path:
+    path = tmp_path / "audio.wav"
+    AudioSegment.silent(duration=2600, frame_rate=24000).export(path, format="wav")
+    return path
+
+
+def _encode(tmp_path: Path, narration: Path, **config) -> dict:
+    encoder = PodcastAudioEncoder(run_id="run", run_dir=tmp_path, audio_config=config)
+    manifest = encoder.run({"synthesize_audio": narration})
+    return json.loads(manifest.read_text(encoding="utf-8"))
+
+
+def test_narration_is_encoded_once_with_loudness_normalisation(tmp_path: Path, narration: Path, encodes) -> None:
+    manifest = _encode(tmp_path, narration)
+
+    command = " ".join(encodes[0])
+    assert "loudnorm=I=-16.0:LRA=11.0:TP=-1.5" in command
+    assert all(option in command for option in ("-acodec libmp3lame", "-b:a 96k", "-ac 1", "-ar 44100"))
+    assert manifest["mime_type"] == "audio/mpeg"
+    assert manifest["bytes"] == len(ENCODED) < manifest["source_bytes"]
+    assert manifest["duration_seconds"] == 2.6
+    assert Path(manifest["path"]).name == f"podcast_audio_{manifest['content_key'][:16]}.mp3"
+
+    (tmp_path / "run" / "podcast_audio.json").unlink()
+    assert _encode(tmp_path, narration)["path"] == manifest["path"]
+    assert len(encodes) == 1
+    (tmp_path / "run" / "podcast_audio.json").unlink()
+    assert _encode(tmp_path, narration, codec="opus")["path"].endswith(".ogg")
+    assert "-acodec libopus" in " ".join(encodes[1])
+
+
+@pytest.mark.parametrize(
+    ("config", "rate"),
+    [
+        ({"codec": "opus"}, "48000"),
+        ({"codec": "opus", "sample_rate": 24000}, "24000"),
+        ({"codec": "aac"}, "44100"),
+    ],
+)
+def test_sample_rate_is_one_the_codec_accepts(tmp_path: Path, narration: Path, encodes, config, rate) -> None:
+    _encode(tmp_path, narration, **config)
+
+    command = encodes[0]
+    assert command[command.index("-ar") + 1] == rate
+
+
+def test_feed_enclosure_carries_real_length_and_duration(tmp_path: Path, narration: Path, encodes) -> None:
+    manifest_path = PodcastAudioEncoder(run_id="run", run_dir=tmp_path).run({"synthesize_audio": narration})
+    exporter = PodcastExporter(run_id="run", run_dir=tmp_path, podcast_config={"feed_dir": str(tmp_path / "feed")})
+
+    feed = exporter.run({"synthesize_audio": narration, "encode_podcast_audio": manifest_path})
+
+    item = ET.parse(feed).getroot().find("channel/item")
+    enclosure = item.find("enclosure")
+    assert enclosure.get("length") == str(len(ENCODED))
+    assert enclosure.get("type") == "audio/mpeg"
+    assert item.find("{http://www.itunes.com/dtds/podcast-1.0.dtd}duration").text == "3"
+    assert not (tmp_path / "run" / "podcast_audio.wav").exists()
+
+
+class UploadStub(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), UploadHandler)
+        self.headers: dict[str, str] = {}
+        self.body = b""
+
+
+class UploadHandler(BaseHTTPRequestHandler):
+    server: UploadStub
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        self.server.headers = dict(self.headers)
+        self.server.body = self.rfile.read(int(self.headers["Content-Length"]))
+        payload = json.dumps({"id": 42}).encode()
+        self.send_response(201)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def test_buzzsprout_streams_the_shared_file(tmp_path: Path, narration: Path, encodes, monkeypatch) -> None:
+    stub = UploadStub()
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    manifest_path = PodcastAudioEncoder(run_id="run", run_dir=tmp_path).run({"synthesize_audio": narration})
+    monkeypatch.setattr(BuzzsproutUploader, "api_base", f"http://127.0.0.1:{stub.server_port}/api")
+    monkeypatch.setattr(BuzzsproutUploader, "_resolve_secret", staticmethod(lambda key: "token"))
+    uploader = BuzzsproutUploader(run_id="run", run_dir=tmp_path, buzzsprout_config={"podcast_id": "123"})
+
+    try:
+        output = uploader.run({"synthesize_audio": narration, "encode_podcast_audio": manifest_path})
+    finally:
+        stub.shutdown()
+        stub.server_close()
+        close_sessions()
+
+    assert json.loads(output.read_text(encoding="utf-8")) == {"id": 42}
+    assert "Transfer-Encoding" not in stub.headers
+    assert stub.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert int(stub.headers["Content-Length"]) == len(stub.body)
+    assert b'name="audio_file"; filename="podcast_audio_' in stub.body
+    assert b"Content-Type: audio/mpeg\r\n\r\n" + ENCODED + b"\r\n--" in stub.body
+    assert b'name="private"\r\n\r\nfalse\r\n' in stub.body
@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import src.steps.script as script_module
+from src.steps.script import SCRIPT_RESPONSE_FORMAT, ScriptGenerator
+
+SPEAKERS = {
+    "analyst": {"name": "春日部つむぎ", "aliases": []},
+    "reporter": {"name": "ずんだもん", "aliases": []},
+    "narrator": {"name": "玄野武宏", "aliases": []},
+}
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+class RecordingProvider:
+    name = "recording"
+    model = "recording-model"
+
+    def __init__(self, response: str):
+        self.response = response
+        self.kwargs: dict[str, Any] = {}
+
+    def is_available(self) -> bool:
+        return True
+
+    def execute(self, prompt: str, **kwargs: Any) -> str:
+        self.kwargs = kwargs
+        return self.response
+
+
+class NullTracker:
+    def track_prompt(self, **kwargs: Any) -> None:
+        pass
+
+    def track_template_version(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def news_input(tmp_path: Path, monkeypatch) -> dict[str, Path]:
+    monkeypatch.setattr(script_module.AimTracker, "get_instance", lambda run_id: NullTracker(), raising=False)
+    news_path = tmp_path / "news.json"
+    news_path.write_text(json.dumps([{"title": "日銀", "summary": "利上げ", "url": "https://example.com"}]))
+    return {"collect_news": news_path}
+
+
+def _generator(tmp_path: Path, provider: RecordingProvider, **kwargs: Any) -> ScriptGenerator:
+    return ScriptGenerator(run_id="run", run_dir=tmp_path, llm_provider=provider, speakers_config=SPEAKERS, **kwargs)
+
+
+def test_requests_schema_constrained_output_and_keeps_raw_response(tmp_path, news_input):
+    raw = json.dumps({"segments": [{"speaker": "ずんだもん", "text": "今日は日銀なのだ。"}]}, ensure_ascii=False)
+    provider = RecordingProvider(raw)
+
+    output = _generator(tmp_path, provider).execute(news_input)
+
+    assert provider.kwargs == {"response_format": SCRIPT_RESPONSE_FORMAT}
+    assert SCRIPT_RESPONSE_FORMAT["json_schema"]["schema"]["required"] == ["segments"]
+    assert json.loads(output.read_text())["segments"][0]["speaker"] == "ずんだもん"
+    assert (output.parent / ScriptGenerator.raw_output_filename).read_text() == raw
+
+
+def test_structured_output_can_be_disabled(tmp_path, news_input):
+    provider = RecordingProvider('{"segments": [{"speaker": "玄野武宏", "text": "以上です。"}]}')
+
+    _generator(tmp_path, provider, structured_output=False).execute(news_input)
+
+    assert provider.kwargs == {}
+
+
+def test_valid_json_skips_heuristic_parser(tmp_path, monkeypatch):
+    generator = _generator(tmp_path, RecordingProvider(""))
+    monkeypatch.setattr(generator, "_coerce_to_dict", lambda *args: pytest.fail("heuristic parser used"))
+
+    script = generator._parse_and_validate('{"segments": [{"speaker": "ずんだもん", "text": "一。二。"}]}')
+
+    assert script.segments[0].text == "一。\n二。"
+
+
+def test_unstructured_output_falls_back_to_heuristic_parser(tmp_path):
+    generator = _generator(tmp_path, RecordingProvider(""))
+    raw = "```yaml\nsegments:\n  - speaker: ずんだもん\n    text: 市場は落ち着いたのだ。\n```"
+
+    assert generator._parse_structured(raw) is None
+    assert generator._parse_and_validate(raw).segments[0].text == "市場は落ち着いたのだ。"
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import src.steps.subtitle as subtitle_module
+from src.steps.subtitle import SubtitleFormatter
+from src.steps.video import VideoRenderer
+from src.steps.youtube import YouTubeUploader
+from src.utils.ass import format_timestamp, prepare_fonts_dir, render_ass, style_line
+
+FONT = Path("assets/fonts/ZenMaruGothic-Bold.ttf")
+STYLE = {"font_path": str(FONT), "font_size": 72, "primary_colour": "&HFFFFFF&", "outline": 2, "alignment": 2}
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def test_ass_script_bakes_style_and_prewrapped_lines() -> None:
+    script = render_ass([{"start": 0.0, "end": 61.234, "lines": ["日銀が{利上げ}", "決定"]}], STYLE, "1920x1080")
+
+    assert "PlayResX: 1920\nPlayResY: 1080" in script
+    assert "Style: Default,ZenMaruGothic-Bold,72,&H00FFFFFF," in script
+    assert script.rstrip().endswith(r"Dialogue: 0,0:00:00.00,0:01:01.23,Default,,0,0,0,,日銀が｛利上げ｝\N決定")
+    assert format_timestamp(3723.999) == "1:02:04.00"
+    assert style_line({}).split(",")[1] == "Noto Sans CJK JP"
+
+
+def test_formatter_emits_ass_file(tmp_path: Path) -> None:
+    formatter = SubtitleFormatter(run_id="run", run_dir=tmp_path, subtitle_format="ass")
+
+    content = formatter._generate_ass([{"start": 0.0, "end": 1.5, "text": "最初です。"}])
+
+    assert formatter.get_output_path().name == "subtitles.ass"
+    assert "Dialogue: 0,0:00:00.00,0:00:01.50,Default,,0,0,0,,最初です。" in content
+    with pytest.raises(ValueError):
+        SubtitleFormatter(run_id="run", run_dir=tmp_path, subtitle_format="vtt")
+
+
+def test_ass_runs_keep_an_srt_copy_for_youtube_captions(tmp_path: Path, monkeypatch) -> None:
+    script = SimpleNamespace(segments=[SimpleNamespace(text="最初です。")])
+    monkeypatch.setattr(subtitle_module, "validate_input_files", lambda *args: None)
+    monkeypatch.setattr(subtitle_module, "load_script", lambda path: script)
+    monkeypatch.setattr(subtitle_module, "get_audio_duration", lambda path: 1.5)
+    formatter = SubtitleFormatter(run_id="run", run_dir=tmp_path, subtitle_format="ass")
+
+    output = formatter.execute({"generate_script": tmp_path / "script.json", "synthesize_audio": tmp_path / "a.wav"})
+
+    captions = formatter.artifacts()["captions"]
+    assert output.suffix == ".ass" and captions == output.with_suffix(".srt")
+    assert "00:00:00,000 --> 00:00:01,500\n最初です。" in captions.read_text(encoding="utf-8")
+    assert YouTubeUploader._captions_path(output) == captions
+    captions.unlink()
+    assert YouTubeUploader._captions_path(output) is None
+
+
+def test_minimal_fonts_dir_holds_only_the_configured_font(tmp_path: Path) -> None:
+    first = prepare_fonts_dir(FONT, tmp_path)
+    second = prepare_fonts_dir(FONT, tmp_path)
+
+    assert first == second
+    assert [path.name for path in first.iterdir()] == [FONT.name]
+    assert prepare_fonts_dir(tmp_path / "missing.ttf", tmp_path) is None
+
+
+def test_renderer_skips_force_style_for_ass(tmp_path: Path) -> None:
+    renderer = VideoRenderer(run_id="run", run_dir=tmp_path, video_config={"subtitles": STYLE})
+
+    srt_kwargs = renderer.subtitle_filter_kwargs(Path("subtitles.srt"))
+    ass_kwargs = renderer.subtitle_filter_kwargs(Path("subtitles.ass"))
+
+    assert "FontSize=72" in srt_kwargs["force_style"]
+    assert "force_style" not in ass_kwargs
+    assert ass_kwargs["fontsdir"] == srt_kwargs["fontsdir"]
+    assert str(tmp_path) in ass_kwargs["fontsdir"]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import src.steps.video as video_module
+from src.steps.video import VideoRenderer
+
+KEN_BURNS = {"type": "ken_burns", "enabled": True, "zoom_speed": 0.002, "max_zoom": 1.2}
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+@pytest.fixture
+def ffmpeg_calls(monkeypatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    def fake_run(output, **kwargs):
+        command = output.compile()
+        calls.append(command)
+        Path([arg for arg in command if arg != "-y"][-1]).write_bytes(b"layer")
+
+    monkeypatch.setattr(video_module, "find_ffmpeg_binary", lambda: "ffmpeg")
+    monkeypatch.setattr(video_module.ffmpeg, "run", fake_run)
+    return calls
+
+
+def _render(tmp_path: Path, monkeypatch, duration: float = 12.0, **subtitles) -> VideoRenderer:
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"")
+    subtitle_path = tmp_path / "subtitles.srt"
+    subtitle_path.write_text("", encoding="utf-8")
+    monkeypatch.setattr(video_module, "get_audio_duration", lambda path: duration)
+    renderer = VideoRenderer(
+        run_id="run",
+        run_dir=tmp_path,
+        video_config={"effects": [KEN_BURNS], "layer_cache": {"enabled": True}, "subtitles": subtitles},
+    )
+    renderer.execute({"synthesize_audio": audio, "prepare_subtitles": subtitle_path})
+    return renderer
+
+
+def test_subtitle_restyle_reuses_encoded_background(tmp_path: Path, monkeypatch, ffmpeg_calls) -> None:
+    _render(tmp_path, monkeypatch, font_size=48)
+    _render(tmp_path, monkeypatch, font_size=72)
+
+    background, first, second = (" ".join(command) for command in ffmpeg_calls)
+    layers = list((tmp_path / "video_layers").glob("*.mkv"))
+    assert "zoompan" in background and "-qp 0" in background
+    assert len(layers) == 1
+    for render in (first, second):
+        assert "zoompan" not in render
+        assert f"-i {layers[0]}" in render
+    assert "FontSize\\\\=72" in second
+
+
+def test_layer_key_tracks_background_inputs_only(tmp_path: Path, monkeypatch, ffmpeg_calls) -> None:
+    renderer = _render(tmp_path, monkeypatch, duration=12.0)
+    _render(tmp_path, monkeypatch, duration=15.0)
+
+    assert len(list((tmp_path / "video_layers").glob("*.mkv"))) == 2
+    overlay_only = VideoRenderer(
+        run_id="run",
+        run_dir=tmp_path,
+        video_config={
+            "effects": [KEN_BURNS, {"type": "overlay", "enabled": True, "image_path": "logo.png"}],
+            "layer_cache": {"enabled": True},
+        },
+    )
+    ctx = video_module.VideoEffectContext(duration_seconds=12.0, fps=25, resolution=(1920, 1080))
+    assert overlay_only.layer_cache_key(ctx) == renderer.layer_cache_key(ctx)
+    assert [effect.name for effect in overlay_only.top_pipeline.effects] == ["overlay"]
+
+
+def test_layer_cache_is_bounded(tmp_path: Path, monkeypatch, ffmpeg_calls) -> None:
+    cache_dir = tmp_path / "video_layers"
+    cache_dir.mkdir()
+    for index in range(3):
+        stale = cache_dir / f"old{index}.mkv"
+        stale.write_bytes(b"")
+        os.utime(stale, (index, index))
+    renderer = VideoRenderer(
+        run_id="run",
+        run_dir=tmp_path,
+        video_config={"effects": [KEN_BURNS], "layer_cache": {"enabled": True, "max_entries": 2}},
+    )
+    renderer._cached_background(video_module.VideoEffectContext(12.0, 25, (1920, 1080)))
+
+    assert sorted(path.name for path in cache_dir.glob("*.mkv"))[-1] == "old2.mkv"
+    assert len(list(cache_dir.glob("*.mkv"))) == 2
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import src.steps.video as video_module
+from src.core.state import WorkflowState
+from src.steps.video import VideoRenderer
+
+OUTPUTS = [
+    {"name": "shorts", "resolution": "1080x1920", "fit": "crop", "duration_seconds": 59},
+    {"name": "preview", "resolution": "1280x720", "encoder_options": {"preset": "veryfast", "crf": 28}},
+    {"name": "clip", "start_seconds": 10, "duration_seconds": 30, "enabled": False},
+]
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+@pytest.fixture
+def ffmpeg_calls(monkeypatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    def fake_run(output, **kwargs):
+        command = output.compile()
+        calls.append(command)
+        for arg in command:
+            if arg.endswith(".mp4"):
+                Path(arg).write_bytes(b"video")
+
+    monkeypatch.setattr(video_module, "find_ffmpeg_binary", lambda: "ffmpeg")
+    monkeypatch.setattr(video_module, "get_audio_duration", lambda path: 120.0)
+    monkeypatch.setattr(video_module.ffmpeg, "run", fake_run)
+    return calls
+
+
+def _inputs(tmp_path: Path) -> dict[str, Path]:
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"")
+    subtitles = tmp_path / "subtitles.srt"
+    subtitles.write_text("", encoding="utf-8")
+    return {"synthesize_audio": audio, "prepare_subtitles": subtitles}
+
+
+def test_renditions_share_one_decode_and_filter_graph(tmp_path: Path, ffmpeg_calls) -> None:
+    renderer = VideoRenderer(
+        run_id="run", run_dir=tmp_path, video_config={"outputs": OUTPUTS}, encoder_options={"crf": 20}
+    )
+
+    renderer.execute(_inputs(tmp_path))
+
+    assert len(ffmpeg_calls) == 1
+    command = ffmpeg_calls[0]
+    graph = command[command.index("-filter_complex") + 1]
+    assert graph.count("subtitles=") == 1
+    assert "split=3" in graph and "asplit=3" in graph
+    assert "crop=606:1080:657:0" in graph and "scale=1080:1920" in graph
+    assert "trim=duration=59.0:start=0.0" in graph and "atrim=duration=59.0:start=0.0" in graph
+    assert "scale=1280:720" in graph
+    joined = " ".join(command)
+    assert "-crf 20 " in joined and "-crf 28 -preset veryfast" in joined
+    assert [arg for arg in command if arg.endswith(".mp4")] == [
+        str(tmp_path / "run" / name) for name in ("video.mp4", "video_shorts.mp4", "video_preview.mp4")
+    ]
+
+
+def test_renditions_are_registered_as_artifacts(tmp_path: Path, ffmpeg_calls) -> None:
+    renderer = VideoRenderer(run_id="run", run_dir=tmp_path, video_config={"outputs": OUTPUTS})
+    state = WorkflowState(run_id="run")
+
+    output_path = renderer.run(_inputs(tmp_path))
+    state.mark_completed(renderer.name, str(output_path))
+    state.register_artifacts(renderer.name, renderer.artifacts())
+
+    assert state.outputs == {
+        "render_video": str(tmp_path / "run" / "video.mp4"),
+        "render_video:shorts": str(tmp_path / "run" / "video_shorts.mp4"),
+        "render_video:preview": str(tmp_path / "run" / "video_preview.mp4"),
+    }
+
+
+def test_single_output_graph_is_unchanged(tmp_path: Path, ffmpeg_calls) -> None:
+    renderer = VideoRenderer(run_id="run", run_dir=tmp_path, video_config={})
+
+    renderer.execute(_inputs(tmp_path))
+
+    assert "split" not in " ".join(ffmpeg_calls[0])
+    assert renderer.artifacts() == {}
+    with pytest.raises(ValueError):
+        VideoRenderer(run_id="run", run_dir=tmp_path, video_config={"outputs": [{"name": "x", "fit": "pad"}]})
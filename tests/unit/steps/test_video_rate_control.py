@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import src.steps.video as video_module
+from src.core.state import WorkflowState
+from src.steps.video import VideoRenderer
+from src.steps.youtube import YouTubeUploader
+
+RATE_CONTROL = {"mode": "target", "target_mb_per_minute": 30, "analysis_seconds": 10}
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def _render(tmp_path: Path, monkeypatch, sample_kib: float) -> tuple[VideoRenderer, list[list[str]]]:
+    calls: list[list[str]] = []
+
+    def fake_run(output, **kwargs):
+        command = output.compile()
+        calls.append(command)
+        if "null" in command:
+            return b"", f"frame=  250 fps=120\nvideo:{sample_kib}KiB audio:0KiB subtitle:0KiB".encode()
+        Path([arg for arg in command if arg != "-y"][-1]).write_bytes(b"x" * 150_000)
+        return b"", b""
+
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"")
+    subtitles = tmp_path / "subtitles.srt"
+    subtitles.write_text("", encoding="utf-8")
+    monkeypatch.setattr(video_module, "find_ffmpeg_binary", lambda: "ffmpeg")
+    monkeypatch.setattr(video_module, "get_audio_duration", lambda path: 60.0)
+    monkeypatch.setattr(video_module.ffmpeg, "run", fake_run)
+    renderer = VideoRenderer(
+        run_id="run",
+        run_dir=tmp_path,
+        video_config={"crf": 23, "rate_control": RATE_CONTROL, "encoder_options": {"acodec": "aac"}},
+    )
+    renderer.execute({"synthesize_audio": audio, "prepare_subtitles": subtitles})
+    return renderer, calls
+
+
+def test_complex_content_switches_to_capped_vbv(tmp_path: Path, monkeypatch) -> None:
+    renderer, (analysis, render) = _render(tmp_path, monkeypatch, sample_kib=10_000)
+
+    assert "trim=duration=10.0" in " ".join(analysis) and "-acodec" not in analysis
+    command = " ".join(render)
+    assert all(option in command for option in ("-b:v 4000k", "-maxrate 4000k", "-bufsize 8000k"))
+    assert "-crf" not in command and "-g " not in command
+    metrics = renderer.metrics()
+    assert metrics["rate_control"] == "vbv"
+    assert metrics["estimated_kbps"] == pytest.approx(8192.0)
+    assert metrics["achieved_kbps"] == 20.0
+
+
+def test_static_content_keeps_crf_with_long_gop(tmp_path: Path, monkeypatch) -> None:
+    renderer, (_, render) = _render(tmp_path, monkeypatch, sample_kib=500)
+
+    command = " ".join(render)
+    assert "-crf 23" in command and "-maxrate 4000k" in command and "-b:v" not in command
+    assert "-g 500" in command
+    assert renderer.metrics()["rate_control"] == "crf"
+
+
+def test_rate_control_defaults_to_plain_crf(tmp_path: Path) -> None:
+    renderer = VideoRenderer(run_id="run", run_dir=tmp_path, video_config={"crf": 23})
+
+    assert renderer.rate_control_mode == "crf"
+    assert renderer.metrics() == {}
+    with pytest.raises(ValueError):
+        VideoRenderer(run_id="run", run_dir=tmp_path, video_config={"rate_control": {"mode": "abr"}})
+
+
+def test_bitrate_and_upload_time_land_in_run_state(tmp_path: Path, monkeypatch) -> None:
+    renderer, _ = _render(tmp_path, monkeypatch, sample_kib=10_000)
+    metadata = tmp_path / "metadata.json"
+    metadata.write_text(json.dumps({"title": "t", "description": "d"}), encoding="utf-8")
+    uploader = YouTubeUploader(run_id="run", run_dir=tmp_path, youtube_config={"dry_run": True})
+    uploader.execute({"render_video": renderer.get_output_path(), "analyze_metadata": metadata})
+    state = WorkflowState(run_id="run")
+
+    for step in (renderer, uploader):
+        state.record_metrics(step.name, step.metrics())
+    state.save(tmp_path)
+
+    saved = json.loads((tmp_path / "run" / "state.json").read_text(encoding="utf-8"))["metrics"]
+    assert saved["render_video"]["achieved_kbps"] == 20.0
+    assert saved["upload_youtube"]["upload_bytes"] == 150_000
+    assert saved["upload_youtube"]["upload_seconds"] >= 0
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.models import NewsItem
+from src.steps.news import NewsCollector
+from src.utils.diversity import char_ngram_tfidf, mmr_select
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+CANDIDATES = [
+    "日銀が追加利上げを決定 政策金利を引き上げ",
+    "日銀、追加利上げを決定 政策金利0.5%に",
+    "日銀の追加利上げ決定で政策金利が上昇",
+    "ドル円が150円台に上昇 円安進む",
+    "金相場が最高値を更新",
+    "ビットコインが急反発",
+]
+
+
+def test_tfidf_rows_are_unit_length() -> None:
+    rows = char_ngram_tfidf(["日経平均", "日経平均", ""])
+    matrix = rows.toarray()
+
+    assert np.allclose(np.linalg.norm(matrix[:2], axis=1), 1.0)
+    assert np.allclose(matrix[0] @ matrix[1], 1.0)
+    assert not matrix[2].any()
+    assert np.allclose(rows.similarity([0, 2]), matrix[[0, 2]] @ matrix.T)
+
+
+def test_mmr_skips_redundant_candidates() -> None:
+    assert mmr_select(CANDIDATES, [], 3) == [0, 3, 4]
+
+
+def test_mmr_penalises_recent_topics() -> None:
+    selected = mmr_select(CANDIDATES, ["日銀が追加利上げを決定"], 3)
+
+    assert not {0, 1, 2} & set(selected)
+    assert selected == mmr_select(CANDIDATES, ["日銀が追加利上げを決定"], 3)
+
+
+def test_mmr_handles_large_pools_quickly() -> None:
+    rng = random.Random(0)
+    alphabet = [chr(code) for code in range(0x3041, 0x3097)] + [chr(code) for code in range(0x4E00, 0x4E00 + 2000)]
+    pool = ["".join(rng.choices(alphabet, k=200)) for _ in range(500)]
+    recent = ["".join(rng.choices(alphabet, k=40)) for _ in range(30)]
+    mmr_select(pool[:10], recent, 3)
+
+    start = time.perf_counter()
+    selected = mmr_select(pool, recent, 10)
+    elapsed = time.perf_counter() - start
+
+    assert len(set(selected)) == 10
+    assert elapsed < 0.15
+
+
+def test_collector_mmr_mode_skips_llm(tmp_path: Path) -> None:
+    class ExplodingSelector:
+        name = "llm"
+
+        def is_available(self) -> bool:
+            return True
+
+        def select_news(self, *, prompt: str) -> str:
+            raise AssertionError("mmr mode must not call the LLM")
+
+    items = [NewsItem(title=title, summary="", url=f"https://example.test/{i}") for i, title in enumerate(CANDIDATES)]
+    step = NewsCollector(
+        run_id="run-1",
+        run_dir=tmp_path,
+        providers=[],
+        llm_provider=ExplodingSelector(),
+        final_count=3,
+        selection_mode="mmr",
+    )
+
+    selected, record = step.select_news(items, [])
+
+    assert [item.url for item in selected] == [items[0].url, items[3].url, items[4].url]
+    assert record["mode"] == "mmr"
+    assert [entry["index"] for entry in record["selections"]] == [0, 3, 4]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+import apps.youtube.cli as cli_module
+from src import main as main_module
+from src.steps.subtitle import SubtitleFormatter
+from src.steps.video import VideoRenderer
+from src.steps.youtube import YouTubeUploader
+from src.utils.config import Config, VideoStepConfig
+
+_real_build_steps = cli_module._build_steps
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def _video_config() -> VideoStepConfig:
+    effects = [{"type": "ken_burns"}, {"type": "overlay", "image_path": "logo.png"}]
+    return VideoStepConfig.model_validate({**Config.load().steps.video.model_dump(), "effects": effects})
+
+
+def test_draft_profile_swaps_in_fast_encode() -> None:
+    video = _video_config()
+
+    video.apply_profile("draft")
+
+    renderer = VideoRenderer(run_id="run", run_dir=Path("runs"), video_config=video.model_dump())
+    assert (renderer.resolution, renderer.fps) == ("640x360", 12)
+    assert renderer.encoder_options["preset"] == "ultrafast"
+    assert renderer.encoder_options["crf"] == "38"
+    assert [effect.name for effect in renderer.effect_pipeline.effects] == ["overlay"]
+    assert renderer.renditions == []
+
+
+def test_full_profile_keeps_publish_settings() -> None:
+    video = _video_config()
+    before = video.model_dump()
+
+    video.apply_profile("full")
+
+    assert video.model_dump() == before
+    assert video.preset == "medium"
+
+
+def test_draft_is_marked_in_youtube_json_and_never_published(tmp_path: Path) -> None:
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"video")
+    metadata = tmp_path / "metadata.json"
+    metadata.write_text(json.dumps({"title": "t", "description": "d", "render_profile": "draft"}), encoding="utf-8")
+    uploader = YouTubeUploader(
+        run_id="run", run_dir=tmp_path, youtube_config={"dry_run": False, "render_profile": "draft"}
+    )
+
+    output = uploader.execute({"render_video": video, "analyze_metadata": metadata})
+
+    result = json.loads(output.read_text(encoding="utf-8"))
+    assert result["render_profile"] == "draft"
+    assert result["status"] == "dry_run"
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [([], None), (["--dry-run"], None), (["--dry-run", "--render-profile", "full"], "full")],
+)
+def test_cli_flag_overrides_the_automatic_profile(monkeypatch, argv: list[str], expected: str | None) -> None:
+    calls: list[dict] = []
+    monkeypatch.setattr(sys, "argv", ["main", *argv])
+    monkeypatch.setattr(main_module, "load_dotenv", lambda **kwargs: None)
+    monkeypatch.setattr(main_module, "_configure_publication_mode", lambda **kwargs: None)
+    monkeypatch.setattr(main_module, "run_youtube", lambda **kwargs: calls.append(kwargs) or 0)
+
+    main_module.main()
+
+    assert calls[0]["render_profile"] == expected
+    assert calls[0]["force_dry_run"] is ("--dry-run" in argv)
+
+
+def test_draft_subtitles_are_styled_and_wrapped_for_the_draft_frame(tmp_path: Path) -> None:
+    video = _video_config()
+    full = SubtitleFormatter(run_id="run", run_dir=tmp_path, video_config=video)
+
+    video.apply_profile("draft")
+    draft = SubtitleFormatter(run_id="run", run_dir=tmp_path, video_config=video)
+    renderer = VideoRenderer(run_id="run", run_dir=tmp_path, video_config=video.model_dump())
+
+    assert "PlayResY=360,FontName=sans-serif,FontSize=24," in renderer.subtitle_force_style
+    assert "MarginV=3" in renderer.subtitle_force_style
+    assert (draft.resolution, draft.font_size) == ("640x360", 24)
+    assert draft.wrap_width_pixels * 3 == full.wrap_width_pixels
+    assert all(
+        draft.measurer.width(line) <= draft.wrap_width_pixels for line in draft._wrap_text("日銀が追加利上げを決定" * 4)
+    )
+
+
+def test_cli_run_applies_the_draft_profile_to_every_step(monkeypatch) -> None:
+    built: list[Config] = []
+
+    def capture(config: Config, run_id: str, run_dir: Path):
+        built.append(config)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(cli_module, "_build_steps", capture)
+
+    with pytest.raises(KeyboardInterrupt):
+        cli_module.run(force_dry_run=True)
+
+    video = built[0].steps.video
+    assert (video.profile, video.resolution, video.subtitles.font_size) == ("draft", "640x360", 24)
+    formatter = next(
+        step for step in _real_build_steps(built[0], "run", Path("runs")) if isinstance(step, SubtitleFormatter)
+    )
+    assert formatter.resolution == "640x360"
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.services.encoder_profiles import EncoderProfile, EncoderProfileStore, parse_quality
+from src.steps.video import VideoRenderer
+
+FFMPEG_LOG = """
+[Parsed_ssim_2 @ 0x1] SSIM Y:0.991234 (20.57) U:0.995 (23.0) V:0.994 (22.2) All:0.992345 (21.15)
+[Parsed_psnr_3 @ 0x2] PSNR y:44.10 u:47.90 v:47.20 average:45.123456 min:40.01 max:52.33
+"""
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def _profile(codec: str, preset: str, crf: int, fps: float, kbps: float, ssim: float) -> EncoderProfile:
+    return EncoderProfile(
+        codec=codec, preset=preset, crf=crf, resolution="1920x1080", encode_fps=fps, kbps=kbps, ssim=ssim, psnr=40.0
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> EncoderProfileStore:
+    store = EncoderProfileStore(tmp_path / "encoder_profiles.json")
+    store.record(
+        [
+            _profile("libx264", "ultrafast", 23, fps=400, kbps=9000, ssim=0.985),
+            _profile("libx264", "veryfast", 23, fps=250, kbps=5000, ssim=0.982),
+            _profile("libx264", "veryfast", 29, fps=300, kbps=2500, ssim=0.955),
+            _profile("libx265", "fast", 26, fps=60, kbps=2000, ssim=0.980),
+        ]
+    )
+    return store
+
+
+def test_quality_summary_is_parsed_from_ffmpeg_log() -> None:
+    assert parse_quality(FFMPEG_LOG) == (0.992345, 45.123456)
+    with pytest.raises(ValueError):
+        parse_quality("no summary")
+
+
+def test_fastest_profile_meeting_targets_wins(store: EncoderProfileStore) -> None:
+    assert store.select("1920x1080", min_ssim=0.97).preset == "ultrafast"
+    assert store.select("1920x1080", min_ssim=0.97, max_kbps=6000).encoder_options() == {
+        "vcodec": "libx264",
+        "preset": "veryfast",
+        "crf": "23",
+    }
+    assert store.select("1920x1080", min_ssim=0.97, max_kbps=6000, codecs=["libx265"]).codec == "libx265"
+    assert store.select("1920x1080", min_ssim=0.99) is None
+    assert store.select("1280x720") is None
+
+
+def test_rerun_replaces_matching_measurements(store: EncoderProfileStore) -> None:
+    store.record([_profile("libx264", "ultrafast", 23, fps=100, kbps=9000, ssim=0.985)])
+
+    profiles = store.load()
+    assert len(profiles) == 4
+    assert store.select("1920x1080", min_ssim=0.97).preset == "veryfast"
+
+
+def test_renderer_uses_tuned_profile_only_when_enabled(store: EncoderProfileStore, tmp_path: Path) -> None:
+    tuning = {"store": str(store.path), "min_ssim": 0.97, "max_kbps": 6000}
+    base = {"preset": "medium", "crf": 20, "encoder_options": {"pix_fmt": "yuv420p"}}
+
+    tuned = VideoRenderer(
+        run_id="run", run_dir=tmp_path, video_config={**base, "encoder_tuning": {**tuning, "enabled": True}}
+    )
+    fixed = VideoRenderer(run_id="run", run_dir=tmp_path, video_config={**base, "encoder_tuning": tuning})
+
+    assert tuned.encoder_options == {"pix_fmt": "yuv420p", "vcodec": "libx264", "preset": "veryfast", "crf": "23"}
+    assert fixed.encoder_profile is None
+    assert fixed.encoder_options["preset"] == "medium"
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+import src.providers.http as http_module
+from src.providers.http import close_sessions, http_session, latency_metrics
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+class FlakyServer(ThreadingHTTPServer):
+    """Answers 503 until ``failures`` calls have been made, then 200."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FlakyHandler)
+        self.failures = 0
+        self.calls: list[str] = []
+        self.delay = 0.0
+        self.retry_after = "0"
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    server: FlakyServer
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _handle(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.calls.append(self.command)
+        time.sleep(self.server.delay)
+        failing = len(self.server.calls) <= self.server.failures
+        self.send_response(503 if failing else 200)
+        if failing:
+            self.send_header("Retry-After", self.server.retry_after)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    do_GET = do_POST = do_PUT = _handle
+
+
+@pytest.fixture
+def server():
+    server = FlakyServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    close_sessions()
+
+
+def test_sessions_are_pooled_per_host(server: FlakyServer) -> None:
+    session = http_session(f"{server.url}/a")
+
+    assert http_session(f"{server.url}/b?x=1") is session
+    assert http_session("https://api.perplexity.ai/chat/completions") is not session
+
+
+def test_idempotent_calls_are_retried(server: FlakyServer) -> None:
+    server.failures = 2
+    session = http_session(server.url, backoff_seconds=0)
+
+    assert session.get(f"{server.url}/version").status_code == 200
+    assert server.calls == ["GET", "GET", "GET"]
+
+
+def test_posts_are_retried_only_when_marked_idempotent(server: FlakyServer) -> None:
+    session = http_session(server.url, backoff_seconds=0)
+    server.failures = 1
+
+    assert session.post(server.url, json={}).status_code == 503
+    server.calls.clear()
+    server.failures = 1
+    assert session.post(server.url, json={}, idempotent=True).status_code == 200
+    assert server.calls == ["POST", "POST"]
+
+
+def test_retry_after_is_capped(server: FlakyServer, monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(http_module, "time", SimpleNamespace(sleep=sleeps.append, perf_counter=time.perf_counter))
+    session = http_session(server.url, max_retry_after_seconds=2)
+    server.failures = 1
+    server.retry_after = "3600"
+
+    assert session.get(server.url).status_code == 200
+    assert sleeps == [2.0]
+
+
+def test_default_timeout_applies_and_latency_is_recorded(server: FlakyServer) -> None:
+    session = http_session(server.url, timeout=(1.0, 0.1), retries=1, backoff_seconds=0)
+    server.delay = 0.3
+
+    with pytest.raises(requests.ReadTimeout):
+        session.post(server.url, json={})
+    assert server.calls == ["POST"]
+    with pytest.raises(requests.ReadTimeout):
+        session.get(server.url)
+
+    metrics = latency_metrics()
+    host = f"127.0.0.1:{server.server_port}"
+    assert metrics[f"{host}_requests"] == 3
+    assert metrics[f"{host}_errors"] == 3
+    assert metrics[f"{host}_max_ms"] >= 100
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.providers.cloudflare_ai import CloudflareAIClient
+from src.services.image_cache import CachedImageService, ImageCache, image_cache_key
+from src.services.image_generation import ImageGenerationRequest
+from src.services.image_worker import StubImageBackend
+from src.steps import thumbnail_ai as thumbnail_ai_module
+from src.steps.thumbnail_ai import AIThumbnailGenerator
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def _request(prompt: str, seed: int = 42) -> ImageGenerationRequest:
+    return ImageGenerationRequest(prompt=prompt, width=16, height=9, seed=seed)
+
+
+def test_generate_batch_sends_only_misses_to_the_backend(tmp_path: Path) -> None:
+    backend = StubImageBackend()
+    cache = ImageCache(tmp_path, max_bytes=10_000_000)
+    service = CachedImageService(backend, cache)
+
+    first = service.generate_batch([_request("a"), _request("b"), _request("a")])
+    second = service.generate_batch([_request("b"), _request("c"), _request("a"), _request("a", seed=43)])
+
+    assert backend.batches == [2, 2]
+    assert [result.prompt for result in second] == ["b", "c", "a", "a"]
+    assert second[0].image.getpixel((0, 0)) == first[1].image.getpixel((0, 0))
+    assert second[2].image.getpixel((0, 0)) == first[0].image.getpixel((0, 0))
+    assert (service.hits, service.misses) == (2, 5)
+
+    CachedImageService(backend, cache, model_id="z-image-turbo:other").generate_batch([_request("a")])
+    assert backend.batches == [2, 2, 1]
+
+
+def test_least_recently_used_entries_are_evicted_past_the_size_limit(tmp_path: Path) -> None:
+    cache = ImageCache(tmp_path, max_bytes=250)
+    for age, key in enumerate(["old", "middle", "new"]):
+        cache.put(key, b"x" * 80)
+        os.utime(cache.path(key), (1_000_000 + age, 1_000_000 + age))
+
+    assert cache.get("old") == b"x" * 80
+    cache.put("newest", b"y" * 80)
+
+    assert cache.get("middle") is None
+    assert all(cache.get(key) is not None for key in ("old", "new", "newest"))
+    assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= 250
+
+
+def test_cloudflare_images_are_reused_for_identical_requests(tmp_path: Path, monkeypatch) -> None:
+    calls: list[tuple] = []
+
+    def fake_request(self, *args) -> bytes:
+        calls.append(args)
+        return b"\x89PNG" + str(len(calls)).encode()
+
+    monkeypatch.setattr(CloudflareAIClient, "_request_image", fake_request)
+    client = CloudflareAIClient(api_token="token", cache=ImageCache(tmp_path, max_bytes=1_000_000))
+
+    first = client.generate_image("market at dawn", negative_prompt="text", seed=7)
+    assert client.generate_image("market at dawn", negative_prompt="text", seed=7) == first
+    assert client.generate_image("market at dawn", negative_prompt="text", seed=8) != first
+    assert len(calls) == 2
+    assert image_cache_key(client.model, "market at dawn", "text", 1920, 1080, 6, 7.5, 7) != image_cache_key(
+        "@cf/other", "market at dawn", "text", 1920, 1080, 6, 7.5, 7
+    )
+
+
+def test_thumbnail_rerun_reuses_its_prompt_so_the_image_is_cached(tmp_path: Path, monkeypatch) -> None:
+    prompts: list[str] = []
+
+    class FakeGemini:
+        def execute(self, prompt: str, system_prompt: str) -> str:
+            prompts.append(prompt)
+            return f"harbour at dusk {len(prompts)}"
+
+    monkeypatch.setattr(thumbnail_ai_module, "GeminiProvider", FakeGemini)
+    backend = StubImageBackend()
+    service = CachedImageService(backend, ImageCache(tmp_path / "cache", max_bytes=10_000_000))
+    metadata = tmp_path / "metadata.json"
+    metadata.write_text('{"title": "Rates hold", "description": "d", "tags": ["boj"]}', encoding="utf-8")
+    config = {"enabled": True, "width": 16, "height": 9, "text_overlay_enabled": False}
+
+    for _ in range(2):
+        step = AIThumbnailGenerator("run", tmp_path, config, image_service=service)
+        step.execute({"analyze_metadata": metadata})
+    metadata.write_text('{"title": "Rates rise", "description": "d", "tags": ["boj"]}', encoding="utf-8")
+    step.execute({"analyze_metadata": metadata})
+
+    assert len(prompts) == 2
+    assert backend.batches == [1, 1]
+    assert (service.hits, service.misses) == (1, 2)
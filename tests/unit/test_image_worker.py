@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+
+import pytest
+
+from src.services.image_generation import ImageGenerationRequest
+from src.services.image_worker import (
+    ImageWorker,
+    ImageWorkerClient,
+    ImageWorkerError,
+    ImageWorkerServer,
+    StubImageBackend,
+    connect_image_worker,
+    receive_message,
+    send_message,
+)
+from src.utils.config import ImageWorkerConfig
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+class FailingBackend(StubImageBackend):
+    def generate_batch(self, requests):
+        raise RuntimeError("CUDA out of memory")
+
+
+def _serve(backend, max_batch: int = 4) -> ImageWorkerServer:
+    server = ImageWorkerServer("127.0.0.1:0", backend, max_batch=max_batch)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _free_address() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{sock.getsockname()[1]}"
+
+
+def test_client_round_trips_a_batch_through_the_worker() -> None:
+    server = _serve(StubImageBackend())
+    try:
+        client = ImageWorkerClient(server.address)
+        requests = [
+            ImageGenerationRequest(prompt="tokyo skyline", width=64, height=36, seed=7),
+            ImageGenerationRequest(prompt="bond chart", width=32, height=18),
+        ]
+        results = client.generate_batch(requests)
+        again = client.generate(requests[0])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert client.is_available() is False
+    assert [result.image.size for result in results] == [(64, 36), (32, 18)]
+    assert [(result.prompt, result.seed) for result in results] == [("tokyo skyline", 7), ("bond chart", 42)]
+    assert again.image.getpixel((0, 0)) == results[0].image.getpixel((0, 0))
+    assert results[0].image.getpixel((0, 0)) != results[1].image.getpixel((0, 0))
+    assert server.worker.backend.batches == [2, 1]
+
+
+def test_waiting_jobs_are_coalesced_up_to_max_batch() -> None:
+    backend = StubImageBackend(delay_seconds=0.2)
+    worker = ImageWorker(backend, max_batch=3)
+    try:
+        first = worker.submit([ImageGenerationRequest(prompt="first", width=8, height=8)])
+        while not backend.batches:
+            time.sleep(0.01)
+        queued = [worker.submit([ImageGenerationRequest(prompt=f"p{i}", width=8, height=8)]) for i in range(4)]
+        for job in [first, *queued]:
+            assert job.done.wait(5)
+    finally:
+        worker.close()
+
+    assert backend.batches == [1, 3, 1]
+    assert [job.results[0].prompt for job in queued] == ["p0", "p1", "p2", "p3"]
+
+
+def test_a_job_that_would_overflow_the_batch_starts_the_next_one() -> None:
+    backend = StubImageBackend(delay_seconds=0.2)
+    worker = ImageWorker(backend, max_batch=4)
+
+    def requests(prefix: str, count: int):
+        return [ImageGenerationRequest(prompt=f"{prefix}{i}", width=8, height=8) for i in range(count)]
+
+    try:
+        first = worker.submit(requests("first", 1))
+        while not backend.batches:
+            time.sleep(0.01)
+        queued = [worker.submit(requests(prefix, count)) for prefix, count in (("a", 3), ("b", 4), ("c", 1))]
+        for job in [first, *queued]:
+            assert job.done.wait(5)
+    finally:
+        worker.close()
+
+    assert backend.batches == [1, 3, 4, 1]
+    assert [[result.prompt for result in job.results] for job in queued] == [
+        ["a0", "a1", "a2"],
+        ["b0", "b1", "b2", "b3"],
+        ["c0"],
+    ]
+
+
+def test_malformed_requests_are_answered_with_an_error() -> None:
+    server = _serve(StubImageBackend())
+    try:
+        with socket.create_connection(("127.0.0.1", server.server_address[1]), timeout=5) as sock:
+            send_message(sock, {"op": "generate", "requests": [{"prompt": "x", "colour": "red"}]})
+            reply = receive_message(sock)
+            send_message(sock, {"op": "ping"})
+            ping = receive_message(sock)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert reply["error"].startswith("TypeError:") and "colour" in reply["error"]
+    assert ping["ok"] is True
+
+
+def test_backend_errors_reach_the_client() -> None:
+    server = _serve(FailingBackend())
+    try:
+        with pytest.raises(ImageWorkerError, match="CUDA out of memory"):
+            ImageWorkerClient(server.address).generate_batch([ImageGenerationRequest(prompt="x", width=8, height=8)])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_unreachable_worker_is_reported_and_skipped() -> None:
+    address = _free_address()
+    client = ImageWorkerClient(address)
+
+    assert client.is_available() is False
+    with pytest.raises(ImageWorkerError, match="unreachable"):
+        client.generate_batch([ImageGenerationRequest(prompt="x")])
+    assert connect_image_worker(ImageWorkerConfig(enabled=True, address=address)) is None
+    assert connect_image_worker(ImageWorkerConfig(enabled=False)) is None
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from src.steps.scene_generator import ContextExtractor
+from src.utils.keywords import KeywordMatcher, get_keyword_matcher
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def test_news_entities_use_canonical_labels() -> None:
+    matcher = get_keyword_matcher()
+
+    assert matcher.match("news_entities", "日経平均株価とS&P 500、nvidiaの決算") == {
+        "日経平均",
+        "S&P500",
+        "エヌビディア",
+        "決算",
+    }
+    assert matcher.match("news_entities", "アサヒグループHDが値上げ") == {"アサヒ"}
+    assert matcher.match("news_entities", "") == frozenset()
+
+
+def test_overlapping_terms_are_all_reported_in_one_pass() -> None:
+    matcher = KeywordMatcher({"terms": ["ドル円", "円安", "安定"]})
+
+    assert matcher.match("terms", "ドル円安定") == {"ドル円", "円安", "安定"}
+
+
+def test_terms_sharing_a_prefix_or_position_are_all_reported() -> None:
+    matcher = KeywordMatcher({"t": ["ドル", "ドル円", "円", "円安", "ドル円安"]})
+
+    assert matcher.match("t", "ドル円") == {"ドル", "ドル円", "円"}
+    assert matcher.match("t", "ドル円安") == {"ドル", "ドル円", "円", "円安", "ドル円安"}
+    assert KeywordMatcher({"t": {"short": ["nikkei"], "long": ["nikkei\\s*225"]}}).match("t", "NIKKEI 225") == {
+        "short",
+        "long",
+    }
+
+
+def test_literal_terms_are_escaped_and_ordered_by_vocabulary() -> None:
+    matcher = KeywordMatcher({"entities": ["S&P500", "a.b", "日銀"]})
+
+    assert matcher["entities"].ordered("日銀 と S&P500 と axb") == ["S&P500", "日銀"]
+
+
+def test_results_are_memoized_per_text() -> None:
+    vocabulary = KeywordMatcher({"mood": ["上昇", "下落"]})["mood"]
+
+    vocabulary.match("株価が上昇")
+    vocabulary.match("株価が上昇")
+
+    assert vocabulary.match.cache_info().hits == 1
+
+
+def test_market_sentiment_reads_japanese_stats() -> None:
+    assert ContextExtractor.extract_market_sentiment({"summary": "再生数が上昇し好調"}) == "bull"
+    assert ContextExtractor.extract_market_sentiment({"summary": "視聴維持率が下落、懸念"}) == "bear"
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from src.models import NewsItem
+from src.steps.news import NewsCollector
+from src.utils.near_duplicates import MinHashClusterer, lsh_bands
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+SYNDICATED = [
+    NewsItem(
+        title="日銀、追加利上げを決定 政策金利0.5%に引き上げ",
+        summary="日本銀行は金融政策決定会合で追加利上げを決めた。",
+        url="https://www.bloomberg.co.jp/news/articles/boj-hike",
+    ),
+    NewsItem(
+        title="トヨタ、純利益が過去最高 円安が追い風",
+        summary="トヨタ自動車の四半期純利益が過去最高を更新した。",
+        url="https://www.nikkei.com/article/toyota-record",
+    ),
+    NewsItem(
+        title="日銀が追加利上げを決定、政策金利を0.5%に引き上げ",
+        summary="日本銀行は金融政策決定会合で追加の利上げを決定した。",
+        url="https://finance.yahoo.co.jp/news/detail/boj-hike",
+    ),
+    NewsItem(
+        title="ドル円が150円台に上昇",
+        summary="為替市場で円安が進んだ。",
+        url="https://example.test/fx-up",
+    ),
+    NewsItem(
+        title="トヨタ純利益が過去最高に、円安が追い風 - Bloomberg",
+        summary="トヨタ自動車の四半期純利益が過去最高を更新。",
+        url="https://www.bloomberg.co.jp/news/articles/toyota-record",
+    ),
+    NewsItem(
+        title="ドル円が140円台に下落",
+        summary="為替市場で円高が進んだ。",
+        url="https://example.test/fx-down",
+    ),
+]
+
+
+def _collector(tmp_path: Path, **kwargs) -> NewsCollector:
+    return NewsCollector(run_id="run-1", run_dir=tmp_path, providers=[], **kwargs)
+
+
+def test_syndicated_stories_collapse_to_first_representative(tmp_path: Path) -> None:
+    clusters = _collector(tmp_path)._normalize_and_cluster(SYNDICATED)
+
+    assert [[item.url for item in cluster] for cluster in clusters] == [
+        [SYNDICATED[0].url, SYNDICATED[2].url],
+        [SYNDICATED[1].url, SYNDICATED[4].url],
+        [SYNDICATED[3].url],
+        [SYNDICATED[5].url],
+    ]
+
+
+def test_threshold_is_configurable_and_can_be_disabled(tmp_path: Path) -> None:
+    strict = _collector(tmp_path, near_duplicate_threshold=0.95)._normalize_and_cluster(SYNDICATED)
+    disabled = _collector(tmp_path, near_duplicate_threshold=None)._normalize_and_cluster(SYNDICATED)
+
+    assert len(strict) == len(SYNDICATED)
+    assert len(disabled) == len(SYNDICATED)
+
+
+def test_identical_titles_and_urls_are_always_merged(tmp_path: Path) -> None:
+    items = [
+        NewsItem(title="ＴＯＰＩＸが反落", summary="東証", url="https://a.test/1"),
+        NewsItem(title="TOPIXが反落", summary="別ソースの要約", url="https://b.test/2"),
+        NewsItem(title="TOPIXが反落", summary="同じURL", url="https://a.test/1"),
+    ]
+
+    clusters = _collector(tmp_path, near_duplicate_threshold=0.99)._normalize_and_cluster(items)
+
+    assert [[item.url for item in cluster] for cluster in clusters] == [["https://a.test/1", "https://b.test/2"]]
+
+
+def test_lsh_band_choice_tracks_threshold() -> None:
+    bands, rows = lsh_bands(64, 0.55)
+    assert bands * rows == 64
+    assert abs((1 / bands) ** (1 / rows) - 0.55) < 0.1
+
+
+def test_clustering_scales_linearly_with_candidate_count() -> None:
+    clusterer = MinHashClusterer(threshold=0.55, shingle_size=2)
+    texts = [f"銘柄{i:04d}の決算発表 売上高{i * 7}億円 営業利益{i * 3}億円" for i in range(400)]
+
+    start = time.perf_counter()
+    clusters = clusterer.cluster(texts)
+    elapsed = time.perf_counter() - start
+
+    assert sum(len(cluster) for cluster in clusters) == len(texts)
+    assert elapsed < 5.0
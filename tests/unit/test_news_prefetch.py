@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.models import NewsItem
+from src.services.news_prefetch import NewsPrefetcher, cron_matches, next_fire_time
+from src.steps.news import NewsCollector
+from src.utils.news_store import CandidateCache
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+class CountingProvider:
+    name = "perplexity"
+    priority = 1
+
+    def __init__(self, urls: list[str]):
+        self.urls = urls
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def execute(self, **kwargs) -> list[NewsItem]:
+        self.calls += 1
+        return [NewsItem(title=url, summary="", url=url) for url in self.urls]
+
+
+def test_next_fire_time_handles_steps_ranges_and_weekdays() -> None:
+    monday = datetime(2025, 11, 10, 6, 58, 30)
+
+    assert next_fire_time("0 7 * * *", monday) == datetime(2025, 11, 10, 7, 0)
+    assert next_fire_time("*/15 * * * *", monday) == datetime(2025, 11, 10, 7, 0)
+    assert next_fire_time("30 9-17/4 * * 1-5", monday) == datetime(2025, 11, 10, 9, 30)
+    assert next_fire_time("0 0 * * 0", monday) == datetime(2025, 11, 16, 0, 0)
+    assert cron_matches("0 0 * * 7", datetime(2025, 11, 16, 0, 0))
+    with pytest.raises(ValueError):
+        next_fire_time("61 * * * *", monday)
+
+
+def test_prefetcher_fires_once_inside_lead_window() -> None:
+    calls: list[int] = []
+    prefetcher = NewsPrefetcher(lambda: calls.append(1), ["0 7 * * *"], lead_minutes=5)
+
+    assert not prefetcher.run_once(datetime(2025, 11, 10, 6, 50))
+    assert prefetcher.run_once(datetime(2025, 11, 10, 6, 56))
+    assert not prefetcher.run_once(datetime(2025, 11, 10, 6, 58))
+    assert calls == [1]
+
+
+def test_collector_uses_fresh_prefetched_candidates(tmp_path: Path) -> None:
+    provider = CountingProvider(["https://a", "https://b"])
+    step = NewsCollector(
+        run_id="run-1", run_dir=tmp_path, providers=[provider], query="markets", prefetch_max_age_minutes=15
+    )
+
+    step.prefetch()
+    candidates, metrics, source = step._load_candidates("markets", 9)
+
+    assert provider.calls == 1
+    assert [item.url for item in candidates] == ["https://a", "https://b"]
+    assert metrics[0]["provider"] == "perplexity"
+    assert source["source"] == "prefetch"
+
+
+def test_collector_fetches_live_when_cache_is_stale(tmp_path: Path) -> None:
+    provider = CountingProvider(["https://live"])
+    cache_path = tmp_path / "news_candidates.json"
+    CandidateCache(cache_path).put(
+        "markets",
+        [NewsItem(title="old", summary="", url="https://old")],
+        [],
+        now=datetime.now() - timedelta(hours=1),
+    )
+    step = NewsCollector(
+        run_id="run-1",
+        run_dir=tmp_path,
+        providers=[provider],
+        candidate_cache_path=cache_path,
+        prefetch_max_age_minutes=15,
+    )
+
+    candidates, _, source = step._load_candidates("markets", 9)
+
+    assert [item.url for item in candidates] == ["https://live"]
+    assert source == {"source": "live"}
+
+
+def test_bucket_selection_prefers_prefetched_bucket(tmp_path: Path) -> None:
+    buckets = {"macro": "日銀 金利", "tech": "半導体 決算", "fx": "ドル円 為替"}
+    CandidateCache(tmp_path / "news_candidates.json").put("半導体 決算", [], [])
+
+    picks = {
+        NewsCollector(
+            run_id=f"run-{i}",
+            run_dir=tmp_path,
+            providers=[],
+            query_buckets=buckets,
+            prefetch_max_age_minutes=15,
+        )._select_bucket()[0]
+        for i in range(10)
+    }
+
+    assert picks == {"tech"}
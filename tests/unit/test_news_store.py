@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import src.tracking
+from src.models import NewsItem
+from src.steps.news import NewsCollector
+from src.utils.news_store import SeenNewsStore, normalize_url, title_fingerprint
+
+NOW = datetime(2025, 11, 20, 9, 0)
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def _item(title: str, url: str) -> NewsItem:
+    return NewsItem(title=title, summary="", url=url)
+
+
+def test_url_and_title_identity_ignore_cosmetic_differences() -> None:
+    assert normalize_url("https://WWW.Example.com/a/?utm_source=x&b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+    assert title_fingerprint("日経平均、最高値！") == title_fingerprint("日経平均 最高値")
+    assert title_fingerprint("ＴＯＰＩＸ") == title_fingerprint("topix")
+
+
+def test_selected_items_cool_down_until_ttl_expires(tmp_path: Path) -> None:
+    path = tmp_path / "seen.json"
+    store = SeenNewsStore(path, ttl_hours=24, now=NOW)
+    store.mark_seen([_item("見ただけ", "https://example.com/seen")], now=NOW)
+    store.mark_selected([_item("日銀が利上げ", "https://example.com/boj")], now=NOW)
+    store.save()
+
+    later = NOW + timedelta(hours=12)
+    reloaded = SeenNewsStore(path, ttl_hours=24, now=later)
+    allowed, cooling = reloaded.partition(
+        [
+            _item("日銀が利上げ", "https://www.example.com/boj/?utm_medium=rss"),
+            _item("日銀が利上げ！", "https://mirror.example.net/boj"),
+            _item("見ただけ", "https://example.com/seen"),
+        ],
+        now=later,
+    )
+    assert [item.url for item in cooling] == [
+        "https://www.example.com/boj/?utm_medium=rss",
+        "https://mirror.example.net/boj",
+    ]
+    assert [item.url for item in allowed] == ["https://example.com/seen"]
+
+    expired = SeenNewsStore(path, ttl_hours=24, now=NOW + timedelta(hours=25))
+    assert len(expired) == 0
+    assert not expired.is_cooling_down(_item("日銀が利上げ", "https://example.com/boj"), now=NOW + timedelta(hours=25))
+
+
+class FakeNewsProvider:
+    name = "fake"
+
+    def __init__(self, items: list[NewsItem]):
+        self.items = items
+
+    def is_available(self) -> bool:
+        return True
+
+    def execute(self, **kwargs) -> list[NewsItem]:
+        return list(self.items)
+
+
+class NullTracker:
+    def track_prompt(self, **kwargs) -> None:
+        pass
+
+    def track_metrics(self, metrics) -> None:
+        pass
+
+
+def test_collector_filters_cooldown_candidates_before_selection(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(src.tracking.AimTracker, "get_instance", classmethod(lambda cls, run_id=None: NullTracker()))
+    titles = ["日銀が利上げ", "トヨタ最高益", "ドル円急落", "原油が反発", "半導体株が上昇"]
+    items = [_item(title, f"https://example.com/{i}") for i, title in enumerate(titles)]
+    store = SeenNewsStore(tmp_path / "seen_news.json", ttl_hours=24)
+    store.mark_selected(items[:2])
+    store.save()
+
+    step = NewsCollector(
+        run_id="run-2",
+        run_dir=tmp_path,
+        providers=[FakeNewsProvider(items)],
+        query="markets",
+        final_count=3,
+        cooldown_hours=24,
+    )
+    prompts: list[list[str]] = []
+    step._build_selection_prompt = lambda candidates, recent: prompts.append([c.url for c in candidates]) or ""
+    output = step.execute({})
+
+    assert prompts == [[item.url for item in items[2:]]]
+    assert [entry["url"] for entry in json.loads(output.read_text())] == [item.url for item in items[2:]]
+    record = json.loads((tmp_path / "run-2" / "news_selection.json").read_text())
+    assert [entry["url"] for entry in record["cooldown_skipped"]] == [item.url for item in items[:2]]
+    assert SeenNewsStore(tmp_path / "seen_news.json", ttl_hours=24).partition(items)[0] == []
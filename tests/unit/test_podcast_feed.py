@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+import src.services.podcast_feed as podcast_feed_module
+from src.services.podcast_feed import Episode, EpisodeIndex, PodcastFeed
+from src.steps.podcast import PodcastExporter
+from src.utils.config import PodcastStepConfig
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def _episode(number: int) -> Episode:
+    return Episode(
+        guid=f"https://example.invalid/podcast/{number}",
+        title=f"Episode {number}",
+        description="d",
+        enclosure_url=f"https://cdn.example.invalid/{number}.mp3",
+        length=1000 + number,
+        mime_type="audio/mpeg",
+        duration_seconds=600,
+        published=START + timedelta(days=number),
+    )
+
+
+def _channel(path: Path) -> ET.Element:
+    return ET.parse(path).getroot().find("channel")
+
+
+def _feed(tmp_path: Path, window_size: int = 2) -> PodcastFeed:
+    config = PodcastStepConfig(feed_url="https://example.invalid/podcast", window_size=window_size)
+    return PodcastFeed(tmp_path / "podcast", config)
+
+
+def test_feed_keeps_a_window_and_freezes_full_blocks_into_archive_pages(tmp_path: Path) -> None:
+    feed = _feed(tmp_path)
+    for number in range(1, 4):
+        feed.publish(_episode(number))
+    first_page = feed.archive_path(1)
+    frozen = (first_page.read_bytes(), first_page.stat().st_mtime_ns)
+
+    for number in range(4, 6):
+        feed_path = feed.publish(_episode(number))
+
+    channel = _channel(feed_path)
+    assert [item.findtext("title") for item in channel.findall("item")] == ["Episode 5", "Episode 4"]
+    assert channel.find("item/enclosure").get("length") == "1005"
+    prev = [link.get("href") for link in channel.findall(f"{ATOM}link") if link.get("rel") == "prev-archive"]
+    assert prev == ["https://example.invalid/podcast/archive/page-0002.xml"]
+    assert (first_page.read_bytes(), first_page.stat().st_mtime_ns) == frozen
+    second = _channel(feed.archive_path(2))
+    assert [item.findtext("title") for item in second.findall("item")] == ["Episode 4", "Episode 3"]
+    assert second.find(f"{ATOM}link[@rel='prev-archive']").get("href").endswith("page-0001.xml")
+    assert second.find("{http://purl.org/syndication/history/1.0}archive") is not None
+    assert channel.find("{http://purl.org/syndication/history/1.0}archive") is None
+    assert not feed.archive_path(3).exists()
+
+
+def test_rerun_does_not_duplicate_the_newest_episode(tmp_path: Path) -> None:
+    feed = _feed(tmp_path, window_size=10)
+    feed.publish(_episode(1))
+    feed.publish(_episode(2))
+    feed.publish(_episode(2))
+
+    assert feed.index.count() == 2
+    assert len(_channel(feed.feed_path).findall("item")) == 2
+
+
+def test_resumed_older_run_does_not_duplicate_an_episode_in_the_window(tmp_path: Path) -> None:
+    feed = _feed(tmp_path, window_size=3)
+    for number in (1, 2, 3):
+        feed.publish(_episode(number))
+    feed.publish(_episode(2))
+
+    assert feed.index.count() == 3
+    titles = [item.findtext("title") for item in _channel(feed.feed_path).findall("item")]
+    assert titles == ["Episode 3", "Episode 2", "Episode 1"]
+    assert feed.archive_path(1).exists() and not feed.archive_path(2).exists()
+
+
+def test_concurrent_runs_publish_every_episode_once(tmp_path: Path) -> None:
+    feed = _feed(tmp_path, window_size=50)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda number: _feed(tmp_path, window_size=50).publish(_episode(number)), range(1, 41)))
+
+    assert feed.index.count() == 40
+    assert sorted(episode.guid for episode in feed.index.tail(50)) == sorted(_episode(n).guid for n in range(1, 41))
+
+
+def test_index_tail_reads_from_the_end(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(podcast_feed_module, "TAIL_BLOCK_SIZE", 64)
+    index = EpisodeIndex(tmp_path / "episodes.jsonl")
+    for number in range(1, 31):
+        index.append(_episode(number))
+
+    assert index.count() == 30
+    assert [episode.title for episode in index.tail(3)] == ["Episode 28", "Episode 29", "Episode 30"]
+    assert len(index.tail(100)) == 30
+
+
+def test_each_run_appends_to_the_shared_feed(tmp_path: Path) -> None:
+    audio = tmp_path / "audio.mp3"
+    audio.write_bytes(b"\xff" * 2048)
+    manifest = tmp_path / "podcast_audio.json"
+    manifest.write_text(f'{{"path": "{audio}", "mime_type": "audio/mpeg", "duration_seconds": 61.2}}', encoding="utf-8")
+    config = {"feed_dir": str(tmp_path / "podcast"), "media_base_url": "https://cdn.example.invalid/"}
+
+    for run_id in ("20260101_070000", "20260102_070000"):
+        exporter = PodcastExporter(run_id=run_id, run_dir=tmp_path, podcast_config=config)
+        output = exporter.run({"encode_podcast_audio": manifest})
+
+    items = _channel(output).findall("item")
+    assert [item.findtext("title") for item in items] == ["Episode 20260102_070000", "Episode 20260101_070000"]
+    assert items[0].find("enclosure").get("url") == "https://cdn.example.invalid/20260102_070000/audio.mp3"
+    assert output.read_bytes() == (tmp_path / "podcast" / "feed.xml").read_bytes()
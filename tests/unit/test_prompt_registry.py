@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from src.providers.llm import load_prompt_template
+from src.utils.config import load_prompts
+from src.utils.prompt_registry import PromptRegistry, PromptTemplate, get_prompt_registry
+from src.utils.prompt_version import prompt_bundle_version
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+def _write(path: Path, text: str, bump_ns: int = 0) -> None:
+    path.write_text(text, encoding="utf-8")
+    if bump_ns:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump_ns))
+
+
+class PromptTemplateTests(unittest.TestCase):
+    def test_matches_str_format_for_named_fields_and_escapes(self):
+        source = "題材: {topic}\n{{\"segments\": []}}\n件数 {count} / {topic}"
+        template = PromptTemplate(source)
+
+        self.assertEqual(template, source)
+        self.assertEqual(template.fields, frozenset({"topic", "count"}))
+        self.assertEqual(template.format(topic="日銀", count=3), source.format(topic="日銀", count=3))
+
+    def test_falls_back_to_str_format_for_specs_and_positional_fields(self):
+        template = PromptTemplate("{ratio:.1%} {0}")
+
+        self.assertEqual(template.format(0.25, ratio=0.5), "50.0% 0.25")
+
+    def test_missing_field_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            PromptTemplate("{topic}").format()
+
+
+class PromptRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.prompts = root / "prompts.yaml"
+        self.selection = root / "news_selection.yaml"
+        self.contract = root / "voice.txt"
+        _write(
+            self.prompts,
+            "script_generation:\n  user_template: 'A {x}'\nnews_collection:\n  user_template: 'N {x}'\n",
+        )
+        _write(self.selection, "news_selection:\n  user_template: 'S {x}'\n")
+        _write(self.contract, "VOICE\n")
+        self.registry = PromptRegistry(self.prompts, self.selection, self.contract)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_templates_are_compiled_once_per_file_version(self):
+        first = self.registry.template("news_collection")
+
+        self.assertIs(self.registry.template("news_collection"), first)
+        self.assertIs(self.registry.prompts(), self.registry.prompts())
+        self.assertEqual(self.registry.template("script_generation").format(x=1), "A 1\n\nVOICE\n")
+
+    def test_edits_on_disk_invalidate_cached_entries(self):
+        before = self.registry.template("news_collection")
+        version = self.registry.bundle_version()
+
+        _write(self.prompts, "news_collection:\n  user_template: 'M {x}'\n", bump_ns=1_000_000)
+
+        self.assertEqual(self.registry.template("news_collection").format(x=2), "M 2")
+        self.assertIsNot(self.registry.template("news_collection"), before)
+        self.assertNotEqual(self.registry.bundle_version(), version)
+
+    def test_voice_contract_changes_recompile_script_template(self):
+        self.registry.template("script_generation")
+
+        _write(self.contract, "VOICE2\n", bump_ns=1_000_000)
+
+        self.assertTrue(self.registry.template("script_generation").endswith("VOICE2\n"))
+        self.assertIn("# runtime voice contract\nVOICE2", self.registry.tracked_source("script_generation"))
+
+    def test_bundle_version_hashes_both_sources(self):
+        digest = hashlib.sha256()
+        for path in (self.prompts, self.selection):
+            digest.update(path.name.encode("utf-8") + b"\0" + path.read_bytes() + b"\0")
+
+        self.assertEqual(self.registry.bundle_version(), f"sha256:{digest.hexdigest()}")
+
+
+class DefaultRegistryTests(unittest.TestCase):
+    def test_default_bundle_version_is_served_by_registry(self):
+        self.assertEqual(prompt_bundle_version(), get_prompt_registry().bundle_version())
+
+    def test_load_prompt_template_returns_shared_compiled_template(self):
+        self.assertIs(load_prompt_template("metadata_generation"), load_prompt_template("metadata_generation"))
+
+    def test_load_prompts_hands_out_copies_of_the_cached_bundle(self):
+        load_prompts()["news_collection"]["user_template"] = "mutated"
+
+        self.assertNotEqual(load_prompts()["news_collection"]["user_template"], "mutated")
+        self.assertNotEqual(get_prompt_registry().section("news_collection")["user_template"], "mutated")
+
+
+if __name__ == "__main__":
+    unittest.main()
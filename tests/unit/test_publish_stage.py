@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+import src.core.orchestrator as orchestrator_module
+from src.core.orchestrator import WorkflowOrchestrator
+from src.core.publish import PublishStage
+from src.core.step import Step
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+class NullTracker:
+    run_hash = None
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture(autouse=True)
+def null_tracker(monkeypatch):
+    monkeypatch.setattr(orchestrator_module.AimTracker, "get_instance", lambda run_id: NullTracker())
+
+
+class FakePublisher(Step):
+    def __init__(self, tmp_path: Path, name: str, delay: float = 0.0, failures: int = 0, depends_on=()):
+        super().__init__("run", tmp_path)
+        self.name = name
+        self.output_filename = f"{name}.json"
+        self.depends_on = tuple(depends_on)
+        self.delay = delay
+        self.failures = failures
+        self.calls = 0
+        self.seen: Dict[str, Path] = {}
+
+    def execute(self, inputs: Dict[str, Path]) -> Path:
+        self.calls += 1
+        self.seen = dict(inputs)
+        time.sleep(self.delay)
+        if self.calls <= self.failures:
+            raise ConnectionError(f"{self.name} attempt {self.calls} failed")
+        path = self.get_output_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}", encoding="utf-8")
+        return path
+
+
+def _orchestrator(tmp_path: Path, *publishers: Step, **stage) -> WorkflowOrchestrator:
+    stage.setdefault("retry_backoff_seconds", 0)
+    return WorkflowOrchestrator(run_id="run", steps=[PublishStage(publishers, **stage)], run_dir=tmp_path)
+
+
+def test_publishers_run_concurrently(tmp_path: Path) -> None:
+    publishers = [
+        FakePublisher(tmp_path, name, delay=0.4) for name in ("upload_youtube", "post_linkedin", "post_hatena")
+    ]
+    orchestrator = _orchestrator(tmp_path, *publishers)
+
+    started = time.perf_counter()
+    result = orchestrator.execute()
+
+    assert result.status == "success"
+    assert time.perf_counter() - started < 1.0
+    assert set(orchestrator.state.completed_steps) == {"upload_youtube", "post_linkedin", "post_hatena"}
+    assert orchestrator.state.metrics["post_hatena"]["publish_attempts"] == 1
+    assert orchestrator.state.metrics["post_hatena"]["publish_seconds"] >= 0.4
+
+
+def test_declared_dependency_waits_for_its_output(tmp_path: Path) -> None:
+    youtube = FakePublisher(tmp_path, "upload_youtube", delay=0.3)
+    twitter = FakePublisher(tmp_path, "post_twitter", depends_on=["upload_youtube"])
+
+    result = _orchestrator(tmp_path, twitter, youtube).execute()
+
+    assert result.status == "success"
+    assert twitter.seen["upload_youtube"] == str(youtube.get_output_path())
+
+
+def test_each_publisher_has_its_own_budget(tmp_path: Path) -> None:
+    flaky = FakePublisher(tmp_path, "upload_buzzsprout", failures=1)
+    hung = FakePublisher(tmp_path, "post_linkedin", delay=2.0)
+    steady = FakePublisher(tmp_path, "export_podcast")
+    dependent = FakePublisher(tmp_path, "post_twitter", depends_on=["post_linkedin"])
+    policies = {"upload_buzzsprout": {"retries": 2}, "post_linkedin": {"timeout_seconds": 0.2}}
+    orchestrator = _orchestrator(tmp_path, flaky, hung, steady, dependent, retries=0, policies=policies)
+
+    started = time.perf_counter()
+    result = orchestrator.execute()
+
+    assert time.perf_counter() - started < 1.5
+    assert result.status == "failed"
+    assert "post_linkedin: TimeoutError" in result.errors[0]
+    state = orchestrator.state
+    assert set(state.completed_steps) == {"upload_buzzsprout", "export_podcast"}
+    assert state.metrics["upload_buzzsprout"]["publish_attempts"] == 2
+    assert state.step_statuses["post_linkedin"] == "failed"
+    assert state.metrics["post_linkedin"]["publish_error"].startswith("TimeoutError")
+    assert dependent.calls == 0 and "post_twitter" not in state.step_statuses
+
+
+def test_rerun_only_repeats_failed_publishers(tmp_path: Path) -> None:
+    good = FakePublisher(tmp_path, "post_hatena")
+    bad = FakePublisher(tmp_path, "post_linkedin", failures=1)
+    assert _orchestrator(tmp_path, good, bad, retries=0).execute().status == "failed"
+
+    good.calls = 0
+    result = _orchestrator(tmp_path, good, bad, retries=0).execute()
+
+    assert result.status == "success"
+    assert good.calls == 0 and bad.calls == 2
+
+
+def test_dependency_cycles_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        PublishStage(
+            [
+                FakePublisher(tmp_path, "upload_youtube", depends_on=["post_twitter"]),
+                FakePublisher(tmp_path, "post_twitter", depends_on=["upload_youtube"]),
+            ]
+        )
+
+
+def test_publishers_overlap_a_slow_stream_consumer(tmp_path: Path) -> None:
+    spans: Dict[str, tuple[float, float]] = {}
+
+    class Timed(FakePublisher):
+        def execute(self, inputs):
+            started = time.perf_counter()
+            try:
+                return super().execute(inputs)
+            finally:
+                spans[self.name] = (started, time.perf_counter())
+
+    upload = Timed(tmp_path, "upload_youtube", delay=0.6)
+    upload.consumes_stream = True
+    publishers = [upload, Timed(tmp_path, "post_hatena", delay=0.1), Timed(tmp_path, "encode_podcast_audio", delay=0.1)]
+    stage = PublishStage(publishers, retry_backoff_seconds=0)
+
+    stage.run({}, [], settle=lambda: None, complete=lambda *args: None, fail=lambda *args: None)
+
+    upload_end = spans["upload_youtube"][1]
+    assert all(spans[name][1] < upload_end - 0.3 for name in ("post_hatena", "encode_podcast_audio"))
+
+
+def test_settle_runs_once_before_the_first_non_streaming_publisher(tmp_path: Path) -> None:
+    settled = threading.Event()
+    calls: list[str] = []
+
+    class Consumer(FakePublisher):
+        consumes_stream = True
+
+        def execute(self, inputs):
+            calls.append(f"{self.name}:{settled.is_set()}")
+            return super().execute(inputs)
+
+    def settle() -> None:
+        time.sleep(0.1)
+        calls.append("settle")
+        settled.set()
+
+    stage = PublishStage(
+        [Consumer(tmp_path, "upload_youtube"), FakePublisher(tmp_path, "post_hatena"), FakePublisher(tmp_path, "x")]
+    )
+    results = stage.run({}, [], settle=settle, complete=lambda *args: None, fail=lambda *args: None)
+
+    assert [result.ok for result in results] == [True, True, True]
+    assert calls.count("settle") == 1
+    assert "upload_youtube:False" in calls
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from src.steps.subtitle import SubtitleFormatter
+from src.utils.text_metrics import NO_LINE_END, NO_LINE_START, CellFont, TextMeasurer, get_text_measurer
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+class CountingFont(CellFont):
+    def __init__(self, size: float):
+        super().__init__(size)
+        self.calls = 0
+
+    def getlength(self, text: str) -> float:
+        self.calls += 1
+        return super().getlength(text)
+
+
+def test_advances_are_measured_once_per_codepoint() -> None:
+    font = CountingFont(10)
+    measurer = TextMeasurer(font)
+
+    assert measurer.width("日銀日銀ab") == 50
+    assert measurer.width("銀b日a") == 30
+    assert font.calls == 4
+
+
+def test_half_width_text_packs_twice_as_dense() -> None:
+    measurer = TextMeasurer(CellFont(10))
+
+    assert measurer.wrap("1234567890", 50) == ["1234567890"]
+    assert measurer.wrap("あいうえおかき", 50) == ["あいうえお", "かき"]
+
+
+def test_kinsoku_and_words_are_respected_and_lossless() -> None:
+    measurer = TextMeasurer(CellFont(10))
+    text = "日銀は「追加利上げ」を決定。ドル円は150円台、NVIDIA stock rallied after earnings!"
+
+    lines = measurer.wrap(text, 80)
+
+    assert "".join(lines) == text
+    assert all(line.rstrip()[-1] not in NO_LINE_END for line in lines)
+    assert all(line[0] not in NO_LINE_START for line in lines[1:])
+    assert "NVIDIA " in lines or any(line.startswith("NVIDIA") for line in lines)
+    assert not any(line.endswith("NVI") for line in lines)
+
+
+def test_max_chars_caps_line_length() -> None:
+    measurer = TextMeasurer(CellFont(10))
+
+    assert measurer.wrap("abcdefgh", 1000, max_chars=3) == ["abc", "def", "gh"]
+
+
+def test_real_font_is_loaded_once() -> None:
+    first = get_text_measurer("assets/fonts/ZenMaruGothic-Bold.ttf", 48)
+
+    assert get_text_measurer("assets/fonts/ZenMaruGothic-Bold.ttf", 48) is first
+    assert first.width("ニュース") > first.width("news")
+
+
+def test_subtitle_pages_fit_two_measured_lines() -> None:
+    formatter = object.__new__(SubtitleFormatter)
+    formatter.max_chars_per_line = 5
+    formatter.measurer = TextMeasurer(CellFont(10))
+    formatter.wrap_width_pixels = 100
+
+    pages = formatter._paginate_text("S&P500とNASDAQがそろって最高値を更新し、半導体株も大きく上昇しました。")
+
+    assert len(pages) > 1
+    for page in pages:
+        lines = formatter._wrap_text(page)
+        assert len(lines) <= 2
+        assert all(formatter.measurer.width(line) <= 100 for line in lines)
+
+
+def test_subtitle_lines_respect_the_character_cap_when_pixels_allow_more() -> None:
+    formatter = object.__new__(SubtitleFormatter)
+    formatter.max_chars_per_line = 5
+    formatter.measurer = TextMeasurer(CellFont(10))
+    formatter.wrap_width_pixels = 1000
+
+    assert formatter._wrap_text("あいうえおかきくけこさ") == ["あいうえお", "かきくけこ", "さ"]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import src.steps.video as video_module
+from src.providers.youtube import PublicationGateError, YouTubeClient
+from src.steps.video import VideoRenderer
+
+METADATA = {"title": "日銀の利上げを検証", "description": "検証ログ", "tags": ["finance"]}
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+class StubRequest:
+    def __init__(self, response: dict):
+        self.response = response
+
+    def execute(self) -> dict:
+        return self.response
+
+
+class StubResource:
+    def __init__(self, service: "StubService", name: str):
+        self.service = service
+        self.name = name
+
+    def __getattr__(self, method: str):
+        def call(**kwargs):
+            self.service.calls.append((self.name, method, kwargs))
+            if self.service.fail_captions and self.name == "captions":
+                raise RuntimeError("captions quota exceeded")
+            return StubRequest({"id": f"{self.name}-{len(self.service.calls)}"})
+
+        return call
+
+
+class StubService:
+    """Stands in for ``googleapiclient.discovery.build("youtube", "v3")``."""
+
+    def __init__(self, fail_captions: bool = False):
+        self.calls: list[tuple[str, str, dict]] = []
+        self.fail_captions = fail_captions
+
+    def __getattr__(self, name: str):
+        return lambda: StubResource(self, name)
+
+
+@pytest.fixture
+def approved(monkeypatch):
+    monkeypatch.setenv(YouTubeClient.EXTERNAL_APPROVAL_ENV, YouTubeClient.APPROVAL_VALUE)
+
+
+@pytest.fixture
+def media(tmp_path: Path) -> tuple[Path, Path]:
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"video")
+    captions = tmp_path / "subtitles.srt"
+    captions.write_text("1\n00:00:00,000 --> 00:00:01,000\n最初です。\n", encoding="utf-8")
+    return video, captions
+
+
+def test_captions_are_uploaded_after_insert(approved, media) -> None:
+    video, captions = media
+    service = StubService()
+    client = YouTubeClient(dry_run=False, upload_captions=True, service=service)
+
+    result = client.upload(video, METADATA, captions_path=captions)
+
+    assert [(name, method) for name, method, _ in service.calls] == [("videos", "insert"), ("captions", "insert")]
+    snippet = service.calls[1][2]["body"]["snippet"]
+    assert snippet == {"videoId": result["video_id"], "language": "ja", "name": "", "isDraft": False}
+    assert result["caption_id"] == "captions-2"
+    assert YouTubeClient.CAPTIONS_SCOPE in client.scopes
+
+
+def test_caption_fix_updates_existing_track(approved, media) -> None:
+    _, captions = media
+    service = StubService()
+    client = YouTubeClient(dry_run=False, upload_captions=True, service=service)
+
+    assert client.upload_caption("vid", captions, caption_id="cap-1") == "captions-1"
+    assert service.calls[0][1] == "update"
+    assert service.calls[0][2]["body"]["id"] == "cap-1"
+
+
+def test_caption_failure_keeps_the_upload_result(approved, media) -> None:
+    video, captions = media
+    client = YouTubeClient(dry_run=False, upload_captions=True, service=StubService(fail_captions=True))
+
+    result = client.upload(video, METADATA, captions_path=captions)
+
+    assert result["status"] == "uploaded"
+    assert result["caption_error"] == "captions quota exceeded"
+
+
+def test_captions_stay_gated_and_opt_in(monkeypatch, media) -> None:
+    video, captions = media
+    service = StubService()
+    monkeypatch.setenv(YouTubeClient.EXTERNAL_APPROVAL_ENV, YouTubeClient.APPROVAL_VALUE)
+    client = YouTubeClient(dry_run=False, service=service)
+
+    result = client.upload(video, METADATA, captions_path=captions)
+    assert [name for name, _, _ in service.calls] == ["videos"]
+    assert result["captions_path"] is None
+    assert client.scopes == YouTubeClient.SCOPES
+
+    monkeypatch.delenv(YouTubeClient.EXTERNAL_APPROVAL_ENV)
+    with pytest.raises(PublicationGateError):
+        client.upload_caption("vid", captions)
+
+
+@pytest.mark.parametrize("mode", ["soft", "none"])
+def test_renderer_skips_burn_in(tmp_path: Path, monkeypatch, mode: str) -> None:
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"")
+    subtitles = tmp_path / "subtitles.srt"
+    subtitles.write_text("", encoding="utf-8")
+    commands: list[list[str]] = []
+    monkeypatch.setattr(video_module, "get_audio_duration", lambda path: 3.0)
+    monkeypatch.setattr(video_module, "find_ffmpeg_binary", lambda: "ffmpeg")
+    monkeypatch.setattr(video_module.ffmpeg, "run", lambda output, **kwargs: commands.append(output.compile()))
+    renderer = VideoRenderer(run_id="run", run_dir=tmp_path, video_config={"subtitle_mode": mode})
+
+    renderer.execute({"synthesize_audio": audio, "prepare_subtitles": subtitles})
+
+    command = " ".join(commands[0])
+    assert "subtitles=" not in command
+    assert ("mov_text" in command) is (mode == "soft")
+    assert (f"-i {subtitles}" in command) is (mode == "soft")
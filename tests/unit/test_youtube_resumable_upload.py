@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+from src.providers.resumable_upload import CHUNK_ALIGNMENT, ResumableUpload, ResumableUploadError
+from src.providers.youtube import YouTubeClient
+
+METADATA = {"title": "日銀の利上げを検証", "description": "検証ログ", "tags": ["finance"]}
+FILE_SIZE = CHUNK_ALIGNMENT * 2 + 1000
+
+
+@pytest.fixture(autouse=True)
+def slow_down_tests():
+    """Override the repository-wide API delay for these pure contract tests."""
+    yield
+
+
+class ResumableStub(ThreadingHTTPServer):
+    """Minimal server side of Google's resumable upload protocol."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ResumableHandler)
+        self.sessions: dict[str, bytearray] = {}
+        self.totals: dict[str, int] = {}
+        self.requests: list[tuple[str, str, str]] = []
+        self.init_body: dict | None = None
+        self.fail_after: int | None = None
+        self.expired: set[str] = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class ResumableHandler(BaseHTTPRequestHandler):
+    server: ResumableStub
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _reply(self, status: int, headers: dict[str, str] | None = None, body: dict | None = None) -> None:
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self) -> None:
+        length = int(self.headers["Content-Length"])
+        self.server.init_body = json.loads(self.rfile.read(length))
+        self.server.requests.append(("POST", self.path, ""))
+        session = f"/session/{len(self.server.sessions) + 1}"
+        self.server.sessions[session] = bytearray()
+        declared = self.headers.get("X-Upload-Content-Length")
+        self.server.totals[session] = int(declared) if declared else None
+        self._reply(200, {"Location": f"{self.server.url}{session}"})
+
+    def do_PUT(self) -> None:
+        content_range = self.headers["Content-Range"]
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append(("PUT", self.path, content_range))
+        if self.path in self.server.expired or self.path not in self.server.sessions:
+            return self._reply(404)
+        received = self.server.sessions[self.path]
+        declared = content_range.rsplit("/", 1)[-1]
+        if declared != "*":
+            self.server.totals[self.path] = int(declared)
+        total = self.server.totals[self.path]
+        match = re.fullmatch(r"bytes (\d+)-(\d+)/(\d+|\*)", content_range)
+        if match:
+            if self.server.fail_after is not None and len(received) >= self.server.fail_after:
+                return self._reply(503)
+            start = int(match.group(1))
+            received[start:] = data
+        if len(received) == total:
+            return self._reply(200, body={"id": "vid-resumed"})
+        headers = {"Range": f"bytes=0-{len(received) - 1}"} if received else {}
+        return self._reply(308, headers)
+
+
+@pytest.fixture
+def stub():
+    server = ResumableStub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def video(tmp_path: Path) -> Path:
+    path = tmp_path / "video.mp4"
+    path.write_bytes(bytes(range(256)) * (FILE_SIZE // 256) + bytes(FILE_SIZE % 256))
+    return path
+
+
+def _client(monkeypatch, stub: ResumableStub, **kwargs) -> YouTubeClient:
+    monkeypatch.setenv(YouTubeClient.EXTERNAL_APPROVAL_ENV, YouTubeClient.APPROVAL_VALUE)
+    return YouTubeClient(
+        dry_run=False,
+        session=requests.Session(),
+        upload_url=f"{stub.url}/upload/youtube/v3/videos",
+        upload_chunk_size=CHUNK_ALIGNMENT,
+        upload_retry_backoff_seconds=0,
+        **kwargs,
+    )
+
+
+def test_upload_is_sent_in_chunks(monkeypatch, stub: ResumableStub, video: Path, tmp_path: Path) -> None:
+    session_path = tmp_path / "youtube_upload_session.json"
+
+    result = _client(monkeypatch, stub).upload(video, METADATA, session_path=session_path)
+
+    assert result["video_id"] == "vid-resumed"
+    assert [entry[2] for entry in stub.requests if entry[0] == "PUT"] == [
+        f"bytes 0-{CHUNK_ALIGNMENT - 1}/{FILE_SIZE}",
+        f"bytes {CHUNK_ALIGNMENT}-{2 * CHUNK_ALIGNMENT - 1}/{FILE_SIZE}",
+        f"bytes {2 * CHUNK_ALIGNMENT}-{FILE_SIZE - 1}/{FILE_SIZE}",
+    ]
+    assert stub.requests[0][1].startswith("/upload/youtube/v3/videos?uploadType=resumable&part=snippet%2Cstatus")
+    assert stub.init_body["snippet"]["title"] == METADATA["title"]
+    assert bytes(stub.sessions["/session/1"]) == video.read_bytes()
+    assert result["upload_mb_per_second"] > 0
+    assert not session_path.exists()
+
+
+def test_retried_step_continues_from_persisted_offset(
+    monkeypatch, stub: ResumableStub, video: Path, tmp_path: Path
+) -> None:
+    session_path = tmp_path / "youtube_upload_session.json"
+    stub.fail_after = CHUNK_ALIGNMENT
+    with pytest.raises(ResumableUploadError):
+        _client(monkeypatch, stub, upload_max_retries=1).upload(video, METADATA, session_path=session_path)
+    saved = json.loads(session_path.read_text(encoding="utf-8"))
+    assert saved["offset"] == CHUNK_ALIGNMENT and saved["session_uri"].endswith("/session/1")
+
+    stub.fail_after = None
+    stub.requests.clear()
+    result = _client(monkeypatch, stub).upload(video, METADATA, session_path=session_path)
+
+    assert result["resumed_from_bytes"] == CHUNK_ALIGNMENT
+    assert [entry[0] for entry in stub.requests] == ["PUT", "PUT", "PUT"]
+    assert stub.requests[0][2] == f"bytes */{FILE_SIZE}"
+    assert stub.requests[1][2].startswith(f"bytes {CHUNK_ALIGNMENT}-")
+    assert bytes(stub.sessions["/session/1"]) == video.read_bytes()
+
+
+def test_expired_session_starts_over(stub: ResumableStub, video: Path, tmp_path: Path) -> None:
+    session_path = tmp_path / "session.json"
+    uploader = ResumableUpload(requests.Session(), chunk_size=CHUNK_ALIGNMENT, state_path=session_path)
+    stub.fail_after = 0
+    with pytest.raises(ResumableUploadError):
+        ResumableUpload(requests.Session(), chunk_size=CHUNK_ALIGNMENT, state_path=session_path, max_retries=0).upload(
+            video, f"{stub.url}/upload", {}
+        )
+    stub.expired.add("/session/1")
+    stub.fail_after = None
+
+    assert uploader.upload(video, f"{stub.url}/upload", {}) == {"id": "vid-resumed"}
+    assert bytes(stub.sessions["/session/2"]) == video.read_bytes()
+    with pytest.raises(ValueError):
+        ResumableUpload(requests.Session(), chunk_size=1000)
+
+
+ENCODER = """
+import sys, time
+for index in range(3):
+    sys.stdout.buffer.write(bytes([index + 1]) * 300_000)
+    sys.stdout.buffer.flush()
+    time.sleep(0.2)
+sys.exit(int(sys.argv[1]))
+"""
+
+
+class NullTracker:
+    run_hash = None
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: None
+
+
+def _streaming_workflow(
+    monkeypatch, stub: ResumableStub, tmp_path: Path, exit_code: int = 0, publishers=(), **video_config
+):
+    import subprocess
+    import sys
+
+    import src.core.orchestrator as orchestrator_module
+    import src.steps.video as video_module
+    from src.core.orchestrator import WorkflowOrchestrator
+    from src.core.publish import PublishStage
+    from src.steps.video import VideoRenderer
+    from src.steps.youtube import YouTubeUploader
+
+    commands: list[list[str]] = []
+
+    def fake_run_async(output, **kwargs):
+        commands.append(output.compile())
+        return subprocess.Popen([sys.executable, "-c", ENCODER, str(exit_code)], stdout=subprocess.PIPE)
+
+    monkeypatch.setattr(video_module, "find_ffmpeg_binary", lambda: "ffmpeg")
+    monkeypatch.setattr(video_module, "get_audio_duration", lambda path: 3.0)
+    monkeypatch.setattr(video_module.ffmpeg, "run_async", fake_run_async)
+    monkeypatch.setattr(orchestrator_module.AimTracker, "get_instance", lambda run_id: NullTracker())
+    inputs = {"synthesize_audio": tmp_path / "audio.wav", "prepare_subtitles": tmp_path / "subtitles.srt"}
+    inputs["synthesize_audio"].write_bytes(b"")
+    inputs["prepare_subtitles"].write_text("", encoding="utf-8")
+    inputs["analyze_metadata"] = tmp_path / "metadata.json"
+    inputs["analyze_metadata"].write_text(json.dumps(METADATA), encoding="utf-8")
+    renderer = VideoRenderer(run_id="run", run_dir=tmp_path, video_config={"streaming_upload": True, **video_config})
+    uploader = YouTubeUploader(run_id="run", run_dir=tmp_path, youtube_config={"dry_run": True})
+    uploader.client = _client(monkeypatch, stub)
+    steps = [renderer, uploader]
+    if publishers:
+        steps = [renderer, PublishStage([uploader, *publishers], retry_backoff_seconds=0)]
+    orchestrator = WorkflowOrchestrator(run_id="run", steps=steps, run_dir=tmp_path)
+    orchestrator.state.outputs.update({key: str(path) for key, path in inputs.items()})
+    return orchestrator, commands
+
+
+def test_upload_overlaps_the_fragmented_encode(monkeypatch, stub: ResumableStub, tmp_path: Path) -> None:
+    orchestrator, commands = _streaming_workflow(monkeypatch, stub, tmp_path)
+
+    result = orchestrator.execute()
+
+    assert result.status == "success"
+    command = " ".join(commands[0])
+    assert "-movflags frag_keyframe+empty_moov+default_base_moof" in command and "pipe:" in command
+    final = tmp_path / "run" / "video.mp4"
+    assert result.outputs["render_video"] == str(final)
+    assert not (tmp_path / "run" / "video.part.mp4").exists()
+    assert bytes(stub.sessions["/session/1"]) == final.read_bytes()
+    assert len(final.read_bytes()) == 900_000
+    puts = [entry[2] for entry in stub.requests if entry[0] == "PUT"]
+    assert puts[0] == f"bytes 0-{CHUNK_ALIGNMENT - 1}/*"
+    assert puts[-1].endswith("/900000")
+    uploaded = json.loads((tmp_path / "run" / "youtube.json").read_text(encoding="utf-8"))
+    assert uploaded["video_id"] == "vid-resumed" and uploaded["file_size"] == 900_000
+    assert orchestrator.state.metrics["render_video"]["output_bytes"] == 900_000
+
+
+class RenderReader:
+    """Non-stream publisher that needs the settled render, like a social post attaching the video."""
+
+    name = "post_linkedin"
+    output_filename = "linkedin.json"
+    consumes_stream = False
+    depends_on = ()
+
+    def __init__(self, tmp_path: Path):
+        from src.core.step import Step
+
+        self.step = type(
+            "RenderReaderStep",
+            (Step,),
+            {"name": self.name, "output_filename": self.output_filename, "execute": self._execute},
+        )("run", tmp_path)
+        self.seen: dict[str, str] = {}
+
+    def _execute(self, inputs):
+        self.seen = {"video": inputs["render_video"], "size": Path(inputs["render_video"]).stat().st_size}
+        path = self.step.get_output_path()
+        path.write_text("{}", encoding="utf-8")
+        return path
+
+
+def test_concurrent_publisher_can_settle_the_render_while_the_upload_streams(
+    monkeypatch, stub: ResumableStub, tmp_path: Path
+) -> None:
+    reader = RenderReader(tmp_path)
+    orchestrator, _ = _streaming_workflow(monkeypatch, stub, tmp_path, publishers=[reader.step])
+
+    result = orchestrator.execute()
+
+    assert result.status == "success", result.errors
+    final = tmp_path / "run" / "video.mp4"
+    assert bytes(stub.sessions["/session/1"]) == final.read_bytes()
+    assert reader.seen == {"video": str(final), "size": 900_000}
+    assert orchestrator.state.metrics["upload_youtube"]["publish_attempts"] == 1
+    assert [entry[0] for entry in stub.requests].count("POST") == 1
+
+
+def test_failed_encode_fails_the_upload_and_keeps_render_pending(
+    monkeypatch, stub: ResumableStub, tmp_path: Path
+) -> None:
+    orchestrator, _ = _streaming_workflow(monkeypatch, stub, tmp_path, exit_code=1)
+
+    result = orchestrator.execute()
+
+    assert result.status == "failed"
+    assert "EncodeFailedError" in result.errors[0]
+    assert "render_video" not in orchestrator.state.completed_steps
+    assert "render_video" not in orchestrator.state.outputs
+    assert not (tmp_path / "run" / "video.mp4").exists()
+
+
+def test_incompatible_encoder_settings_fall_back_to_a_complete_file(tmp_path: Path) -> None:
+    from src.steps.video import VideoRenderer
+
+    renderer = VideoRenderer(
+        run_id="run",
+        run_dir=tmp_path,
+        video_config={"streaming_upload": True, "encoder_options": {"movflags": "+faststart"}},
+    )
+
+    assert renderer._streaming_blocker(dict(renderer.encoder_options)) is not None
+    assert renderer._streaming_blocker({"vcodec": "libx264"}) is None
+    assert not renderer.in_progress()
+
+
+def test_stream_reads_survive_the_part_file_being_moved(tmp_path: Path) -> None:
+    import subprocess
+    import sys
+
+    from src.core.streaming import FragmentedEncode
+
+    process = subprocess.Popen([sys.executable, "-c", ENCODER, "0"], stdout=subprocess.PIPE)
+    encode = FragmentedEncode(process, tmp_path / "video.part.mp4")
+
+    head = encode.read(0, 1000)
+    encode.wait()
+    encode.path.replace(tmp_path / "video.mp4")
+
+    assert head == b"\x01" * 1000
+    assert encode.read(899_000, 1000) == b"\x03" * 1000
+    assert encode.total == 900_000
+    encode.close()